@@ -1,4 +1,12 @@
-__all__ = ["PapersWithCodeClient", "version", "__version__"]
+__all__ = [
+    "PapersWithCodeClient",
+    "AsyncPapersWithCodeClient",
+    "RateLimiter",
+    "version",
+    "__version__",
+]
 
 from paperswithcode.client import PapersWithCodeClient
+from paperswithcode.client_async import AsyncPapersWithCodeClient
+from paperswithcode.ratelimit import RateLimiter
 from paperswithcode.version import version, __version__
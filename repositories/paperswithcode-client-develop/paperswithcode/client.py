@@ -1,20 +1,26 @@
+import math
 import logging
 import functools
 from urllib import parse
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
 
 from paperswithcode.config import config
 from paperswithcode.http import HttpClient
+from paperswithcode.ratelimit import RateLimiter
 from paperswithcode.errors import (
     HttpClientError,
     PydanticValidationError,
     ValidationError,
 )
 from paperswithcode.models import (
+    Page,
     Paper,
     Papers,
     Repository,
     Repositories,
+    PaperRepo,
     PaperRepos,
     Author,
     Authors,
@@ -50,7 +56,6 @@ from paperswithcode.models import (
     EvaluationTableSyncResponse,
 )
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -75,26 +80,18 @@ def handler(func):
     return wrapper
 
 
-class PapersWithCodeClient:
-    """PapersWithCode client."""
-
-    def __init__(self, token=None, url=None):
-        url = url or config.server_url
-        self.http = HttpClient(
-            url=f"{url}/api/v{config.api_version}",
-            token=token or "",
-            authorization_method=HttpClient.Authorization.token,
-        )
+class BaseClient:
+    """Paging helpers shared by the synchronous and asynchronous clients."""
 
     @staticmethod
-    def __params(page: int, items_per_page: int, **kwargs) -> dict[str, str]:
+    def _params(page: int, items_per_page: int, **kwargs) -> dict[str, str]:
         params = {key: str(value) for key, value in kwargs.items()}
         params["page"] = str(page)
         params["items_per_page"] = str(items_per_page)
         return params
 
     @staticmethod
-    def __parse(url: str) -> int:
+    def _parse_page(url: str) -> int:
         """Return page number."""
         p = parse.urlparse(url)
         if p.query == "":
@@ -104,13 +101,13 @@ class PapersWithCodeClient:
             return int(q.get("page", [1])[0])
 
     @classmethod
-    def __page(cls, result, page_model):
+    def _page(cls, result, page_model):
         next_page = result["next"]
         if next_page is not None:
-            next_page = cls.__parse(next_page)
+            next_page = cls._parse_page(next_page)
         previous_page = result["previous"]
         if previous_page is not None:
-            previous_page = cls.__parse(previous_page)
+            previous_page = cls._parse_page(previous_page)
         return page_model(
             count=result["count"],
             next_page=next_page,
@@ -118,6 +115,78 @@ class PapersWithCodeClient:
             results=result["results"],
         )
 
+    @staticmethod
+    def _last_page(first: Page, items_per_page: int) -> int:
+        """Return the number of the last page from the count on the first one."""
+        return max(1, math.ceil(first.count / items_per_page))
+
+
+class PapersWithCodeClient(BaseClient):
+    """PapersWithCode client.
+
+    The client keeps a pool of open connections to the server. Close it with
+    ``close`` when done, or use it as a context manager::
+
+        with PapersWithCodeClient() as client:
+            papers = client.paper_list()
+
+    Args:
+        token: API token, required for write operations.
+        url: Server url, defaults to the configured ``server_url``.
+        timeout: Request timeout in seconds.
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept
+            open.
+        keepalive_expiry: Seconds after which idle connections are closed.
+        http2: Use HTTP/2, requires ``pip install httpx[http2]``.
+        max_retries: Number of retries of rate limited or failed requests.
+        backoff_factor: Base of the exponential backoff between retries.
+        rate_limiter: ``RateLimiter`` shared with other clients, by default
+            each client learns the server's rate limit on its own.
+        transport: httpx transport used instead of the network, e.g.
+            ``httpx.MockTransport`` in tests.
+    """
+
+    def __init__(
+        self,
+        token=None,
+        url=None,
+        timeout: int = 10,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport=None,
+    ):
+        url = url or config.server_url
+        self.http = HttpClient(
+            url=f"{url}/api/v{config.api_version}",
+            token=token or "",
+            authorization_method=HttpClient.Authorization.token,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            rate_limiter=rate_limiter,
+            transport=transport,
+        )
+
+    def close(self):
+        """Close the open connections to the server."""
+        self.http.close()
+
+    def __enter__(self) -> "PapersWithCodeClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     @handler
     def search(
         self,
@@ -135,11 +204,11 @@ class PapersWithCodeClient:
         Returns:
             PaperRepos object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
         timeout = None
         if q is not None:
             params["q"] = q
-        return self.__page(
+        return self._page(
             self.http.get("/search/", params=params, timeout=timeout),
             PaperRepos,
         )
@@ -169,7 +238,7 @@ class PapersWithCodeClient:
         Returns:
             Papers object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
         timeout = None
         if q is not None:
             params["q"] = q
@@ -183,7 +252,7 @@ class PapersWithCodeClient:
             timeout = 60
         if ordering is not None:
             params["ordering"] = ordering
-        return self.__page(
+        return self._page(
             self.http.get("/papers/", params=params, timeout=timeout), Papers
         )
 
@@ -216,8 +285,8 @@ class PapersWithCodeClient:
         Returns:
             Datasets object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/papers/{paper_id}/datasets/", params=params),
             Datasets,
         )
@@ -239,8 +308,8 @@ class PapersWithCodeClient:
         Returns:
             Repositories object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/papers/{paper_id}/repositories/", params=params),
             Repositories,
         )
@@ -262,8 +331,8 @@ class PapersWithCodeClient:
         Returns:
             Tasks object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/papers/{paper_id}/tasks/", params=params), Tasks
         )
 
@@ -284,8 +353,8 @@ class PapersWithCodeClient:
         Returns:
             Methods object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/papers/{paper_id}/methods/", params=params),
             Methods,
         )
@@ -307,8 +376,8 @@ class PapersWithCodeClient:
         Returns:
             Results object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/papers/{paper_id}/results/", params=params),
             Results,
         )
@@ -341,7 +410,7 @@ class PapersWithCodeClient:
         Returns:
             Repositories object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
 
         if q is not None:
             params["q"] = q
@@ -355,7 +424,7 @@ class PapersWithCodeClient:
             params["framework"] = framework
         if ordering is not None:
             params["ordering"] = ordering
-        return self.__page(
+        return self._page(
             self.http.get("/repositories/", params=params),
             Repositories,
         )
@@ -370,7 +439,7 @@ class PapersWithCodeClient:
         Returns:
             Repositories object.
         """
-        return self.__page(
+        return self._page(
             self.http.get(f"/repositories/{owner}"),
             Repositories,
         )
@@ -407,8 +476,8 @@ class PapersWithCodeClient:
         Returns:
             Papers object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/repositories/{owner}/{name}/papers/", params=params),
             Papers,
         )
@@ -434,7 +503,7 @@ class PapersWithCodeClient:
         Returns:
             Repositories object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
 
         if q is not None:
             params["q"] = q
@@ -442,7 +511,7 @@ class PapersWithCodeClient:
             params["full_name"] = full_name
         if ordering is not None:
             params["ordering"] = ordering
-        return self.__page(self.http.get("/authors/", params=params), Authors)
+        return self._page(self.http.get("/authors/", params=params), Authors)
 
     @handler
     def author_get(self, author_id: str) -> Author:
@@ -473,8 +542,8 @@ class PapersWithCodeClient:
         Returns:
             Papers object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/authors/{author_id}/papers/", params=params),
             Papers,
         )
@@ -500,14 +569,14 @@ class PapersWithCodeClient:
         Returns:
             Conferences object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
         if q is not None:
             params["q"] = q
         if name is not None:
             params["name"] = name
         if ordering is not None:
             params["ordering"] = ordering
-        return self.__page(self.http.get("/conferences/", params=params), Conferences)
+        return self._page(self.http.get("/conferences/", params=params), Conferences)
 
     @handler
     def conference_get(self, conference_id: str) -> Conference:
@@ -538,10 +607,10 @@ class PapersWithCodeClient:
         Returns:
             Proceedings object.
         """
-        return self.__page(
+        return self._page(
             self.http.get(
                 f"/conferences/{conference_id}/proceedings/",
-                params=self.__params(page, items_per_page),
+                params=self._params(page, items_per_page),
             ),
             Proceedings,
         )
@@ -582,8 +651,8 @@ class PapersWithCodeClient:
         Returns:
             Papers object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(
                 f"/conferences/{conference_id}/proceedings/{proceeding_id}/papers/",
                 params=params,
@@ -612,7 +681,7 @@ class PapersWithCodeClient:
         Returns:
             Areas object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
         timeout = None
         if q is not None:
             params["q"] = q
@@ -621,7 +690,7 @@ class PapersWithCodeClient:
             params["name"] = name
         if ordering is not None:
             params["ordering"] = ordering
-        return self.__page(
+        return self._page(
             self.http.get("/areas/", params=params, timeout=timeout), Areas
         )
 
@@ -654,8 +723,8 @@ class PapersWithCodeClient:
         Returns:
             Tasks object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/areas/{area_id}/tasks/", params=params), Tasks
         )
 
@@ -680,7 +749,7 @@ class PapersWithCodeClient:
         Returns:
             Tasks object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
         timeout = None
         if q is not None:
             params["q"] = q
@@ -689,7 +758,7 @@ class PapersWithCodeClient:
             params["name"] = name
         if ordering is not None:
             params["ordering"] = ordering
-        return self.__page(
+        return self._page(
             self.http.get("/tasks/", params=params, timeout=timeout), Tasks
         )
 
@@ -756,8 +825,8 @@ class PapersWithCodeClient:
         Returns:
             Tasks object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/tasks/{task_id}/parents/", params=params), Tasks
         )
 
@@ -778,8 +847,8 @@ class PapersWithCodeClient:
         Returns:
             Tasks object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/tasks/{task_id}/children/", params=params), Tasks
         )
 
@@ -800,8 +869,8 @@ class PapersWithCodeClient:
         Returns:
             Papers object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/tasks/{task_id}/papers/", params=params), Papers
         )
 
@@ -822,8 +891,8 @@ class PapersWithCodeClient:
         Returns:
             EvaluationTables object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/tasks/{task_id}/evaluations/", params=params),
             EvaluationTables,
         )
@@ -851,7 +920,7 @@ class PapersWithCodeClient:
         Returns:
             Datasets object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
         timeout = None
         if q is not None:
             params["q"] = q
@@ -862,7 +931,7 @@ class PapersWithCodeClient:
             params["full_name"] = full_name
         if ordering is not None:
             params["ordering"] = ordering
-        return self.__page(
+        return self._page(
             self.http.get("/datasets/", params=params, timeout=timeout),
             Datasets,
         )
@@ -930,8 +999,8 @@ class PapersWithCodeClient:
         Returns:
            EvaluationTables object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/datasets/{dataset_id}/evaluations/", params=params),
             EvaluationTables,
         )
@@ -959,7 +1028,7 @@ class PapersWithCodeClient:
         Returns:
             Methods object.
         """
-        params = self.__params(page, items_per_page)
+        params = self._params(page, items_per_page)
         timeout = None
         if q is not None:
             params["q"] = q
@@ -970,7 +1039,7 @@ class PapersWithCodeClient:
             params["full_name"] = full_name
         if ordering is not None:
             params["ordering"] = ordering
-        return self.__page(
+        return self._page(
             self.http.get("/methods/", params=params, timeout=timeout),
             Methods,
         )
@@ -1002,8 +1071,8 @@ class PapersWithCodeClient:
         Returns:
             Evaluation table page object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get("/evaluations/", params=params), EvaluationTables
         )
 
@@ -1079,8 +1148,8 @@ class PapersWithCodeClient:
         Returns:
             Metrics object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/evaluations/{evaluation_id}/metrics/", params=params),
             Metrics,
         )
@@ -1170,8 +1239,8 @@ class PapersWithCodeClient:
         Returns:
             Results object.
         """
-        params = self.__params(page, items_per_page)
-        return self.__page(
+        params = self._params(page, items_per_page)
+        return self._page(
             self.http.get(f"/evaluations/{evaluation_id}/results/", params=params),
             Results,
         )
@@ -1252,3 +1321,299 @@ class PapersWithCodeClient:
         d = self.http.post("/rpc/evaluation-synchronize/", data=evaluation)
         d["results"] = [result for result in d["results"]]
         return EvaluationTableSyncResponse(**d)
+
+    def iter_pages(
+        self,
+        list_method: Callable[..., Page],
+        *args,
+        items_per_page: int = 50,
+        prefetch: int = 4,
+        **kwargs,
+    ) -> Iterator:
+        """Iterate over the items of all pages of a paginated listing.
+
+        The first page is fetched to learn the total ``count``, then the next
+        ``prefetch`` pages are fetched concurrently in threads while the items
+        of the current page are consumed, so at most ``prefetch`` pages are
+        held in memory.
+
+        Iteration ends at the first page without a next page. If items are
+        added while iterating, the pages past the initial ``count`` are
+        fetched as well. If items are removed, pages past the new end are not
+        found (404) and end the iteration. Pages are not a snapshot: items
+        can be skipped or repeated when the listing changes meanwhile.
+
+        Args:
+            list_method: Paginated list method of the client, e.g.
+                ``paper_list``.
+            args: Positional arguments of the list method.
+            items_per_page: Desired number of items per page.
+            prefetch: Number of pages fetched ahead, at least one.
+            kwargs: Keyword arguments (filters) of the list method.
+
+        Yields:
+            Items of all pages, in order.
+        """
+
+        def fetch(page: int) -> Page:
+            return list_method(
+                *args, page=page, items_per_page=items_per_page, **kwargs
+            )
+
+        first = fetch(1)
+        yield from first.results
+        if first.next_page is None:
+            return
+
+        last = self._last_page(first, items_per_page)
+        window = max(prefetch, 1)
+        executor = ThreadPoolExecutor(max_workers=window)
+        pending = deque()
+        next_page = 2
+        try:
+            while True:
+                while next_page <= last and len(pending) < window:
+                    pending.append(executor.submit(fetch, next_page))
+                    next_page += 1
+                if not pending:
+                    return
+                try:
+                    page = pending.popleft().result()
+                except HttpClientError as e:
+                    if e.status_code == 404:
+                        # Items were removed, the listing now ends earlier.
+                        return
+                    raise
+                yield from page.results
+                if page.next_page is None:
+                    return
+                # Items were added since the first page was fetched.
+                last = max(last, page.next_page)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_search(self, **kwargs) -> Iterator[PaperRepo]:
+        """Iterate over all search results.
+
+        See ``search`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.search, **kwargs)
+
+    def iter_papers(self, **kwargs) -> Iterator[Paper]:
+        """Iterate over all papers.
+
+        See ``paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_list, **kwargs)
+
+    def iter_paper_datasets(self, paper_id: str, **kwargs) -> Iterator[Dataset]:
+        """Iterate over all datasets mentioned in the paper.
+
+        See ``paper_dataset_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_dataset_list, paper_id, **kwargs)
+
+    def iter_paper_repositories(self, paper_id: str, **kwargs) -> Iterator[Repository]:
+        """Iterate over all paper implementations.
+
+        See ``paper_repository_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_repository_list, paper_id, **kwargs)
+
+    def iter_paper_tasks(self, paper_id: str, **kwargs) -> Iterator[Task]:
+        """Iterate over all tasks mentioned in the paper.
+
+        See ``paper_task_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_task_list, paper_id, **kwargs)
+
+    def iter_paper_methods(self, paper_id: str, **kwargs) -> Iterator[Method]:
+        """Iterate over all methods mentioned in the paper.
+
+        See ``paper_method_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_method_list, paper_id, **kwargs)
+
+    def iter_paper_results(self, paper_id: str, **kwargs) -> Iterator[Result]:
+        """Iterate over all evaluation results for the paper.
+
+        See ``paper_result_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_result_list, paper_id, **kwargs)
+
+    def iter_repositories(self, **kwargs) -> Iterator[Repository]:
+        """Iterate over all repositories.
+
+        See ``repository_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.repository_list, **kwargs)
+
+    def iter_repository_papers(
+        self, owner: str, name: str, **kwargs
+    ) -> Iterator[Paper]:
+        """Iterate over all papers connected to the repository.
+
+        See ``repository_paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.repository_paper_list, owner, name, **kwargs)
+
+    def iter_authors(self, **kwargs) -> Iterator[Author]:
+        """Iterate over all paper authors.
+
+        See ``author_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.author_list, **kwargs)
+
+    def iter_author_papers(self, author_id: str, **kwargs) -> Iterator[Paper]:
+        """Iterate over all papers connected to the author.
+
+        See ``author_paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.author_paper_list, author_id, **kwargs)
+
+    def iter_conferences(self, **kwargs) -> Iterator[Conference]:
+        """Iterate over all conferences.
+
+        See ``conference_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.conference_list, **kwargs)
+
+    def iter_proceedings(self, conference_id: str, **kwargs) -> Iterator[Proceeding]:
+        """Iterate over all proceedings of the conference.
+
+        See ``proceeding_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.proceeding_list, conference_id, **kwargs)
+
+    def iter_proceeding_papers(
+        self, conference_id: str, proceeding_id: str, **kwargs
+    ) -> Iterator[Paper]:
+        """Iterate over all papers published in a conference proceeding.
+
+        See ``proceeding_paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(
+            self.proceeding_paper_list, conference_id, proceeding_id, **kwargs
+        )
+
+    def iter_areas(self, **kwargs) -> Iterator[Area]:
+        """Iterate over all areas.
+
+        See ``area_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.area_list, **kwargs)
+
+    def iter_area_tasks(self, area_id: str, **kwargs) -> Iterator[Task]:
+        """Iterate over all tasks in an area.
+
+        See ``area_task_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.area_task_list, area_id, **kwargs)
+
+    def iter_tasks(self, **kwargs) -> Iterator[Task]:
+        """Iterate over all tasks.
+
+        See ``task_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_list, **kwargs)
+
+    def iter_task_parents(self, task_id: str, **kwargs) -> Iterator[Task]:
+        """Iterate over all parent tasks of a task.
+
+        See ``task_parent_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_parent_list, task_id, **kwargs)
+
+    def iter_task_children(self, task_id: str, **kwargs) -> Iterator[Task]:
+        """Iterate over all child tasks of a task.
+
+        See ``task_child_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_child_list, task_id, **kwargs)
+
+    def iter_task_papers(self, task_id: str, **kwargs) -> Iterator[Paper]:
+        """Iterate over all papers for a task.
+
+        See ``task_paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_paper_list, task_id, **kwargs)
+
+    def iter_task_evaluations(
+        self, task_id: str, **kwargs
+    ) -> Iterator[EvaluationTable]:
+        """Iterate over all evaluation tables for a task.
+
+        See ``task_evaluation_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_evaluation_list, task_id, **kwargs)
+
+    def iter_datasets(self, **kwargs) -> Iterator[Dataset]:
+        """Iterate over all datasets.
+
+        See ``dataset_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.dataset_list, **kwargs)
+
+    def iter_dataset_evaluations(
+        self, dataset_id: str, **kwargs
+    ) -> Iterator[EvaluationTable]:
+        """Iterate over all evaluation tables for a dataset.
+
+        See ``dataset_evaluation_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.dataset_evaluation_list, dataset_id, **kwargs)
+
+    def iter_methods(self, **kwargs) -> Iterator[Method]:
+        """Iterate over all methods.
+
+        See ``method_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.method_list, **kwargs)
+
+    def iter_evaluations(self, **kwargs) -> Iterator[EvaluationTable]:
+        """Iterate over all evaluation tables.
+
+        See ``evaluation_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.evaluation_list, **kwargs)
+
+    def iter_evaluation_metrics(self, evaluation_id: str, **kwargs) -> Iterator[Metric]:
+        """Iterate over all metrics used in the evaluation table.
+
+        See ``evaluation_metric_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.evaluation_metric_list, evaluation_id, **kwargs)
+
+    def iter_evaluation_results(self, evaluation_id: str, **kwargs) -> Iterator[Result]:
+        """Iterate over all results from the evaluation table.
+
+        See ``evaluation_result_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.evaluation_result_list, evaluation_id, **kwargs)
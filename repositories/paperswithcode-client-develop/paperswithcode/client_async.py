@@ -0,0 +1,1609 @@
+import asyncio
+import logging
+import functools
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from paperswithcode.config import config
+from paperswithcode.client import BaseClient
+from paperswithcode.http import AsyncHttpClient
+from paperswithcode.ratelimit import RateLimiter
+from paperswithcode.errors import (
+    HttpClientError,
+    PydanticValidationError,
+    ValidationError,
+)
+from paperswithcode.models import (
+    Page,
+    Paper,
+    Papers,
+    Repository,
+    Repositories,
+    PaperRepo,
+    PaperRepos,
+    Author,
+    Authors,
+    Conference,
+    Conferences,
+    Proceeding,
+    Proceedings,
+    Area,
+    Areas,
+    Task,
+    TaskCreateRequest,
+    TaskUpdateRequest,
+    Tasks,
+    Dataset,
+    DatasetCreateRequest,
+    DatasetUpdateRequest,
+    Datasets,
+    Method,
+    Methods,
+    Metric,
+    Metrics,
+    MetricCreateRequest,
+    MetricUpdateRequest,
+    Result,
+    Results,
+    ResultCreateRequest,
+    ResultUpdateRequest,
+    EvaluationTable,
+    EvaluationTables,
+    EvaluationTableCreateRequest,
+    EvaluationTableUpdateRequest,
+    EvaluationTableSyncRequest,
+    EvaluationTableSyncResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def async_handler(func):
+    """Asynchronous version of ``paperswithcode.client.handler``."""
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await func(self, *args, **kwargs)
+        except HttpClientError as e:
+            if e.status_code == 401:
+                # Try to refresh the token and call the function again.
+                if self.http.authorization_method == self.http.Authorization.jwt:
+                    try:
+                        await self.refresh()
+                        return await func(self, *args, **kwargs)
+                    except Exception as e:
+                        logger.warning("Failed to refresh token: %s", e)
+            raise
+        except PydanticValidationError as e:
+            raise ValidationError(error=e)
+
+    return wrapper
+
+
+class AsyncPapersWithCodeClient(BaseClient):
+    """Asynchronous PapersWithCode client.
+
+    Has the same methods, arguments and return models as
+    ``PapersWithCodeClient``, but every method is a coroutine. All requests
+    share one pool of connections and at most ``max_concurrency`` of them are
+    sent at once, so many requests can be issued concurrently::
+
+        async with AsyncPapersWithCodeClient(max_concurrency=20) as client:
+            papers = await asyncio.gather(
+                *(client.paper_get(paper_id) for paper_id in paper_ids)
+            )
+
+    Args:
+        token: API token, required for write operations.
+        url: Server url, defaults to the configured ``server_url``.
+        timeout: Request timeout in seconds.
+        max_concurrency: Maximum number of requests in flight at once.
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept
+            open.
+        keepalive_expiry: Seconds after which idle connections are closed.
+        http2: Use HTTP/2, requires ``pip install httpx[http2]``.
+        max_retries: Number of retries of rate limited or failed requests.
+        backoff_factor: Base of the exponential backoff between retries.
+        rate_limiter: ``RateLimiter`` shared with other clients, by default
+            each client learns the server's rate limit on its own.
+        transport: httpx transport used instead of the network, e.g.
+            ``httpx.MockTransport`` in tests.
+    """
+
+    def __init__(
+        self,
+        token=None,
+        url=None,
+        timeout: int = 10,
+        max_concurrency: int = 10,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport=None,
+    ):
+        url = url or config.server_url
+        self.http = AsyncHttpClient(
+            url=f"{url}/api/v{config.api_version}",
+            token=token or "",
+            authorization_method=AsyncHttpClient.Authorization.token,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            rate_limiter=rate_limiter,
+            transport=transport,
+        )
+
+    async def close(self):
+        """Close the open connections to the server."""
+        await self.http.close()
+
+    async def __aenter__(self) -> "AsyncPapersWithCodeClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @async_handler
+    async def search(
+        self,
+        q: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> PaperRepos:
+        """Search in a similar fashion to the frontpage search.
+
+        Args:
+            q: Filter papers by querying the paper title and abstract.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            PaperRepos object.
+        """
+        params = self._params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+        return self._page(
+            await self.http.get("/search/", params=params, timeout=timeout),
+            PaperRepos,
+        )
+
+    @async_handler
+    async def paper_list(
+        self,
+        q: Optional[str] = None,
+        arxiv_id: Optional[str] = None,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        ordering: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """Return a paginated list of papers.
+
+        Args:
+            q: Filter papers by querying the paper title and abstract.
+            arxiv_id: Filter papers by arxiv id.
+            title: Filter papers by part of the title.
+            abstract: Filter papers by part of the abstract.
+            ordering: Which field to use when ordering the results.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Papers object.
+        """
+        params = self._params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if arxiv_id is not None:
+            params["arxiv_id"] = arxiv_id
+        if title is not None:
+            params["title"] = title
+        if abstract is not None:
+            params["abstract"] = abstract
+            timeout = 60
+        if ordering is not None:
+            params["ordering"] = ordering
+        return self._page(
+            await self.http.get("/papers/", params=params, timeout=timeout), Papers
+        )
+
+    @async_handler
+    async def paper_get(self, paper_id: str) -> Paper:
+        """Return a paper by it's ID.
+
+        Args:
+            paper_id: ID of the paper.
+
+        Returns:
+            Paper object.
+        """
+        return Paper(**await self.http.get(f"/papers/{paper_id}/"))
+
+    @async_handler
+    async def paper_dataset_list(
+        self,
+        paper_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Repositories:
+        """Return a list of datasets mentioned in the paper..
+
+        Args:
+            paper_id: ID of the paper.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Datasets object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/papers/{paper_id}/datasets/", params=params),
+            Datasets,
+        )
+
+    @async_handler
+    async def paper_repository_list(
+        self,
+        paper_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Repositories:
+        """Return a list of paper implementations.
+
+        Args:
+            paper_id: ID of the paper.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Repositories object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/papers/{paper_id}/repositories/", params=params),
+            Repositories,
+        )
+
+    @async_handler
+    async def paper_task_list(
+        self,
+        paper_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Tasks:
+        """Return a list of tasks mentioned in the paper.
+
+        Args:
+            paper_id: ID of the paper.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Tasks object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/papers/{paper_id}/tasks/", params=params), Tasks
+        )
+
+    @async_handler
+    async def paper_method_list(
+        self,
+        paper_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Methods:
+        """Return a list of methods mentioned in the paper.
+
+        Args:
+            paper_id: ID of the paper.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Methods object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/papers/{paper_id}/methods/", params=params),
+            Methods,
+        )
+
+    @async_handler
+    async def paper_result_list(
+        self,
+        paper_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Results:
+        """Return a list of evaluation results for the paper.
+
+        Args:
+            paper_id: ID of the paper.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Results object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/papers/{paper_id}/results/", params=params),
+            Results,
+        )
+
+    @async_handler
+    async def repository_list(
+        self,
+        q: Optional[str] = None,
+        owner: Optional[str] = None,
+        name: Optional[str] = None,
+        stars: Optional[int] = None,
+        framework: Optional[str] = None,
+        ordering: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """Return a paginated list of repositories.
+
+        Args:
+            q: Search all searchable fields.
+            owner: Filter repositories by owner.
+            name: Filter repositories by name.
+            stars: Filter repositories by minimum number of stars.
+            framework: Filter repositories by framework. Available values:
+                tf, pytorch, mxnet, torch, caffe2, jax, paddle, mindspore.
+            ordering: Which field to use when ordering the results.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Repositories object.
+        """
+        params = self._params(page, items_per_page)
+
+        if q is not None:
+            params["q"] = q
+        if owner is not None:
+            params["owner"] = owner
+        if name is not None:
+            params["name"] = name
+        if stars is not None:
+            params["stars"] = str(stars)
+        if framework is not None:
+            params["framework"] = framework
+        if ordering is not None:
+            params["ordering"] = ordering
+        return self._page(
+            await self.http.get("/repositories/", params=params),
+            Repositories,
+        )
+
+    @async_handler
+    async def repository_owner_list(self, owner: str) -> Repositories:
+        """List all repositories for a specific repo owner.
+
+        Args:
+            owner: Repository owner.
+
+        Returns:
+            Repositories object.
+        """
+        return self._page(
+            await self.http.get(f"/repositories/{owner}"),
+            Repositories,
+        )
+
+    @async_handler
+    async def repository_get(self, owner: str, name: str) -> Repository:
+        """Return a repository by it's owner/name pair.
+
+        Args:
+            owner: Owner name.
+            name: Repository name.
+
+        Returns:
+            Repository object.
+        """
+        return Repository(**await self.http.get(f"/repositories/{owner}/{name}/"))
+
+    @async_handler
+    async def repository_paper_list(
+        self,
+        owner: str,
+        name: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """List all papers connected to the repository.
+
+        Args:
+            owner: Owner name.
+            name: Repository name.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Papers object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/repositories/{owner}/{name}/papers/", params=params),
+            Papers,
+        )
+
+    @async_handler
+    async def author_list(
+        self,
+        q: Optional[str] = None,
+        full_name: Optional[str] = None,
+        ordering: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Authors:
+        """Return a paginated list of paper authors.
+
+        Args:
+            q: Search all searchable fields.
+            full_name: Filter authors by part of their full name.
+            ordering: Which field to use when ordering the results.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Repositories object.
+        """
+        params = self._params(page, items_per_page)
+
+        if q is not None:
+            params["q"] = q
+        if full_name is not None:
+            params["full_name"] = full_name
+        if ordering is not None:
+            params["ordering"] = ordering
+        return self._page(await self.http.get("/authors/", params=params), Authors)
+
+    @async_handler
+    async def author_get(self, author_id: str) -> Author:
+        """Return a specific author selected by its id.
+
+        Args:
+            author_id: Author id.
+
+        Returns:
+            Author object.
+        """
+        return Author(**await self.http.get(f"/authors/{author_id}/"))
+
+    @async_handler
+    async def author_paper_list(
+        self,
+        author_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """List all papers connected to the author.
+
+        Args:
+            author_id: Author id.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Papers object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/authors/{author_id}/papers/", params=params),
+            Papers,
+        )
+
+    @async_handler
+    async def conference_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        ordering: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Conferences:
+        """Return a paginated list of conferences.
+
+        Args:
+            q: Search all searchable fields.
+            name: Filter conferences by part of the name.
+            ordering: Which field to use when ordering the results.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Conferences object.
+        """
+        params = self._params(page, items_per_page)
+        if q is not None:
+            params["q"] = q
+        if name is not None:
+            params["name"] = name
+        if ordering is not None:
+            params["ordering"] = ordering
+        return self._page(
+            await self.http.get("/conferences/", params=params), Conferences
+        )
+
+    @async_handler
+    async def conference_get(self, conference_id: str) -> Conference:
+        """Return a conference by it's ID.
+
+        Args:
+            conference_id: ID of the conference.
+
+        Returns:
+            Conference object.
+        """
+        return Conference(**await self.http.get(f"/conferences/{conference_id}/"))
+
+    @async_handler
+    async def proceeding_list(
+        self,
+        conference_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Proceedings:
+        """Return a paginated list of conference proceedings.
+
+        Args:
+            conference_id: ID of the conference.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Proceedings object.
+        """
+        return self._page(
+            await self.http.get(
+                f"/conferences/{conference_id}/proceedings/",
+                params=self._params(page, items_per_page),
+            ),
+            Proceedings,
+        )
+
+    @async_handler
+    async def proceeding_get(
+        self, conference_id: str, proceeding_id: str
+    ) -> Proceeding:
+        """Return a conference proceeding by it's ID.
+
+        Args:
+            conference_id: ID of the conference.
+            proceeding_id: ID of the proceeding.
+
+        Returns:
+            Proceeding object.
+        """
+        return Proceeding(
+            **await self.http.get(
+                f"/conferences/{conference_id}/proceedings/{proceeding_id}/"
+            )
+        )
+
+    @async_handler
+    async def proceeding_paper_list(
+        self,
+        conference_id: str,
+        proceeding_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """Return a list of papers published in a confernce proceeding.
+
+        Args:
+            conference_id: ID of the conference.
+            proceeding_id: ID of the proceding.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Papers object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(
+                f"/conferences/{conference_id}/proceedings/{proceeding_id}/papers/",
+                params=params,
+            ),
+            Papers,
+        )
+
+    @async_handler
+    async def area_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        ordering: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Areas:
+        """Return a paginated list of areas.
+
+        Args:
+            q: Filter areas by querying the area name.
+            name: Filter areas by part of the name.
+            ordering: Which field to use when ordering the results.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Areas object.
+        """
+        params = self._params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if name is not None:
+            params["name"] = name
+        if ordering is not None:
+            params["ordering"] = ordering
+        return self._page(
+            await self.http.get("/areas/", params=params, timeout=timeout), Areas
+        )
+
+    @async_handler
+    async def area_get(self, area_id: str) -> Area:
+        """Return an area by it's ID.
+
+        Args:
+            area_id: ID of the area.
+
+        Returns:
+            Area object.
+        """
+        return Area(**await self.http.get(f"/areas/{area_id}/"))
+
+    @async_handler
+    async def area_task_list(
+        self,
+        area_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Tasks:
+        """Return a paginated list of tasks in an area.
+
+        Args:
+            area_id: ID of the area.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Tasks object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/areas/{area_id}/tasks/", params=params), Tasks
+        )
+
+    @async_handler
+    async def task_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        ordering: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Tasks:
+        """Return a paginated list of tasks.
+
+        Args:
+            q: Filter tasks by querying the task name.
+            name: Filter tasks by part of th name.
+            ordering: Which field to use when ordering the results.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Tasks object.
+        """
+        params = self._params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if name is not None:
+            params["name"] = name
+        if ordering is not None:
+            params["ordering"] = ordering
+        return self._page(
+            await self.http.get("/tasks/", params=params, timeout=timeout), Tasks
+        )
+
+    @async_handler
+    async def task_get(self, task_id: str) -> Task:
+        """Return a task by it's ID.
+
+        Args:
+            task_id: ID of the task.
+
+        Returns:
+            Task object.
+        """
+        return Task(**await self.http.get(f"/tasks/{task_id}/"))
+
+    @async_handler
+    async def task_add(self, task: TaskCreateRequest) -> Task:
+        """Add a task.
+
+        Args:
+           task: Task create request.
+
+        Returns:
+            Created task.
+        """
+        return Task(**await self.http.post("/tasks/", data=task))
+
+    @async_handler
+    async def task_update(self, task_id: str, task: TaskUpdateRequest) -> Task:
+        """Update a task.
+
+        Args:
+            task_id: ID of the task.
+            task: Task update request.
+
+        Returns:
+            Updated task.
+        """
+        return Task(**await self.http.patch(f"/tasks/{task_id}/", data=task))
+
+    @async_handler
+    async def task_delete(self, task_id: str):
+        """Delete a task.
+
+        Args:
+            task_id: ID of the task.
+        """
+        await self.http.delete(f"/tasks/{task_id}/")
+
+    @async_handler
+    async def task_parent_list(
+        self,
+        task_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Tasks:
+        """Return a paginated list of parent tasks for a selected task.
+
+        Args:
+            task_id: ID of the task.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Tasks object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/tasks/{task_id}/parents/", params=params), Tasks
+        )
+
+    @async_handler
+    async def task_child_list(
+        self,
+        task_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Tasks:
+        """Return a paginated list of child tasks for a selected task.
+
+        Args:
+            task_id: ID of the task.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Tasks object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/tasks/{task_id}/children/", params=params), Tasks
+        )
+
+    @async_handler
+    async def task_paper_list(
+        self,
+        task_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """Return a paginated list of papers for a selected task.
+
+        Args:
+            task_id: ID of the task.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Papers object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/tasks/{task_id}/papers/", params=params), Papers
+        )
+
+    @async_handler
+    async def task_evaluation_list(
+        self,
+        task_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> EvaluationTables:
+        """Return a list of evaluation tables for a selected task.
+
+        Args:
+            task_id: ID of the task.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            EvaluationTables object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/tasks/{task_id}/evaluations/", params=params),
+            EvaluationTables,
+        )
+
+    @async_handler
+    async def dataset_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        full_name: Optional[str] = None,
+        ordering: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Datasets:
+        """Return a paginated list of datasets.
+
+        Args:
+            q: Filter datasets by querying the dataset name.
+            name: Filter datasets by their name.
+            full_name: Filter datasets by their full name.
+            ordering: Which field to use when ordering the results.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Datasets object.
+        """
+        params = self._params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if name is not None:
+            params["name"] = name
+        if full_name is not None:
+            params["full_name"] = full_name
+        if ordering is not None:
+            params["ordering"] = ordering
+        return self._page(
+            await self.http.get("/datasets/", params=params, timeout=timeout),
+            Datasets,
+        )
+
+    @async_handler
+    async def dataset_get(self, dataset_id: str) -> Dataset:
+        """Return a dastaset by it's ID.
+
+        Args:
+            dataset_id: ID of the dataset.
+
+        Returns:
+            Dataset object.
+        """
+        return Dataset(**await self.http.get(f"/datasets/{dataset_id}/"))
+
+    @async_handler
+    async def dataset_add(self, dataset: DatasetCreateRequest) -> Dataset:
+        """Add a dataset.
+
+        Args:
+           dataset: Dataset create request.
+
+        Returns:
+            Created dataset.
+        """
+        return Dataset(**await self.http.post("/datasets/", data=dataset))
+
+    @async_handler
+    async def dataset_update(
+        self, dataset_id: str, dataset: DatasetUpdateRequest
+    ) -> Dataset:
+        """Update a dataset.
+
+        Args:
+            dataset_id: ID of the dataset.
+            dataset: Dataset update request.
+
+        Returns:
+            Updated dataset.
+        """
+        return Dataset(
+            **await self.http.patch(f"/datasets/{dataset_id}/", data=dataset)
+        )
+
+    @async_handler
+    async def dataset_delete(self, dataset_id: str):
+        """Delete a dataset.
+
+        Args:
+            dataset_id: ID of the dataset.
+        """
+        await self.http.delete(f"/datasets/{dataset_id}/")
+
+    @async_handler
+    async def dataset_evaluation_list(
+        self,
+        dataset_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> EvaluationTables:
+        """Return a list of evaluation tables for a selected dataset.
+
+        Args:
+            dataset_id: ID of the dasaset.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+           EvaluationTables object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(f"/datasets/{dataset_id}/evaluations/", params=params),
+            EvaluationTables,
+        )
+
+    @async_handler
+    async def method_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        full_name: Optional[str] = None,
+        ordering: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Methods:
+        """Return a paginated list of methods.
+
+        Args:
+            q: Search all searchable fields.
+            name: Filter methods by part of the name.
+            full_name: Filter methods by part of the full name.
+            ordering: Which field to use when ordering the results.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Methods object.
+        """
+        params = self._params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if name is not None:
+            params["name"] = name
+        if full_name is not None:
+            params["full_name"] = full_name
+        if ordering is not None:
+            params["ordering"] = ordering
+        return self._page(
+            await self.http.get("/methods/", params=params, timeout=timeout),
+            Methods,
+        )
+
+    @async_handler
+    async def method_get(self, method_id) -> Method:
+        """Return a method by it's ID.
+
+        Args:
+            method_id: ID of the method.
+
+        Returns:
+            Method object.
+        """
+        return Method(**await self.http.get(f"/methods/{method_id}/"))
+
+    @async_handler
+    async def evaluation_list(
+        self,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> EvaluationTables:
+        """Return a paginated list of evaluation tables.
+
+        Args:
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Evaluation table page object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get("/evaluations/", params=params), EvaluationTables
+        )
+
+    @async_handler
+    async def evaluation_get(self, evaluation_id: str) -> EvaluationTable:
+        """Return a evaluation table by it's ID.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+
+        Returns:
+            Evaluation table object.
+        """
+        return EvaluationTable(**await self.http.get(f"/evaluations/{evaluation_id}/"))
+
+    @async_handler
+    async def evaluation_create(
+        self,
+        evaluation: EvaluationTableCreateRequest,
+    ) -> EvaluationTable:
+        """Create an evaluation table.
+
+        Args:
+            evaluation: Evaluation table create request object.
+
+        Returns:
+            The new created evaluation table.
+        """
+        return EvaluationTable(**await self.http.post("/evaluations/", data=evaluation))
+
+    @async_handler
+    async def evaluation_update(
+        self,
+        evaluation_id: str,
+        evaluation: EvaluationTableUpdateRequest,
+    ) -> EvaluationTable:
+        """Update an evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            evaluation: Evaluation table update request object.
+
+        Returns:
+            The updated evaluation table.
+        """
+        return EvaluationTable(
+            **await self.http.patch(f"/evaluations/{evaluation_id}/", data=evaluation)
+        )
+
+    @async_handler
+    async def evaluation_delete(self, evaluation_id: str):
+        """Delete an evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+        """
+        await self.http.delete(f"/evaluations/{evaluation_id}/")
+
+    @async_handler
+    async def evaluation_metric_list(
+        self,
+        evaluation_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Metrics:
+        """List all metrics used in the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Metrics object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(
+                f"/evaluations/{evaluation_id}/metrics/", params=params
+            ),
+            Metrics,
+        )
+
+    @async_handler
+    async def evaluation_metric_get(self, evaluation_id: str, metric_id: str) -> Metric:
+        """Get a metrics used in the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            metric_id: ID of the metric.
+
+        Returns:
+            Requested metric.
+        """
+        return Metric(
+            **await self.http.get(f"/evaluations/{evaluation_id}/metrics/{metric_id}/")
+        )
+
+    @async_handler
+    async def evaluation_metric_add(
+        self,
+        evaluation_id: str,
+        metric: MetricCreateRequest,
+    ) -> Metric:
+        """Add a metrics to the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            metric: Metric create request.
+
+        Returns:
+            Created metric.
+        """
+        return Metric(
+            **await self.http.post(
+                f"/evaluations/{evaluation_id}/metrics/", data=metric
+            )
+        )
+
+    @async_handler
+    async def evaluation_metric_update(
+        self,
+        evaluation_id: str,
+        metric_id: str,
+        metric: MetricUpdateRequest,
+    ) -> Metric:
+        """Update a metrics in the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            metric_id: ID of the metric.
+            metric: Metric update request.
+
+        Returns:
+            Updated metric.
+        """
+        return Metric(
+            **await self.http.patch(
+                f"/evaluations/{evaluation_id}/metrics/{metric_id}/",
+                data=metric,
+            )
+        )
+
+    @async_handler
+    async def evaluation_metric_delete(self, evaluation_id: str, metric_id: str):
+        """Delete a metrics from the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            metric_id: ID of the metric.
+        """
+        await self.http.delete(f"/evaluations/{evaluation_id}/metrics/{metric_id}/")
+
+    @async_handler
+    async def evaluation_result_list(
+        self,
+        evaluation_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Results:
+        """List all results from the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            page: Desired page.
+            items_per_page: Desired number of items per page.
+
+        Returns:
+            Results object.
+        """
+        params = self._params(page, items_per_page)
+        return self._page(
+            await self.http.get(
+                f"/evaluations/{evaluation_id}/results/", params=params
+            ),
+            Results,
+        )
+
+    @async_handler
+    async def evaluation_result_get(self, evaluation_id: str, result_id: str) -> Result:
+        """Get a result from the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            result_id: ID of the result.
+
+        Returns:
+            Requested result.
+        """
+        return Result(
+            **await self.http.get(f"/evaluations/{evaluation_id}/results/{result_id}/")
+        )
+
+    @async_handler
+    async def evaluation_result_add(
+        self,
+        evaluation_id: str,
+        result: ResultCreateRequest,
+    ) -> Result:
+        """Add a result to the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            result: Result create request.
+
+        Returns:
+            Created result.
+        """
+        return Result(
+            **await self.http.post(
+                f"/evaluations/{evaluation_id}/results/", data=result
+            )
+        )
+
+    @async_handler
+    async def evaluation_result_update(
+        self,
+        evaluation_id: str,
+        result_id: str,
+        result: ResultUpdateRequest,
+    ) -> Result:
+        """Update a result in the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            result_id: ID of the result.
+            result: Result update request.
+
+        Returns:
+            Updated result.
+        """
+        return Result(
+            **await self.http.patch(
+                f"/evaluations/{evaluation_id}/results/{result_id}/",
+                data=result,
+            )
+        )
+
+    @async_handler
+    async def evaluation_result_delete(self, evaluation_id: str, result_id: str):
+        """Delete a result from the evaluation table.
+
+        Args:
+            evaluation_id: ID of the evaluation table.
+            result_id: ID of the result.
+        """
+        await self.http.delete(f"/evaluations/{evaluation_id}/results/{result_id}/")
+
+    @async_handler
+    async def evaluation_synchronize(
+        self,
+        evaluation: EvaluationTableSyncRequest,
+    ) -> EvaluationTableSyncResponse:
+        d = await self.http.post("/rpc/evaluation-synchronize/", data=evaluation)
+        d["results"] = [result for result in d["results"]]
+        return EvaluationTableSyncResponse(**d)
+
+    async def iter_pages(
+        self,
+        list_method: Callable[..., Awaitable[Page]],
+        *args,
+        items_per_page: int = 50,
+        prefetch: int = 4,
+        **kwargs,
+    ) -> AsyncIterator:
+        """Iterate over the items of all pages of a paginated listing.
+
+        Same as ``PapersWithCodeClient.iter_pages``, the next ``prefetch``
+        pages are fetched concurrently as tasks. Iteration ends at the first
+        page without a next page or at a page that is not found (404) because
+        items were removed meanwhile.
+
+        Args:
+            list_method: Paginated list method of the client, e.g.
+                ``paper_list``.
+            args: Positional arguments of the list method.
+            items_per_page: Desired number of items per page.
+            prefetch: Number of pages fetched ahead, at least one.
+            kwargs: Keyword arguments (filters) of the list method.
+
+        Yields:
+            Items of all pages, in order.
+        """
+
+        def fetch(page: int) -> Awaitable[Page]:
+            return list_method(
+                *args, page=page, items_per_page=items_per_page, **kwargs
+            )
+
+        first = await fetch(1)
+        for item in first.results:
+            yield item
+        if first.next_page is None:
+            return
+
+        last = self._last_page(first, items_per_page)
+        window = max(prefetch, 1)
+        pending = deque()
+        next_page = 2
+        try:
+            while True:
+                while next_page <= last and len(pending) < window:
+                    pending.append(asyncio.ensure_future(fetch(next_page)))
+                    next_page += 1
+                if not pending:
+                    return
+                try:
+                    page = await pending.popleft()
+                except HttpClientError as e:
+                    if e.status_code == 404:
+                        # Items were removed, the listing now ends earlier.
+                        return
+                    raise
+                for item in page.results:
+                    yield item
+                if page.next_page is None:
+                    return
+                # Items were added since the first page was fetched.
+                last = max(last, page.next_page)
+        finally:
+            for task in pending:
+                if not task.cancel() and not task.cancelled():
+                    # Already done: retrieve the result, so the failures of
+                    # pages that are not needed anymore are not logged.
+                    task.exception()
+
+    def iter_search(self, **kwargs) -> AsyncIterator[PaperRepo]:
+        """Iterate over all search results.
+
+        See ``search`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.search, **kwargs)
+
+    def iter_papers(self, **kwargs) -> AsyncIterator[Paper]:
+        """Iterate over all papers.
+
+        See ``paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_list, **kwargs)
+
+    def iter_paper_datasets(self, paper_id: str, **kwargs) -> AsyncIterator[Dataset]:
+        """Iterate over all datasets mentioned in the paper.
+
+        See ``paper_dataset_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_dataset_list, paper_id, **kwargs)
+
+    def iter_paper_repositories(
+        self, paper_id: str, **kwargs
+    ) -> AsyncIterator[Repository]:
+        """Iterate over all paper implementations.
+
+        See ``paper_repository_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_repository_list, paper_id, **kwargs)
+
+    def iter_paper_tasks(self, paper_id: str, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over all tasks mentioned in the paper.
+
+        See ``paper_task_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_task_list, paper_id, **kwargs)
+
+    def iter_paper_methods(self, paper_id: str, **kwargs) -> AsyncIterator[Method]:
+        """Iterate over all methods mentioned in the paper.
+
+        See ``paper_method_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_method_list, paper_id, **kwargs)
+
+    def iter_paper_results(self, paper_id: str, **kwargs) -> AsyncIterator[Result]:
+        """Iterate over all evaluation results for the paper.
+
+        See ``paper_result_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.paper_result_list, paper_id, **kwargs)
+
+    def iter_repositories(self, **kwargs) -> AsyncIterator[Repository]:
+        """Iterate over all repositories.
+
+        See ``repository_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.repository_list, **kwargs)
+
+    def iter_repository_papers(
+        self, owner: str, name: str, **kwargs
+    ) -> AsyncIterator[Paper]:
+        """Iterate over all papers connected to the repository.
+
+        See ``repository_paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.repository_paper_list, owner, name, **kwargs)
+
+    def iter_authors(self, **kwargs) -> AsyncIterator[Author]:
+        """Iterate over all paper authors.
+
+        See ``author_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.author_list, **kwargs)
+
+    def iter_author_papers(self, author_id: str, **kwargs) -> AsyncIterator[Paper]:
+        """Iterate over all papers connected to the author.
+
+        See ``author_paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.author_paper_list, author_id, **kwargs)
+
+    def iter_conferences(self, **kwargs) -> AsyncIterator[Conference]:
+        """Iterate over all conferences.
+
+        See ``conference_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.conference_list, **kwargs)
+
+    def iter_proceedings(
+        self, conference_id: str, **kwargs
+    ) -> AsyncIterator[Proceeding]:
+        """Iterate over all proceedings of the conference.
+
+        See ``proceeding_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.proceeding_list, conference_id, **kwargs)
+
+    def iter_proceeding_papers(
+        self, conference_id: str, proceeding_id: str, **kwargs
+    ) -> AsyncIterator[Paper]:
+        """Iterate over all papers published in a conference proceeding.
+
+        See ``proceeding_paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(
+            self.proceeding_paper_list, conference_id, proceeding_id, **kwargs
+        )
+
+    def iter_areas(self, **kwargs) -> AsyncIterator[Area]:
+        """Iterate over all areas.
+
+        See ``area_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.area_list, **kwargs)
+
+    def iter_area_tasks(self, area_id: str, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over all tasks in an area.
+
+        See ``area_task_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.area_task_list, area_id, **kwargs)
+
+    def iter_tasks(self, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over all tasks.
+
+        See ``task_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_list, **kwargs)
+
+    def iter_task_parents(self, task_id: str, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over all parent tasks of a task.
+
+        See ``task_parent_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_parent_list, task_id, **kwargs)
+
+    def iter_task_children(self, task_id: str, **kwargs) -> AsyncIterator[Task]:
+        """Iterate over all child tasks of a task.
+
+        See ``task_child_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_child_list, task_id, **kwargs)
+
+    def iter_task_papers(self, task_id: str, **kwargs) -> AsyncIterator[Paper]:
+        """Iterate over all papers for a task.
+
+        See ``task_paper_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_paper_list, task_id, **kwargs)
+
+    def iter_task_evaluations(
+        self, task_id: str, **kwargs
+    ) -> AsyncIterator[EvaluationTable]:
+        """Iterate over all evaluation tables for a task.
+
+        See ``task_evaluation_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.task_evaluation_list, task_id, **kwargs)
+
+    def iter_datasets(self, **kwargs) -> AsyncIterator[Dataset]:
+        """Iterate over all datasets.
+
+        See ``dataset_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.dataset_list, **kwargs)
+
+    def iter_dataset_evaluations(
+        self, dataset_id: str, **kwargs
+    ) -> AsyncIterator[EvaluationTable]:
+        """Iterate over all evaluation tables for a dataset.
+
+        See ``dataset_evaluation_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.dataset_evaluation_list, dataset_id, **kwargs)
+
+    def iter_methods(self, **kwargs) -> AsyncIterator[Method]:
+        """Iterate over all methods.
+
+        See ``method_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.method_list, **kwargs)
+
+    def iter_evaluations(self, **kwargs) -> AsyncIterator[EvaluationTable]:
+        """Iterate over all evaluation tables.
+
+        See ``evaluation_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.evaluation_list, **kwargs)
+
+    def iter_evaluation_metrics(
+        self, evaluation_id: str, **kwargs
+    ) -> AsyncIterator[Metric]:
+        """Iterate over all metrics used in the evaluation table.
+
+        See ``evaluation_metric_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.evaluation_metric_list, evaluation_id, **kwargs)
+
+    def iter_evaluation_results(
+        self, evaluation_id: str, **kwargs
+    ) -> AsyncIterator[Result]:
+        """Iterate over all results from the evaluation table.
+
+        See ``evaluation_result_list`` for the filters and ``iter_pages`` for the
+        paging options.
+        """
+        return self.iter_pages(self.evaluation_result_list, evaluation_id, **kwargs)
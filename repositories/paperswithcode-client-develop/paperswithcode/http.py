@@ -1,10 +1,14 @@
 import enum
+import time
+import asyncio
+import threading
 from typing import Optional
 
 import httpx
 
 from paperswithcode import errors
 from paperswithcode.models import Model
+from paperswithcode.ratelimit import RateLimiter, header_number, reset_delay
 
 
 class AuthorizationMethod(enum.Enum):
@@ -13,10 +17,16 @@ class AuthorizationMethod(enum.Enum):
     jwt = "JWT"
 
 
-class HttpClient:
-    """Generic requests handler.
+class BaseHttpClient:
+    """Base of the synchronous and the asynchronous HTTP clients.
 
-    Handles retries and HTTP errors.
+    Holds the configuration, prepares the requests and handles the responses
+    and errors. Subclasses implement ``request``, the ``get``, ``post``,
+    ``patch`` and ``delete`` methods return its result.
+
+    Requests are paced by a ``RateLimiter`` and retried with exponential
+    backoff when the server answers 429 (any method) or 502, 503 or 504
+    (idempotent methods only, other requests may already have been applied).
     """
 
     Authorization = AuthorizationMethod
@@ -30,6 +40,8 @@ class HttpClient:
         502: "Server not reachable.",
         503: "Server under maintenance.",
     }
+    RETRY_STATUS_CODES = (502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "DELETE")
 
     def __init__(
         self,
@@ -37,126 +49,154 @@ class HttpClient:
         token: str = "",
         authorization_method: AuthorizationMethod = AuthorizationMethod.jwt,
         timeout: int = 10,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport=None,
     ):
         """Initialize.
 
+        Requests are sent through one long-lived httpx client that keeps
+        connections (and their TLS sessions) alive between requests. It is
+        created on the first request and released by ``close`` or when the
+        client is used as a context manager.
+
         Args:
             url: URL to the Traktor server.
             token: Traktor authentication token.
             authorization_method: Authorization method.
             timeout: Request timeout time.
+            max_connections: Maximum number of concurrent connections, None for
+                no limit.
+            max_keepalive_connections: Maximum number of idle connections kept
+                in the pool, None for no limit.
+            keepalive_expiry: Seconds after which idle connections are closed.
+            http2: Use HTTP/2 if the server supports it. Requires the ``h2``
+                package (``pip install httpx[http2]``).
+            max_retries: Number of times a rate limited or failed request is
+                retried, 0 disables retries.
+            backoff_factor: Retry ``n`` waits ``backoff_factor * 2 ** n``
+                seconds, or longer if the server asks for it.
+            rate_limiter: Rate limiter to share with other clients, by default
+                every client has its own.
+            transport: httpx transport to send the requests through instead
+                of the network, e.g. ``httpx.MockTransport`` in tests.
         """
         self.url = url
         self.token = token
         self.authorization_method = authorization_method
         self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.transport = transport
 
         # Setup headers
         self.headers = {"Content-Type": "application/json"}
 
         self.response = None
 
-    def request(
+    def _client_options(self) -> dict:
+        options = dict(
+            base_url=self.url,
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+        )
+        if self.transport is not None:
+            options["transport"] = self.transport
+        return options
+
+    def _prepare(
         self,
         method: str,
-        url: str,
-        headers: Optional[dict[str, str]] = None,
-        params: Optional[dict[str, str]] = None,
-        data: Optional[Model] = None,
-        timeout: Optional[float] = None,
+        headers: Optional[dict[str, str]],
+        data: Optional[Model],
+        timeout: Optional[float],
     ) -> dict:
-        """Request method.
-
-        Request method handles all the url joining, header merging, logging and
-        error handling.
-
-        Args:
-            method: Method for the request - GET or POST
-            url: Partial url of the request. It is added to the base url
-            headers: Dictionary of additional HTTP headers
-            params: Dictionary of query parameters for the request
-            data: A JSON serializable Python object to send in the body of the request.
-                Used only in POST requests.
-            timeout: How many seconds to wait for the server to send data before
-                giving up.
-
-        Returns:
-            Deserialized json response.
-        """
+        """Return the keyword arguments for ``httpx.Client.request``."""
         headers = {**self.headers, **(headers or {})}
 
         # Set authorization token
         if self.token.strip() != "":
             headers["Authorization"] = f"{self.authorization_method.value} {self.token}"
 
-        timeout = timeout or self.timeout
+        method = method.lower()
+        if method not in ("get", "patch", "post", "delete"):
+            raise errors.HttpClientError(
+                f"Unsupported method: {method}", status_code=405
+            )
+        kwargs = dict(
+            method=method.upper(), headers=headers, timeout=timeout or self.timeout
+        )
+        if method in ("patch", "post"):
+            kwargs["data"] = {} if data is None else data.dict()
+        return kwargs
 
-        try:
-            with httpx.Client(base_url=self.url, headers=self.headers) as client:
-                if method.lower() == "get":
-                    self.response = client.get(
-                        url=url,
-                        headers=headers,
-                        params=params,
-                        timeout=timeout,
-                    )
-                elif method.lower() == "patch":
-                    self.response = client.patch(
-                        url=url,
-                        headers=headers,
-                        params=params,
-                        data=({} if data is None else data.dict()),
-                        timeout=timeout,
-                    )
-                elif method.lower() == "post":
-                    self.response = client.post(
-                        url=url,
-                        headers=headers,
-                        params=params,
-                        data=({} if data is None else data.dict()),
-                        timeout=timeout,
-                    )
-                elif method.lower() == "delete":
-                    self.response = client.delete(
-                        url=url,
-                        headers=headers,
-                        params=params,
-                        timeout=timeout,
-                    )
-                else:
-                    raise errors.HttpClientError(
-                        f"Unsupported method: {method}", status_code=405
-                    )
-        except httpx.TimeoutException as e:
+    def _error(self, e: Exception) -> errors.HttpClientError:
+        """Translate an exception raised while sending a request."""
+        if isinstance(e, httpx.TimeoutException):
             # If request timed out, let upper level handle it they way it sees
             # fit one place might want to retry another might not.
-            raise errors.HttpClientTimeout() from e
-
-        except ConnectionError as e:
-            raise errors.HttpClientError("Server not reachable.") from e
-
-        except Exception as e:
-            raise errors.HttpClientError(f"Unknown error. {e!r}") from e
-
-        if 200 <= self.response.status_code <= 299:
+            return errors.HttpClientTimeout()
+        if isinstance(e, ConnectionError):
+            return errors.HttpClientError("Server not reachable.")
+        return errors.HttpClientError(f"Unknown error. {e!r}")
+
+    def _retry_delay(
+        self, method: str, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
+        """Return seconds to wait before retrying, None to not retry."""
+        if attempt >= self.max_retries:
+            return None
+        # On 429 the rate limiter also holds back all other requests until
+        # the server's retry time has passed.
+        retryable = response.status_code == 429 or (
+            response.status_code in self.RETRY_STATUS_CODES
+            and method in self.IDEMPOTENT_METHODS
+        )
+        if not retryable:
+            return None
+        delay = self.backoff_factor * 2**attempt
+        retry = header_number(response.headers, "Retry-After")
+        if retry is not None:
+            delay = max(delay, reset_delay(retry, time.time()))
+        return min(delay, self.rate_limiter.MAX_WAIT)
+
+    def _handle(self, response: httpx.Response) -> dict:
+        """Return the deserialized json response or raise the error."""
+        if 200 <= response.status_code <= 299:
             try:
-                return self.response.json() if self.response.text else {}
+                return response.json() if response.text else {}
             except Exception as e:
                 raise errors.HttpClientError(
                     f"Error while parsing server response: {e!r}",
-                    response=self.response,
+                    response=response,
                 ) from e
 
         # Check rate limit
-        limit = self.response.headers.get("X-Ratelimit-Limit", None)
+        limit = header_number(response.headers, "X-Ratelimit-Limit")
         if limit is not None:
-            remaining = self.response.headers["X-Ratelimit-Remaining"]
-            reset = self.response.headers["X-Ratelimit-Reset"]
-            retry = self.response.headers["X-Ratelimit-Retry"]
+            remaining = header_number(response.headers, "X-Ratelimit-Remaining")
+            limit = int(limit)
+            remaining = None if remaining is None else int(remaining)
+            reset = header_number(response.headers, "X-Ratelimit-Reset")
+            retry = header_number(response.headers, "X-Ratelimit-Retry")
 
-            if remaining == 0:
+            if response.status_code == 429 or remaining == 0:
                 raise errors.HttpRateLimitExceeded(
-                    response=self.response,
+                    response=response,
                     limit=limit,
                     remaining=remaining,
                     reset=reset,
@@ -164,23 +204,23 @@ class HttpClient:
                 )
 
         # Try known error messages
-        message = self.ERRORS.get(self.response.status_code, None)
+        message = self.ERRORS.get(response.status_code, None)
         if message is not None:
-            raise errors.HttpClientError(message, response=self.response)
+            raise errors.HttpClientError(message, response=response)
 
-        if self.response.status_code == 400:
+        if response.status_code == 400:
             try:
-                message = self.response.json()["error"]
+                message = response.json()["error"]
             except Exception:
                 message = "Bad Request."
-            raise errors.HttpClientError(message, response=self.response)
+            raise errors.HttpClientError(message, response=response)
 
         # Generalize unknown messages.
         try:
-            message = self.response.json()["message"]
+            message = response.json()["message"]
         except Exception:
             message = "Unknown error."
-        raise errors.HttpClientError(message, response=self.response)
+        raise errors.HttpClientError(message, response=response)
 
     def get(
         self,
@@ -298,3 +338,183 @@ class HttpClient:
             params=params,
             timeout=timeout,
         )
+
+
+class HttpClient(BaseHttpClient):
+    """Generic requests handler.
+
+    Handles retries and HTTP errors.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled ``httpx.Client``, created on first use."""
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(**self._client_options())
+            return self._client
+
+    def close(self):
+        """Close the pooled connections.
+
+        The client can still be used afterwards, a new pool is created for
+        the next request.
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, str]] = None,
+        data: Optional[Model] = None,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """Request method.
+
+        Request method handles all the url joining, header merging, logging and
+        error handling.
+
+        Args:
+            method: Method for the request - GET or POST
+            url: Partial url of the request. It is added to the base url
+            headers: Dictionary of additional HTTP headers
+            params: Dictionary of query parameters for the request
+            data: A JSON serializable Python object to send in the body of the request.
+                Used only in POST requests.
+            timeout: How many seconds to wait for the server to send data before
+                giving up.
+
+        Returns:
+            Deserialized json response.
+        """
+        kwargs = self._prepare(method, headers, data, timeout)
+        attempt = 0
+        while True:
+            wait = self.rate_limiter.acquire()
+            while wait:
+                time.sleep(wait)
+                wait = self.rate_limiter.acquire()
+            try:
+                # Concurrent requests from other threads may replace
+                # `self.response`, the local variable is the response to this
+                # one.
+                response = self.response = self.client.request(
+                    url=url, params=params, **kwargs
+                )
+            except Exception as e:
+                self.rate_limiter.release()
+                raise self._error(e) from e
+            except BaseException:
+                self.rate_limiter.release()
+                raise
+            self.rate_limiter.release(response)
+            delay = self._retry_delay(kwargs["method"], response, attempt)
+            if delay is None:
+                return self._handle(response)
+            attempt += 1
+            time.sleep(delay)
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """Asynchronous requests handler.
+
+    The twin of ``HttpClient`` built on one shared ``httpx.AsyncClient``.
+    ``request`` and the ``get``, ``post``, ``patch`` and ``delete`` methods
+    return coroutines.
+    """
+
+    def __init__(self, *args, max_concurrency: int = 10, **kwargs):
+        """Initialize.
+
+        Takes the arguments of ``BaseHttpClient`` and:
+
+        Args:
+            max_concurrency: Maximum number of requests in flight at once,
+                further requests wait for a free slot.
+        """
+        super().__init__(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled ``httpx.AsyncClient``, created on first use."""
+        # Coroutines switch only at `await`, no lock is needed.
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(**self._client_options())
+        return self._client
+
+    async def close(self):
+        """Close the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, str]] = None,
+        data: Optional[Model] = None,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """Request method.
+
+        Same as ``HttpClient.request``, at most ``max_concurrency`` requests
+        are sent at once. Requests waiting for the rate limiter or a retry do
+        not take a slot.
+
+        Returns:
+            Deserialized json response.
+        """
+        kwargs = self._prepare(method, headers, data, timeout)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        attempt = 0
+        while True:
+            wait = self.rate_limiter.acquire()
+            while wait:
+                await asyncio.sleep(wait)
+                wait = self.rate_limiter.acquire()
+            try:
+                async with self._semaphore:
+                    response = self.response = await self.client.request(
+                        url=url, params=params, **kwargs
+                    )
+            except Exception as e:
+                self.rate_limiter.release()
+                raise self._error(e) from e
+            except BaseException:
+                # Cancelled while waiting for a slot or the response.
+                self.rate_limiter.release()
+                raise
+            self.rate_limiter.release(response)
+            delay = self._retry_delay(kwargs["method"], response, attempt)
+            if delay is None:
+                return self._handle(response)
+            attempt += 1
+            await asyncio.sleep(delay)
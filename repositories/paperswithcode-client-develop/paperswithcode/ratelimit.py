@@ -0,0 +1,168 @@
+import time
+import threading
+from typing import Callable, Optional
+
+import httpx
+
+
+def header_number(headers: httpx.Headers, name: str) -> Optional[float]:
+    """Return the numeric value of a header, None if missing or invalid."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+# Reset times above this many seconds are Unix timestamps (2001 onwards), not
+# a number of seconds to wait.
+EPOCH_THRESHOLD = 10**9
+
+
+def reset_delay(value: Optional[float], now: float) -> Optional[float]:
+    """Return the seconds until a reset time sent by the server.
+
+    Args:
+        value: Header value, seconds to wait or a Unix timestamp.
+        now: Current Unix time.
+    """
+    if value is None:
+        return None
+    if value > EPOCH_THRESHOLD:
+        value -= now
+    return max(value, 0.0)
+
+
+class RateLimiter:
+    """Token bucket that paces requests to the server's rate limit.
+
+    The budget is learned from the ``X-Ratelimit-Limit``, ``-Remaining``,
+    ``-Reset`` and ``-Retry`` response headers: ``limit`` requests are
+    allowed per window of ``reset`` seconds. Reset and retry times may be
+    sent as seconds or as Unix timestamps, waits are capped at ``MAX_WAIT``
+    seconds. Until the server has sent them
+    requests are not delayed, except that the first request is sent alone to
+    learn them.
+
+    A request is sent once ``acquire`` grants it a token, until then the
+    caller waits the returned number of seconds and asks again, so requests
+    are spread out instead of running into 429 responses. ``release`` feeds
+    the response headers back: the server's ``remaining`` count minus the
+    requests still in flight caps the tokens, so the bucket never gets ahead
+    of the server. A 429 response
+    (or ``remaining`` dropping to 0) pauses all requests until the server
+    allows them again.
+
+    The state is guarded by a lock that is never held while waiting, so one
+    limiter can be shared by threads, asyncio tasks and several clients.
+    """
+
+    # Seconds between polls while the first request learns the rate limit.
+    PROBE_INTERVAL = 0.05
+    # Longest wait (and rate limit window) accepted from the server.
+    MAX_WAIT = 300.0
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        """Initialize.
+
+        Args:
+            clock: Monotonic clock in seconds.
+            wall_clock: Unix time, to convert timestamps in the headers.
+        """
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self.limit: Optional[float] = None
+        self.window: Optional[float] = None
+        self.tokens = 0.0
+        self.pending = 0
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._probed = False
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Learned sustained rate in requests per second, None if unknown."""
+        if self.limit is None or not self.window:
+            return None
+        return self.limit / self.window
+
+    def _refill(self, now: float):
+        rate = self.rate
+        if rate is not None:
+            self.tokens = min(self.limit, self.tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    def _wait(self, headers: httpx.Headers, name: str) -> Optional[float]:
+        """Return the seconds to wait from a reset or retry header."""
+        value = reset_delay(header_number(headers, name), self._wall_clock())
+        return None if value is None else min(value, self.MAX_WAIT)
+
+    def acquire(self) -> float:
+        """Try to take a token for one request.
+
+        Returns:
+            0 if the request may be sent, every granted request must be
+            finished with ``release``. Otherwise the seconds to wait before
+            trying again.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if self._blocked_until > now:
+                return self._blocked_until - now
+            if not self._probed and self.pending > 0:
+                return self.PROBE_INTERVAL
+            rate = self.rate
+            if rate is not None:
+                if self.tokens < 1:
+                    return (1 - self.tokens) / rate
+                self.tokens -= 1
+            self.pending += 1
+            return 0.0
+
+    def release(self, response: Optional[httpx.Response] = None):
+        """Finish a request started with ``acquire``.
+
+        Args:
+            response: Server response, None if the request failed before it.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self.pending = max(0, self.pending - 1)
+            if response is None:
+                return
+            self._probed = True
+
+            headers = response.headers
+            limit = header_number(headers, "X-Ratelimit-Limit")
+            remaining = header_number(headers, "X-Ratelimit-Remaining")
+            reset = self._wait(headers, "X-Ratelimit-Reset")
+            retry = self._wait(headers, "X-Ratelimit-Retry")
+            if retry is None:
+                retry = self._wait(headers, "Retry-After")
+
+            if limit is not None and limit > 0:
+                if self.limit is None:
+                    self.tokens = limit
+                self.limit = limit
+            if reset is not None and reset > 0:
+                # The longest reset time seen is the best guess of the window.
+                self.window = max(self.window or 0.0, reset)
+            if remaining is not None and self.limit is not None:
+                self.tokens = min(self.tokens, remaining - self.pending)
+
+            block = None
+            if response.status_code == 429:
+                block = retry if retry is not None else reset
+            elif remaining is not None and remaining <= 0:
+                block = reset
+            if block is not None and block > 0:
+                self._blocked_until = max(self._blocked_until, now + block)
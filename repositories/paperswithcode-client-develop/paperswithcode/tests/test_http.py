@@ -0,0 +1,155 @@
+import asyncio
+
+import httpx
+import pytest
+
+from paperswithcode import AsyncPapersWithCodeClient, PapersWithCodeClient
+from paperswithcode import http
+from paperswithcode.errors import HttpClientError
+from paperswithcode.http import AsyncHttpClient, HttpClient
+
+URL = "http://pwc.test/api/v1"
+
+
+class Responses:
+    """Transport handler answering with the given status codes in order.
+
+    The last status code is repeated, every request is recorded.
+    """
+
+    def __init__(self, *status_codes: int):
+        self.status_codes = list(status_codes)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        status_code = self.status_codes[
+            min(len(self.requests), len(self.status_codes)) - 1
+        ]
+        return httpx.Response(status_code, json={"status": status_code})
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the backoff delays instead of sleeping."""
+    delays = []
+
+    class Time:
+        @staticmethod
+        def sleep(seconds):
+            delays.append(seconds)
+
+    async def sleep(seconds):
+        delays.append(seconds)
+
+    monkeypatch.setattr(http, "time", Time)
+    monkeypatch.setattr(http.asyncio, "sleep", sleep)
+    return delays
+
+
+def make_client(responses, **kwargs):
+    return HttpClient(URL, transport=httpx.MockTransport(responses), **kwargs)
+
+
+def make_async_client(responses, **kwargs):
+    return AsyncHttpClient(URL, transport=httpx.MockTransport(responses), **kwargs)
+
+
+def test_retry_rate_limited(sleeps):
+    responses = Responses(429, 429, 200)
+    with make_client(responses) as client:
+        assert client.get("/papers/") == {"status": 200}
+    assert len(responses.requests) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_server_errors(sleeps):
+    responses = Responses(502, 503, 504, 503)
+    with make_client(responses, max_retries=3, backoff_factor=1) as client:
+        with pytest.raises(HttpClientError) as e:
+            client.get("/papers/")
+    assert e.value.status_code == 503
+    # One request and three retries.
+    assert len(responses.requests) == 4
+    assert sleeps == [1, 2, 4]
+
+
+def test_no_retry(sleeps):
+    # Non-idempotent requests are not retried on server errors.
+    responses = Responses(503)
+    with make_client(responses) as client:
+        with pytest.raises(HttpClientError):
+            client.post("/papers/")
+    assert len(responses.requests) == 1
+
+    # Retries disabled.
+    responses = Responses(429)
+    with make_client(responses, max_retries=0) as client:
+        with pytest.raises(HttpClientError) as e:
+            client.get("/papers/")
+    assert e.value.status_code == 429
+    assert len(responses.requests) == 1
+    assert sleeps == []
+
+
+def test_async_retry(sleeps):
+    responses = Responses(429, 503, 200)
+
+    async def main():
+        async with make_async_client(responses) as client:
+            return await client.get("/papers/")
+
+    assert asyncio.run(main()) == {"status": 200}
+    assert len(responses.requests) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_pooled_client(monkeypatch):
+    created = []
+
+    class Client(httpx.Client):
+        def __init__(self, **kwargs):
+            created.append(self)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(http.httpx, "Client", Client)
+    responses = Responses(200)
+    with make_client(responses) as client:
+        for _ in range(3):
+            client.get("/papers/")
+        # All requests went through one pooled client.
+        assert created == [client.client]
+    assert created[0].is_closed
+    assert client._client is None
+    assert len(responses.requests) == 3
+
+    # A closed client opens a new pool on the next request.
+    client.get("/papers/")
+    assert len(created) == 2 and not created[1].is_closed
+    client.close()
+
+
+def papers(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200, json={"count": 0, "next": None, "previous": None, "results": []}
+    )
+
+
+def test_client_context_manager():
+    with PapersWithCodeClient(
+        url="http://pwc.test", transport=httpx.MockTransport(papers)
+    ) as client:
+        assert client.paper_list().count == 0
+        pool = client.http.client
+    assert pool.is_closed
+
+
+def test_async_client_context_manager():
+    async def main():
+        async with AsyncPapersWithCodeClient(
+            url="http://pwc.test", transport=httpx.MockTransport(papers)
+        ) as client:
+            assert (await client.paper_list()).count == 0
+            return client.http.client
+
+    assert asyncio.run(main()).is_closed
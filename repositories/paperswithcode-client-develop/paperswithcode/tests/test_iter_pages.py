@@ -0,0 +1,84 @@
+import asyncio
+
+import httpx
+import pytest
+
+from paperswithcode import AsyncPapersWithCodeClient, PapersWithCodeClient
+from paperswithcode.errors import HttpClientError
+from paperswithcode.tests.utils import SERVER_URL, Listing, paper
+
+
+def listing(n: int, on_page=None) -> Listing:
+    return Listing({"/papers/": [paper(i) for i in range(n)]}, on_page=on_page)
+
+
+def iter_ids(listing: Listing, **kwargs) -> list:
+    with PapersWithCodeClient(url=SERVER_URL, transport=listing.transport) as client:
+        return [p.id for p in client.iter_papers(items_per_page=5, **kwargs)]
+
+
+def async_iter_ids(listing: Listing, **kwargs) -> list:
+    async def main():
+        async with AsyncPapersWithCodeClient(
+            url=SERVER_URL, transport=listing.transport
+        ) as client:
+            return [p.id async for p in client.iter_papers(items_per_page=5, **kwargs)]
+
+    return asyncio.run(main())
+
+
+def ids(n: int) -> list:
+    return [f"paper-{i}" for i in range(n)]
+
+
+@pytest.fixture(params=[iter_ids, async_iter_ids], ids=["sync", "async"])
+def iterate(request):
+    return request.param
+
+
+@pytest.mark.parametrize("prefetch", [1, 4])
+def test_all_pages(iterate, prefetch):
+    papers = listing(23)
+    assert iterate(papers, prefetch=prefetch) == ids(23)
+    assert sorted(page for _, page in papers.pages) == [1, 2, 3, 4, 5]
+
+
+def test_single_page(iterate):
+    papers = listing(3)
+    assert iterate(papers) == ids(3)
+    assert papers.pages == [("/papers/", 1)]
+
+
+@pytest.mark.parametrize("prefetch", [1, 4])
+def test_growing_listing(iterate, prefetch):
+    def grow(listing, page):
+        if page == 1:
+            listing.items["/papers/"] += [paper(i) for i in range(10, 17)]
+
+    # The first page says 2 pages, 4 are served by the time they are fetched.
+    assert iterate(listing(10, grow), prefetch=prefetch) == ids(17)
+
+
+@pytest.mark.parametrize("prefetch", [1, 4])
+@pytest.mark.parametrize("remaining", [4, 9])
+def test_shrinking_listing(iterate, prefetch, remaining):
+    def shrink(listing, page):
+        if page > 1:
+            del listing.items["/papers/"][remaining:]
+
+    # Pages past the new end are not found, the iteration ends without error.
+    assert iterate(listing(15, shrink), prefetch=prefetch) == ids(max(remaining, 5))
+
+
+def test_errors_are_raised(iterate):
+    def fail(listing, page):
+        if page == 3:
+            return httpx.Response(500, json={"message": "Server error."})
+
+    # Only pages past the first one that are not found end the iteration.
+    with pytest.raises(HttpClientError) as e:
+        iterate(Listing({}))
+    assert e.value.status_code == 404
+    with pytest.raises(HttpClientError) as e:
+        iterate(listing(15, fail), prefetch=1)
+    assert e.value.status_code == 500
@@ -0,0 +1,143 @@
+"""The asynchronous client must stay a twin of the synchronous one."""
+
+import enum
+import asyncio
+import inspect
+import datetime
+import typing
+
+import httpx
+import pytest
+
+from paperswithcode import AsyncPapersWithCodeClient, PapersWithCodeClient
+from paperswithcode.errors import HttpClientError
+from paperswithcode.models import Model
+from paperswithcode.tests.utils import SERVER_URL
+
+
+def public_methods(cls) -> dict:
+    return {
+        name: member
+        for name, member in inspect.getmembers(cls, inspect.isfunction)
+        if not name.startswith("_")
+    }
+
+
+SYNC = public_methods(PapersWithCodeClient)
+ASYNC = public_methods(AsyncPapersWithCodeClient)
+
+
+def test_same_methods():
+    assert sorted(SYNC) == sorted(ASYNC)
+
+
+@pytest.mark.parametrize("name", sorted(SYNC))
+def test_same_signature(name):
+    sync = inspect.signature(SYNC[name])
+    async_ = inspect.signature(ASYNC[name])
+    for s, a in zip(sync.parameters.values(), async_.parameters.values()):
+        assert (s.name, s.kind, s.default) == (a.name, a.kind, a.default)
+        if name != "iter_pages":
+            # iter_pages takes list methods returning coroutines.
+            assert s.annotation == a.annotation
+    assert len(sync.parameters) == len(async_.parameters)
+
+    returns = sync.return_annotation
+    if returns is typing.Iterator:
+        returns = typing.AsyncIterator
+    elif typing.get_origin(returns) is typing.get_origin(typing.Iterator):
+        returns = typing.AsyncIterator[typing.get_args(returns)]
+    assert async_.return_annotation == returns
+
+
+@pytest.mark.parametrize("name", sorted(SYNC))
+def test_async_methods(name):
+    method = inspect.unwrap(ASYNC[name])
+    if name == "iter_pages":
+        assert inspect.isasyncgenfunction(method)
+    elif name.startswith("iter_"):
+        # Return the async generator of iter_pages.
+        assert not inspect.iscoroutinefunction(method)
+    else:
+        assert inspect.iscoroutinefunction(method)
+
+
+def sample(annotation):
+    """Return an argument value of the annotated type."""
+    args = typing.get_args(annotation)
+    if typing.get_origin(annotation) is typing.Union:
+        return sample(next(a for a in args if a is not type(None)))
+    if annotation is str:
+        return "x"
+    if annotation is bool:
+        return True
+    if annotation is int:
+        return 2
+    if annotation is float:
+        return 1.5
+    if annotation is datetime.date:
+        return datetime.date(2020, 1, 1)
+    if inspect.isclass(annotation) and issubclass(annotation, enum.Enum):
+        return next(iter(annotation))
+    if inspect.isclass(annotation) and issubclass(annotation, Model):
+        return annotation.model_construct()
+    raise TypeError(f"No sample value for {annotation}")
+
+
+def arguments(method) -> dict:
+    hints = typing.get_type_hints(method)
+    return {
+        name: sample(hints.get(name, str))
+        for name, parameter in inspect.signature(method).parameters.items()
+        if name != "self" and parameter.kind is parameter.POSITIONAL_OR_KEYWORD
+    }
+
+
+class Recorder:
+    """Transport handler recording the requests and answering 404."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(
+            (request.method, str(request.url), request.content.decode())
+        )
+        return httpx.Response(404, json={"detail": "Not found."})
+
+
+REQUEST_METHODS = sorted(name for name in SYNC if name not in ("close", "iter_pages"))
+
+
+@pytest.mark.parametrize("name", REQUEST_METHODS)
+def test_same_requests(name):
+    kwargs = arguments(SYNC[name])
+
+    sync = Recorder()
+    client = PapersWithCodeClient(
+        url=SERVER_URL, token="token", transport=httpx.MockTransport(sync)
+    )
+    with client, pytest.raises(Exception) as sync_error:
+        result = getattr(client, name)(**kwargs)
+        if name.startswith("iter_"):
+            list(result)
+
+    async_ = Recorder()
+
+    async def main():
+        async with AsyncPapersWithCodeClient(
+            url=SERVER_URL, token="token", transport=httpx.MockTransport(async_)
+        ) as client:
+            result = getattr(client, name)(**kwargs)
+            if name.startswith("iter_"):
+                return [item async for item in result]
+            return await result
+
+    with pytest.raises(Exception) as async_error:
+        asyncio.run(main())
+
+    # Both clients fail the same way, after the same requests.
+    assert async_error.type is sync_error.type
+    assert async_.requests == sync.requests
+    if sync_error.type is HttpClientError:
+        assert sync.requests
@@ -0,0 +1,96 @@
+import httpx
+import pytest
+
+from paperswithcode.ratelimit import RateLimiter, reset_delay
+
+NOW = 1_700_000_000.0
+
+
+class Clock:
+    """Fake monotonic and wall clocks advanced by the tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return NOW + self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def limiter(clock):
+    return RateLimiter(clock=clock.monotonic, wall_clock=clock.time)
+
+
+def response(status_code=200, **headers) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers={
+            f"X-Ratelimit-{name.title()}": str(value) for name, value in headers.items()
+        },
+    )
+
+
+def test_reset_delay():
+    assert reset_delay(None, NOW) is None
+    assert reset_delay(30, NOW) == 30
+    # Unix timestamps are converted to the time left until them.
+    assert reset_delay(NOW + 30, NOW) == 30
+    assert reset_delay(NOW - 30, NOW) == 0
+
+
+def test_learns_the_rate(limiter, clock):
+    assert limiter.acquire() == 0
+    # The first request is sent alone to learn the rate limit.
+    assert limiter.acquire() == RateLimiter.PROBE_INTERVAL
+    limiter.release(response(limit=10, remaining=9, reset=1))
+    assert limiter.rate == 10
+
+    for _ in range(9):
+        assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(0.1)
+    clock.now += 0.1
+    assert limiter.acquire() == 0
+
+
+def test_rate_limited(limiter, clock):
+    assert limiter.acquire() == 0
+    limiter.release(response(429, limit=10, remaining=0, reset=5, retry=2))
+    assert limiter.acquire() == 2
+    clock.now += 2
+    assert limiter.acquire() == 0
+
+
+def test_epoch_reset(limiter, clock):
+    assert limiter.acquire() == 0
+    limiter.release(response(limit=10, remaining=0, reset=int(NOW + 30)))
+    assert limiter.window == 30
+    assert limiter.acquire() == 30
+    clock.now += 30
+    assert limiter.acquire() == 0
+
+
+def test_wait_is_capped(limiter, clock):
+    assert limiter.acquire() == 0
+    limiter.release(response(429, limit=10, remaining=0, reset=10**6))
+    assert limiter.window == RateLimiter.MAX_WAIT
+    assert limiter.acquire() == RateLimiter.MAX_WAIT
+
+    # A far-off timestamp is capped as well.
+    clock.now += RateLimiter.MAX_WAIT
+    assert limiter.acquire() == 0
+    limiter.release(response(429, retry=int(NOW + 10**8)))
+    assert limiter.acquire() == RateLimiter.MAX_WAIT
+
+
+def test_past_epoch_does_not_block(limiter):
+    assert limiter.acquire() == 0
+    limiter.release(response(429, reset=int(NOW - 10)))
+    assert limiter.acquire() == 0
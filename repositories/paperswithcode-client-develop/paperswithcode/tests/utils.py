@@ -0,0 +1,76 @@
+import threading
+from typing import Callable, Optional
+
+import httpx
+
+SERVER_URL = "http://pwc.test"
+
+
+def paper(i: int) -> dict:
+    return {
+        "id": f"paper-{i}",
+        "arxiv_id": None,
+        "nips_id": None,
+        "url_abs": f"https://arxiv.org/abs/{i}",
+        "url_pdf": f"https://arxiv.org/pdf/{i}",
+        "title": f"Paper {i}",
+        "abstract": "",
+        "authors": [],
+        "published": "2020-01-01",
+        "conference": None,
+        "conference_url_abs": None,
+        "conference_url_pdf": None,
+        "proceeding": None,
+    }
+
+
+class Listing:
+    """Transport handler serving paginated listings like the API does.
+
+    Pages past the end are answered with 404. ``on_page`` is called with the
+    listing and the page number before a page is served, so tests can add or
+    remove items while a client iterates. If it returns a response, that
+    response is served instead of the page.
+
+    Args:
+        items: Items of the listings by path, e.g. ``{"/papers/": [...]}``.
+        on_page: Optional callback.
+    """
+
+    def __init__(self, items: dict, on_page: Optional[Callable] = None):
+        self.items = items
+        self.on_page = on_page
+        self.pages = []
+        self.lock = threading.Lock()
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path[len("/api/v1") :]
+        page = int(request.url.params.get("page", 1))
+        items_per_page = int(request.url.params.get("items_per_page", 50))
+        with self.lock:
+            self.pages.append((path, page))
+            if self.on_page is not None:
+                response = self.on_page(self, page)
+                if response is not None:
+                    return response
+            if path not in self.items:
+                return httpx.Response(404, json={"detail": "Not found."})
+            items = list(self.items[path])
+        if page > 1 and (page - 1) * items_per_page >= len(items):
+            return httpx.Response(404, json={"detail": "Invalid page."})
+        start = (page - 1) * items_per_page
+        end = start + items_per_page
+        url = f"{SERVER_URL}/api/v1{path}"
+        return httpx.Response(
+            200,
+            json={
+                "count": len(items),
+                "next": f"{url}?page={page + 1}" if end < len(items) else None,
+                "previous": f"{url}?page={page - 1}" if page > 1 else None,
+                "results": items[start:end],
+            },
+        )
@@ -34,6 +34,7 @@ setup(
     license="Apache-2.0",
     packages=find_packages(),
     install_requires=io.open("requirements.txt").read().splitlines(),
+    extras_require={"http2": ["httpx[http2]~=0.27.0"]},
     entry_points="""
         [console_scripts]
         pwc=paperswithcode.__main__:app
@@ -0,0 +1,85 @@
+"""Measure the startup time of the command line interface.
+
+Usage:
+    python benchmarks/bench_import.py [--max-ms MS] [-- ARGS ...]
+
+Runs `python -m sota_extractor ARGS` (default `--help`) in fresh
+interpreters and reports the best wall time, and how much of it is spent on
+top of a bare `python -c pass`. A run with `python -X importtime` breaks the
+import time down by top-level package. With `--max-ms` the script exits with
+an error if the startup overhead is over the budget, so it can guard the
+startup time in CI.
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+# "import time: self [us] | cumulative | imported package"
+IMPORT_TIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def best_time(args, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cp = subprocess.run(
+            [sys.executable, *args], cwd=ROOT, capture_output=True, text=True
+        )
+        timings.append(time.perf_counter() - start)
+        if cp.returncode != 0:
+            raise RuntimeError(cp.stderr)
+    return min(timings)
+
+
+def import_times(args):
+    """Return the cumulative import time of every top-level import in us."""
+    cp = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "sota_extractor", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    imports = {}
+    for line in cp.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        # Top-level imports only, their time includes the nested ones.
+        if match is not None and not match.group(2):
+            imports[match.group(3)] = int(match.group(1))
+    return imports
+
+
+def main(args):
+    baseline = best_time(["-c", "pass"], args.repeat)
+    elapsed = best_time(["-m", "sota_extractor", *args.args], args.repeat)
+    overhead = (elapsed - baseline) * 1e3
+
+    imports = import_times(args.args)
+    own = sum(
+        us for name, us in imports.items() if name.startswith("sota_extractor")
+    )
+    command = " ".join(["sota-extractor", *args.args])
+    print(f"{command}: {elapsed * 1e3:.1f}ms")
+    print(f"python -c pass: {baseline * 1e3:.1f}ms")
+    print(f"startup overhead: {overhead:.1f}ms")
+    print(f"sota_extractor imports: {own / 1e3:.1f}ms")
+    for name, us in sorted(imports.items(), key=lambda i: -i[1])[: args.top]:
+        print(f"  {name:30} {us / 1e3:8.1f}ms")
+
+    if args.max_ms is not None and overhead > args.max_ms:
+        print(f"Startup overhead over the budget of {args.max_ms:.0f}ms.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("args", nargs="*", default=["--help"])
+    main(parser.parse_args())
@@ -0,0 +1,76 @@
+"""Compare JSON backends on SOTA data files.
+
+Usage:
+    python benchmarks/bench_json.py [FILE ...]
+
+Defaults to `data/tasks/eff.json` and the Papers with Code evaluation tables
+dump (`../../data/evaluation-tables.json.gz`), if it is available.
+"""
+
+import io
+import os
+import sys
+import gzip
+import json
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sota_extractor import json_backend  # noqa: E402
+
+DEFAULT_FILES = [
+    "data/tasks/eff.json",
+    "../../data/evaluation-tables.json.gz",
+]
+
+
+def read(filename):
+    opener = gzip.open if filename.endswith(".gz") else io.open
+    with opener(filename, mode="rb") as fp:
+        return fp.read()
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def available_backends():
+    for name in json_backend.BACKENDS:
+        try:
+            yield json_backend.get_backend(name)
+        except ImportError:
+            print(f"{name}: not installed")
+
+
+def main(files, repeat=5):
+    backends = list(available_backends())
+    for filename in files:
+        try:
+            data = read(filename)
+            obj = json.loads(data)
+        except (OSError, ValueError) as e:
+            print(f"{filename}: skipped ({e})")
+            continue
+        reference = json.dumps(obj, indent=2, sort_keys=True)
+
+        print(f"\n{filename} ({len(data) / 1e6:.1f} MB)")
+        print(f"{'backend':10} {'loads':>10} {'dumps':>10} {'compat':>10}")
+        for backend in backends:
+            loads = best_of(lambda: backend.loads(data), repeat)
+            dumps = best_of(lambda: backend.dumps(obj, compat=False), repeat)
+            compat = best_of(lambda: backend.dumps(obj, compat=True), repeat)
+            stable = backend.dumps(obj, compat=True) == reference
+            print(
+                f"{backend.name:10} {loads * 1e3:8.1f}ms {dumps * 1e3:8.1f}ms "
+                f"{compat * 1e3:8.1f}ms"
+                + ("" if stable else "  (compat output differs!)")
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or DEFAULT_FILES)
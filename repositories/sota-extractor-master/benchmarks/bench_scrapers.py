@@ -0,0 +1,168 @@
+"""Time the parse phase of the scrapers on recorded responses.
+
+Usage:
+    python benchmarks/bench_scrapers.py [--cassette FILE] [--nlp-progress DIR]
+    python benchmarks/bench_scrapers.py --record [--cassette FILE]
+
+By default the parsers run on the small fixtures the tests replay
+(`sota_extractor/tests/fixtures`), so the benchmark runs offline. For
+realistic sizes `--record` runs the SQuAD, OGB and RedditSota scrapers
+against the network and records their responses into a cassette (default
+`benchmarks/fixtures/scrapers.json`), which is then replayed with
+`--cassette`. `--nlp-progress` times the NLP-progress parser on the markdown
+files of a local NLP-progress checkout instead of the fixture.
+
+For every parser the best time, the time per row and the peak memory
+allocated per row (measured with tracemalloc) are reported.
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import importlib
+import contextlib
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sota_extractor import scrapers  # noqa: E402
+from sota_extractor.errors import SotaError  # noqa: E402
+from sota_extractor.scrapers import session  # noqa: E402
+from sota_extractor.taskdb.v01 import TaskDB  # noqa: E402
+
+# The package exports the scraper functions under the module names.
+ogb, reddit, squad = (
+    importlib.import_module(f"sota_extractor.scrapers.{name}")
+    for name in ("ogb", "reddit", "squad")
+)
+
+FIXTURES = os.path.join(
+    os.path.dirname(__file__), "..", "sota_extractor", "tests", "fixtures"
+)
+CASSETTE = os.path.join(FIXTURES, "scrapers.json")
+NLP_PROGRESS = os.path.join(FIXTURES, "nlp_progress")
+RECORDED = os.path.join(os.path.dirname(__file__), "fixtures", "scrapers.json")
+
+
+def count_rows(tdb):
+    return sum(len(d.sota.rows) for d in tdb.iter_datasets())
+
+
+def squad_parser():
+    data = [
+        session.get(squad.SQUAD_1_1_JSON_URL).json(),
+        session.get(squad.SQUAD_2_0_JSON_URL).json(),
+    ]
+
+    def run():
+        return sum(len(squad.get_sota_rows(d)) for d in data)
+
+    return run
+
+
+def ogb_parser():
+    # Fetching is a lookup in the replayed cassette, the time is spent in
+    # parsing the pages and the tables.
+    def run():
+        return count_rows(ogb.ogb())
+
+    return run
+
+
+def reddit_parser():
+    md = session.get(reddit.REDITSOTA_URL).text
+    return lambda: count_rows(reddit.parse_readme(md))
+
+
+def nlp_progress_parser(directory):
+    from sota_extractor.scrapers.nlp_progress.markdown import parse_file
+
+    filenames = sorted(glob.glob(os.path.join(directory, "english", "*.md")))
+    if not filenames:
+        raise FileNotFoundError(f"No markdown files in {directory}/english")
+
+    def run():
+        tdb = TaskDB()
+        for filename in filenames:
+            for task in parse_file(filename).tasks.values():
+                tdb.add_task(task)
+        return count_rows(tdb)
+
+    return run
+
+
+def measure(run, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = run()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, min(timings), peak
+
+
+def record(cassette):
+    os.makedirs(os.path.dirname(os.path.abspath(cassette)), exist_ok=True)
+    with session.use_cassette(cassette, mode="record") as c:
+        for name in ("squad", "ogb", "reddit"):
+            tdb = scrapers.get_scraper(name)()
+            print(f"{name}: {count_rows(tdb)} rows")
+    print(f"Recorded {len(c.interactions)} responses into {cassette}")
+
+
+def main(args):
+    parsers = []
+    if os.path.exists(args.cassette):
+        parsers += [
+            ("squad", squad_parser),
+            ("ogb", ogb_parser),
+            ("reddit", reddit_parser),
+        ]
+    else:
+        print(f"{args.cassette} not found, run with --record first.")
+    parsers.append(
+        ("nlp_progress", lambda: nlp_progress_parser(args.nlp_progress))
+    )
+
+    print(
+        f"{'parser':14} {'rows':>6} {'best':>10} {'per row':>10} "
+        f"{'peak/row':>10}"
+    )
+    if os.path.exists(args.cassette):
+        cassette = session.use_cassette(args.cassette)
+    else:
+        cassette = contextlib.nullcontext()
+    with cassette:
+        for name, make_parser in parsers:
+            try:
+                rows, timing, peak = measure(make_parser(), args.repeat)
+            except (SotaError, OSError) as e:
+                print(f"{name:14} skipped ({e})")
+                continue
+            per_row = timing / max(rows, 1)
+            print(
+                f"{name:14} {rows:6d} {timing * 1e3:8.1f}ms "
+                f"{per_row * 1e6:8.1f}us {peak / max(rows, 1) / 1024:8.1f}KiB"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cassette", help="Cassette to record or replay.")
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument(
+        "--nlp-progress", default=NLP_PROGRESS, help="NLP-progress checkout."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    if args.record:
+        record(args.cassette or RECORDED)
+    else:
+        args.cassette = args.cassette or CASSETTE
+        main(args)
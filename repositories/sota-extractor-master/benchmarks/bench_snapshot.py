@@ -0,0 +1,74 @@
+"""Compare loading JSON task files with loading a binary snapshot.
+
+Usage:
+    python benchmarks/bench_snapshot.py [FILE ...]
+
+Defaults to all files in `data/tasks`.
+"""
+
+import os
+import sys
+import glob
+import time
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from sota_extractor.taskdb import TaskDB  # noqa: E402
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def load_json(files):
+    TaskDB().load_tasks(files)
+
+
+def load_snapshot(path, mmap):
+    tdb = TaskDB()
+    tdb.load_snapshot(path, mmap=mmap)
+    return tdb
+
+
+def touch_rows(tdb):
+    for dataset in tdb.iter_datasets():
+        for row in dataset.sota.rows:
+            row.metrics
+
+
+def main(files, repeat=5):
+    tdb = TaskDB()
+    tdb.load_tasks(files)
+    rows = sum(len(d.sota.rows) for d in tdb.iter_datasets())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "tasks.snapshot")
+        tdb.save_snapshot(path)
+        size = os.path.getsize(path)
+        reference = best_of(lambda: load_json(files), repeat)
+
+        print(f"{len(files)} files, {rows} rows, snapshot {size / 1e6:.1f} MB")
+        for name, func in [
+            ("load_tasks", lambda: load_json(files)),
+            ("snapshot", lambda: load_snapshot(path, mmap=False)),
+            ("snapshot mmap", lambda: load_snapshot(path, mmap=True)),
+            (
+                "snapshot mmap + rows",
+                lambda: touch_rows(load_snapshot(path, mmap=True)),
+            ),
+        ]:
+            timing = best_of(func, repeat)
+            print(
+                f"{name:22} {timing * 1e3:8.1f}ms "
+                f"{reference / timing:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or sorted(glob.glob("data/tasks/*.json")))
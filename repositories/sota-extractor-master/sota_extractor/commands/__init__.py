@@ -1,5 +1,35 @@
-__all__ = ["cli", "eff", "reddit", "snli", "squad", "evaluate"]
+__all__ = [
+    "cli",
+    "eff",
+    "reddit",
+    "snli",
+    "squad",
+    "all_sources",
+    "evaluate",
+    "merge",
+    "diff",
+    "patch",
+]
+
+import importlib
 
 from sota_extractor.commands.cli import cli
-from sota_extractor.commands.scrapers import eff, reddit, snli, squad
-from sota_extractor.commands.evaluate import evaluate
+
+# Exported commands are imported on first access, see `cli.COMMANDS`.
+_EXPORTS = {
+    "eff": "sota_extractor.commands.scrapers",
+    "reddit": "sota_extractor.commands.scrapers",
+    "snli": "sota_extractor.commands.scrapers",
+    "squad": "sota_extractor.commands.scrapers",
+    "all_sources": "sota_extractor.commands.scrapers",
+    "evaluate": "sota_extractor.commands.evaluate",
+    "merge": "sota_extractor.commands.taskdb",
+    "diff": "sota_extractor.commands.taskdb",
+    "patch": "sota_extractor.commands.taskdb",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name]), name)
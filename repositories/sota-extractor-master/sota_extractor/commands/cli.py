@@ -1,6 +1,58 @@
+import importlib
+from typing import Dict
+
 import click
 
+# Command name -> module that defines it. The modules are imported only when
+# one of their commands is looked up, so running a single command does not
+# pay for the dependencies of all the others.
+COMMANDS = {
+    "eff": "sota_extractor.commands.scrapers",
+    "reddit": "sota_extractor.commands.scrapers",
+    "snli": "sota_extractor.commands.scrapers",
+    "squad": "sota_extractor.commands.scrapers",
+    "cityscapes": "sota_extractor.commands.scrapers",
+    "nlp-progress": "sota_extractor.commands.scrapers",
+    "smcalflow": "sota_extractor.commands.scrapers",
+    "record": "sota_extractor.commands.scrapers",
+    "hotpotqa": "sota_extractor.commands.scrapers",
+    "coqa": "sota_extractor.commands.scrapers",
+    "chexpert": "sota_extractor.commands.scrapers",
+    "cmrc": "sota_extractor.commands.scrapers",
+    "xtreme": "sota_extractor.commands.scrapers",
+    "ogb": "sota_extractor.commands.scrapers",
+    "all": "sota_extractor.commands.scrapers",
+    "evaluate": "sota_extractor.commands.evaluate",
+    "merge": "sota_extractor.commands.taskdb",
+    "diff": "sota_extractor.commands.taskdb",
+    "patch": "sota_extractor.commands.taskdb",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports the modules of its commands on demand.
+
+    Commands still register themselves with the `cli.command()` decorator,
+    `commands` maps their names to the modules to import.
+
+    Args:
+        commands: Command name -> module defining the command.
+    """
+
+    def __init__(self, *args, commands: Dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = commands
+
+    def list_commands(self, ctx):
+        commands = set(super().list_commands(ctx)) | set(self.lazy_commands)
+        return sorted(commands)
+
+    def get_command(self, ctx, name):
+        if name not in self.commands and name in self.lazy_commands:
+            importlib.import_module(self.lazy_commands[name])
+        return super().get_command(ctx, name)
+
 
-@click.group()
+@click.group(cls=LazyGroup, commands=COMMANDS)
 def cli():
     pass
@@ -1,16 +1,20 @@
 import re
 import click
-import pandas as pd
-from typing import List, Dict
-from nltk.stem.porter import PorterStemmer
-from sota_extractor import serialization
+from typing import TYPE_CHECKING, List, Dict
 from sota_extractor.commands.cli import cli
 from sota_extractor.errors import catch_errors
-from sota_extractor.taskdb.v01 import Task, TaskDB
+
+# pandas and nltk are slow to import, they are only loaded when the
+# evaluation runs and not for every invocation of the cli.
+if TYPE_CHECKING:
+    from sota_extractor.taskdb.v01 import Task
 
 
 def load(tdb):
     # load the tasks and arxiv metadata
+    from nltk.stem.porter import PorterStemmer
+    from sota_extractor import serialization
+
     stemmer = PorterStemmer()
 
     tdb.load_tasks("data/tasks/nlpprogress.json")
@@ -35,7 +39,7 @@ def load(tdb):
     return arxiv
 
 
-def eval_task(predicted: List[Dict], task: Task):
+def eval_task(predicted: List[Dict], task: "Task"):
     """Get the precision and recall for a task, using any dataset.
 
     Args:
@@ -70,7 +74,7 @@ def eval_task(predicted: List[Dict], task: Task):
     return tp, fn, fp
 
 
-def article_matches(paper: Dict, task: Task):
+def article_matches(paper: Dict, task: "Task"):
     """Check if a paper mentions the tasks.
 
     By mentioning it in the title or abstract.
@@ -101,6 +105,8 @@ def article_matches(paper: Dict, task: Task):
 
 
 def eval_all(tdb, arxiv, output):
+    import pandas as pd
+
     sota_tasks = tdb.tasks_with_sota()
 
     df = pd.DataFrame(
@@ -164,6 +170,8 @@ def eval_all(tdb, arxiv, output):
 @catch_errors
 def evaluate(output):
     """Evaluate."""
+    from sota_extractor.taskdb.v01 import TaskDB
+
     tdb = TaskDB()
     arxiv = load(tdb)
     eval_all(tdb, arxiv, output)
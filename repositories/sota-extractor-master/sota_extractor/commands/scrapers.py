@@ -1,10 +1,54 @@
+import os
 import click
+import contextlib
+from typing import TYPE_CHECKING, Callable, Optional
 from sota_extractor import scrapers
-from sota_extractor.consts import Format
-from sota_extractor import serialization
+from sota_extractor.consts import CACHE_DIR, Format
 from sota_extractor.commands.cli import cli
 from sota_extractor.errors import catch_errors
 
+# Scrapers, the http session and the TaskDB are imported when a command
+# runs, listing the commands stays fast.
+if TYPE_CHECKING:
+    from sota_extractor.taskdb import TaskDB
+
+
+def write(tdb: "TaskDB", output: str, fmt: Format):
+    """Write the scraped tasks unless unchanged, and report the changes."""
+    from sota_extractor import serialization
+
+    patch = serialization.update(tdb=tdb, output=output, fmt=fmt)
+    if patch is None:
+        click.echo(f"{output}: unchanged")
+    else:
+        summary = ", ".join(f"{k}: {v}" for k, v in patch.summary().items())
+        click.echo(f"{output}: {summary}")
+
+
+cache_dir_option = click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=CACHE_DIR,
+    help="Cache directory, unchanged sources are not scraped again.",
+)
+
+
+def source_scraper(name: str, cache_dir: Optional[str]) -> Callable:
+    """Return the scraper of a source, cached in `cache_dir` if given.
+
+    See `cache.cached_scraper`, the shared HTTP session caches into the same
+    directory.
+    """
+    scraper = scrapers.get_scraper(name)
+    if not cache_dir:
+        return scraper
+
+    from sota_extractor.scrapers import session
+    from sota_extractor.scrapers.cache import cached_scraper
+
+    session.set_cache_dir(cache_dir)
+    return cached_scraper(name, scraper, cache_dir)
+
 
 @cli.command()
 @click.option(
@@ -22,10 +66,11 @@ from sota_extractor.errors import catch_errors
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def eff(output, fmt):
+def eff(output, fmt, cache_dir):
     """Extract EFF SOTA tables."""
-    serialization.dump(tdb=scrapers.eff(), output=output, fmt=fmt)
+    write(source_scraper("eff", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -44,10 +89,11 @@ def eff(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def reddit(output, fmt):
+def reddit(output, fmt, cache_dir):
     """Extract Reddit SOTA tables."""
-    serialization.dump(tdb=scrapers.reddit(), output=output, fmt=fmt)
+    write(source_scraper("reddit", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -66,10 +112,11 @@ def reddit(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def snli(output, fmt):
+def snli(output, fmt, cache_dir):
     """Extract SNLI SOTA tables."""
-    serialization.dump(tdb=scrapers.snli(), output=output, fmt=fmt)
+    write(source_scraper("snli", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -88,10 +135,11 @@ def snli(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def squad(output, fmt):
+def squad(output, fmt, cache_dir):
     """Extract SQUAD SOTA tables."""
-    serialization.dump(tdb=scrapers.squad(), output=output, fmt=fmt)
+    write(source_scraper("squad", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -110,10 +158,11 @@ def squad(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def cityscapes(output, fmt):
+def cityscapes(output, fmt, cache_dir):
     """Extract Cityscapes SOTA tables."""
-    serialization.dump(tdb=scrapers.cityscapes(), output=output, fmt=fmt)
+    write(source_scraper("cityscapes", cache_dir)(), output, fmt)
 
 
 @cli.command("nlp-progress")
@@ -132,10 +181,11 @@ def cityscapes(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def nlp_progress(output, fmt):
+def nlp_progress(output, fmt, cache_dir):
     """Extract NLP Progress SOTA tables."""
-    serialization.dump(tdb=scrapers.nlp_progress(), output=output, fmt=fmt)
+    write(source_scraper("nlp-progress", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -154,10 +204,11 @@ def nlp_progress(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def smcalflow(output, fmt):
+def smcalflow(output, fmt, cache_dir):
     """Extract Smcalflow SOTA tables."""
-    serialization.dump(tdb=scrapers.smcalflow(), output=output, fmt=fmt)
+    write(source_scraper("smcalflow", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -176,10 +227,11 @@ def smcalflow(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def record(output, fmt):
+def record(output, fmt, cache_dir):
     """Extract Record SOTA tables."""
-    serialization.dump(tdb=scrapers.record(), output=output, fmt=fmt)
+    write(source_scraper("record", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -198,10 +250,11 @@ def record(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def hotpotqa(output, fmt):
+def hotpotqa(output, fmt, cache_dir):
     """Extract hotpotqa SOTA tables."""
-    serialization.dump(tdb=scrapers.hotpotqa(), output=output, fmt=fmt)
+    write(source_scraper("hotpotqa", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -220,10 +273,11 @@ def hotpotqa(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def coqa(output, fmt):
+def coqa(output, fmt, cache_dir):
     """Extract coqa SOTA tables."""
-    serialization.dump(tdb=scrapers.coqa(), output=output, fmt=fmt)
+    write(source_scraper("coqa", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -242,10 +296,11 @@ def coqa(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def chexpert(output, fmt):
+def chexpert(output, fmt, cache_dir):
     """Extract chexpert SOTA tables."""
-    serialization.dump(tdb=scrapers.chexpert(), output=output, fmt=fmt)
+    write(source_scraper("chexpert", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -264,10 +319,11 @@ def chexpert(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def cmrc(output, fmt):
+def cmrc(output, fmt, cache_dir):
     """Extract cmrc SOTA tables."""
-    serialization.dump(tdb=scrapers.cmrc(), output=output, fmt=fmt)
+    write(source_scraper("cmrc", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -286,10 +342,11 @@ def cmrc(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def xtreme(output, fmt):
+def xtreme(output, fmt, cache_dir):
     """Extract Xtreme SOTA tables."""
-    serialization.dump(tdb=scrapers.xtreme(), output=output, fmt=fmt)
+    write(source_scraper("xtreme", cache_dir)(), output, fmt)
 
 
 @cli.command()
@@ -308,7 +365,130 @@ def xtreme(output, fmt):
     default=Format.json,
     help="Output format.",
 )
+@cache_dir_option
 @catch_errors
-def ogb(output, fmt):
+def ogb(output, fmt, cache_dir):
     """Extract OGB SOTA tables."""
-    serialization.dump(tdb=scrapers.ogb(), output=output, fmt=fmt)
+    write(source_scraper("ogb", cache_dir)(), output, fmt)
+
+
+@cli.command("all")
+@click.option(
+    "-s",
+    "--source",
+    "sources",
+    type=click.Choice(list(scrapers.SOURCES)),
+    multiple=True,
+    help="Source to scrape, can be repeated. Defaults to all sources.",
+)
+@click.option(
+    "-d",
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default="data/tasks",
+    help="Directory for the per-source output files.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(exists=False),
+    required=False,
+    default="data/tasks/all.json",
+    help="Output filename of the merged data.",
+)
+@click.option(
+    "-f",
+    "--fmt",
+    type=click.Choice(Format),
+    default=Format.json,
+    help="Output format.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=4,
+    help="Number of sources scraped at the same time.",
+)
+@click.option(
+    "-t",
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=600,
+    help="Timeout in seconds for each source.",
+)
+@cache_dir_option
+@click.option(
+    "--cassette",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Replay HTTP responses from this file instead of the network.",
+)
+@click.option(
+    "--record",
+    is_flag=True,
+    help="Record HTTP responses into the cassette instead of replaying.",
+)
+@click.pass_context
+@catch_errors
+def all_sources(
+    ctx,
+    sources,
+    output_dir,
+    output,
+    fmt,
+    jobs,
+    timeout,
+    cache_dir,
+    cassette,
+    record,
+):
+    """Run all scrapers concurrently and merge their SOTA tables.
+
+    Exits with status 1 if any source failed, the others are still merged.
+    """
+    from sota_extractor.scrapers import session
+    from sota_extractor.taskdb import TaskDB
+
+    sources = sources or list(scrapers.SOURCES)
+    os.makedirs(output_dir, exist_ok=True)
+    extension = ".gz" if fmt == Format.json_gz else ""
+
+    to_run = {name: source_scraper(name, cache_dir) for name in sources}
+    if cassette is None:
+        recording = contextlib.nullcontext()
+    else:
+        mode = "record" if record else "replay"
+        recording = session.use_cassette(cassette, mode=mode)
+
+    results = {}
+    with recording:
+        for result in scrapers.run_scrapers(
+            to_run, jobs=jobs, timeout=timeout
+        ):
+            if result.ok:
+                filename = os.path.join(
+                    output_dir, scrapers.SOURCES[result.name][1] + extension
+                )
+                results[result.name] = result.tdb
+                click.echo(
+                    f"{result.name}: {len(result.tdb.tasks)} tasks scraped in "
+                    f"{result.elapsed:.1f}s"
+                )
+                write(result.tdb, filename, fmt)
+            else:
+                click.secho(f"{result.name}: {result.error!r}", fg="red")
+
+    # Merge in source order, so the output does not depend on timing.
+    tdb = TaskDB()
+    for name in sources:
+        if name in results:
+            tdb.merge(results[name])
+    write(tdb, output, fmt)
+    failed = [name for name in sources if name not in results]
+    click.echo(
+        f"Merged {len(results)} of {len(sources)} sources into {output}."
+    )
+    if failed:
+        click.secho(f"Failed: {', '.join(failed)}", fg="red")
+        ctx.exit(1)
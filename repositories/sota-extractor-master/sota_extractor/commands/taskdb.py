@@ -0,0 +1,95 @@
+import io
+import click
+from sota_extractor.consts import Format
+from sota_extractor import json_backend
+from sota_extractor.commands.cli import cli
+from sota_extractor.errors import catch_errors
+
+
+@cli.command()
+@click.argument("files", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(exists=False),
+    required=False,
+    default="data/tasks/merged.json",
+    help="Output filename.",
+)
+@click.option(
+    "-f",
+    "--fmt",
+    type=click.Choice(Format),
+    default=Format.json,
+    help="Output format.",
+)
+@catch_errors
+def merge(files, output, fmt):
+    """Merge SOTA files into one, skipping duplicate rows."""
+    from sota_extractor import serialization
+    from sota_extractor.taskdb import TaskDB
+
+    tdb = TaskDB()
+    for filename in files:
+        other = TaskDB()
+        other.load_tasks(filename)
+        report = tdb.merge(other)
+        click.echo(f"{filename}: {report}")
+    serialization.dump(tdb=tdb, output=output, fmt=fmt)
+
+
+@cli.command()
+@click.argument("old", type=click.Path(exists=True))
+@click.argument("new", type=click.Path(exists=True))
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(exists=False),
+    required=False,
+    default="data/tasks/patch.json",
+    help="Output filename.",
+)
+@catch_errors
+def diff(old, new, output):
+    """Write the patch that turns the OLD SOTA file into the NEW one."""
+    from sota_extractor.taskdb import TaskDB
+
+    old_tdb, new_tdb = TaskDB(), TaskDB()
+    old_tdb.load_tasks(old)
+    new_tdb.load_tasks(new)
+    patch = old_tdb.diff(new_tdb)
+    summary = ", ".join(f"{k}: {v}" for k, v in patch.summary().items())
+    click.echo(f"{len(patch)} operations ({summary})")
+    with io.open(output, mode="w", encoding="utf-8") as fp:
+        fp.write(json_backend.dumps(patch.to_dict()))
+
+
+@cli.command()
+@click.argument("file", type=click.Path(exists=True))
+@click.argument("patch_file", type=click.Path(exists=True))
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(exists=False),
+    required=False,
+    default=None,
+    help="Output filename, defaults to FILE.",
+)
+@click.option(
+    "-f",
+    "--fmt",
+    type=click.Choice(Format),
+    default=Format.json,
+    help="Output format.",
+)
+@catch_errors
+def patch(file, patch_file, output, fmt):
+    """Apply a patch written by the diff command to a SOTA file."""
+    from sota_extractor import serialization
+    from sota_extractor.taskdb import TaskDB
+    from sota_extractor.taskdb.v01.diff import Patch
+
+    tdb = TaskDB()
+    tdb.load_tasks(file)
+    tdb.apply(Patch.from_dict(serialization.load(patch_file)))
+    serialization.dump(tdb=tdb, output=output or file, fmt=fmt)
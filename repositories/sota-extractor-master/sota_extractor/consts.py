@@ -4,6 +4,26 @@ import enum
 
 DEBUG = os.environ.get("SOTA_EXTRACTOR_DEBUG", "false").lower() == "true"
 
+# JSON backend: "auto", "orjson", "msgspec" or "json".
+JSON_BACKEND = os.environ.get("SOTA_EXTRACTOR_JSON_BACKEND", "auto").lower()
+# Keep the output byte-identical to `json.dumps(indent=2, sort_keys=True)`.
+JSON_COMPAT = (
+    os.environ.get("SOTA_EXTRACTOR_JSON_COMPAT", "true").lower() == "true"
+)
+
+# Shared HTTP session used by the scrapers.
+HTTP_TIMEOUT = float(os.environ.get("SOTA_EXTRACTOR_HTTP_TIMEOUT", "30"))
+HTTP_RETRIES = int(os.environ.get("SOTA_EXTRACTOR_HTTP_RETRIES", "3"))
+# Base delay in seconds of the exponential backoff between retries.
+HTTP_BACKOFF = float(os.environ.get("SOTA_EXTRACTOR_HTTP_BACKOFF", "0.5"))
+# Maximum number of concurrent requests (and pooled connections) per host.
+HTTP_MAX_PER_HOST = int(
+    os.environ.get("SOTA_EXTRACTOR_HTTP_MAX_PER_HOST", "4")
+)
+
+# Directory of the HTTP and scraper caches, empty disables caching.
+CACHE_DIR = os.environ.get("SOTA_EXTRACTOR_CACHE_DIR") or None
+
 
 class Format(str, enum.Enum):
     """Output format.
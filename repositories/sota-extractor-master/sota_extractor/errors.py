@@ -1,10 +1,13 @@
 import click
 import logging
 import functools
-from requests import Response
+from typing import TYPE_CHECKING
 
 from sota_extractor.consts import DEBUG
 
+if TYPE_CHECKING:
+    from requests import Response
+
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +37,7 @@ class ArgumentError(SotaError):
 class HttpClientError(SotaError):
     def __init__(self, message, response=None):
         super().__init__(message)
-        self.response: Response = response
+        self.response: "Response" = response
         self.status_code = (
             response.status_code if response is not None else 500
         )
@@ -59,6 +62,8 @@ def catch_errors(func):
     def wrapper(*args, **kwargs):
         try:
             func(*args, **kwargs)
+        except click.exceptions.Exit:
+            raise
         except SotaError as e:
             click.secho(str(e), fg="red")
         except Exception as e:
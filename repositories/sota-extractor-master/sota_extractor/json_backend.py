@@ -0,0 +1,195 @@
+"""Pluggable JSON backends.
+
+orjson or msgspec are used when installed, the standard library `json`
+module otherwise. The backend can be forced with the
+`SOTA_EXTRACTOR_JSON_BACKEND` environment variable.
+
+All backends render JSON with sorted keys and 2-space indent. In
+compatibility mode (the default, see `SOTA_EXTRACTOR_JSON_COMPAT`) the
+output is byte-identical to `json.dumps(obj, indent=2, sort_keys=True)`:
+non-ASCII characters are escaped, and whenever the fast backend could
+render something differently (floats in exponent notation, NaN, integers
+over 64 bits, unsupported types) the standard library is used instead.
+"""
+
+import re
+import json
+import codecs
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, Optional, Union
+
+from sota_extractor import consts
+from sota_extractor.errors import ArgumentError
+
+# Floats that fast backends format differently from `repr`: exponents
+# ("1e16" vs "1e+16", "1e-7" vs "1e-07") and small numbers ("0.00001" vs
+# "1e-05"). In indented output a number is either an object value, an
+# array item on its own line or the whole document. Each search pattern
+# starts with a literal, which keeps the search fast; matches inside strings
+# only cause an unnecessary fallback.
+_UNSTABLE_FLOAT = r" *-?(?:\d+(?:\.\d+)?[eE]|0\.0000)"
+_UNSTABLE_FLOATS = [
+    re.compile(prefix + _UNSTABLE_FLOAT) for prefix in ('": ', r"\[\n", r",\n")
+]
+_UNSTABLE_DOCUMENT = re.compile(_UNSTABLE_FLOAT)
+
+
+def _ascii_escape(error: UnicodeEncodeError):
+    chunk = error.object[error.start : error.end]
+    return encode_basestring_ascii(chunk)[1:-1], error.end
+
+
+# Escape non-ASCII characters exactly like `json.dumps(ensure_ascii=True)`
+# ("\u00e9", surrogate pairs for astral characters) while encoding.
+codecs.register_error("sota_extractor.json", _ascii_escape)
+
+
+class JsonBackend:
+    """Standard library backend, also the reference for the other ones."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Deserialize a JSON document."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any, compat: bool = True) -> str:
+        """Serialize with sorted keys and 2-space indent."""
+        return json.dumps(obj, indent=2, sort_keys=True)
+
+    def _stable(self, obj: Any, text: str) -> Optional[str]:
+        """Make fast backend output byte-identical to the stdlib output.
+
+        Returns `None` if that can't be guaranteed.
+        """
+        if _UNSTABLE_DOCUMENT.match(text) or any(
+            pattern.search(text) for pattern in _UNSTABLE_FLOATS
+        ):
+            return None
+        # NaN and infinity are rendered as null, catch them by comparing
+        # the decoded output (NaN is never equal to itself).
+        if self.loads(text) != obj:
+            return None
+        if not text.isascii():
+            text = text.encode("ascii", "sota_extractor.json").decode("ascii")
+        # DEL is ASCII, but escaped by the standard library too.
+        return text.replace("\x7f", "\\u007f")
+
+
+class OrjsonBackend(JsonBackend):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.orjson = orjson
+        self.option = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self.orjson.loads(data)
+        except self.orjson.JSONDecodeError:
+            # NaN and Infinity literals are accepted only by the stdlib.
+            return json.loads(data)
+
+    def dumps(self, obj: Any, compat: bool = True) -> str:
+        try:
+            text = self.orjson.dumps(obj, option=self.option).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj)
+        if compat:
+            stable = self._stable(obj, text)
+            return super().dumps(obj) if stable is None else stable
+        return text
+
+
+class MsgspecBackend(JsonBackend):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self.msgspec = msgspec
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self.msgspec.json.decode(data)
+        except self.msgspec.DecodeError:
+            return json.loads(data)
+
+    def dumps(self, obj: Any, compat: bool = True) -> str:
+        try:
+            raw = self.msgspec.json.encode(obj, order="sorted")
+        except (TypeError, ValueError, self.msgspec.EncodeError):
+            return super().dumps(obj)
+        text = self.msgspec.json.format(raw, indent=2).decode("utf-8")
+        if compat:
+            stable = self._stable(obj, text)
+            return super().dumps(obj) if stable is None else stable
+        return text
+
+
+BACKENDS = {
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+    "json": JsonBackend,
+}
+
+_backends: Dict[str, JsonBackend] = {}
+
+
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """Get a JSON backend by name.
+
+    Args:
+        name: One of "orjson", "msgspec", "json" or "auto". Defaults to the
+            `SOTA_EXTRACTOR_JSON_BACKEND` environment variable. "auto" picks
+            the first installed backend in that order.
+    """
+    name = (name or consts.JSON_BACKEND).lower()
+    if name in _backends:
+        return _backends[name]
+
+    if name == "auto":
+        candidates = list(BACKENDS)
+    elif name in BACKENDS:
+        candidates = [name]
+    else:
+        raise ArgumentError(f"Unknown JSON backend: {name}")
+
+    for candidate in candidates:
+        try:
+            backend = BACKENDS[candidate]()
+        except ImportError:
+            if name != "auto":
+                raise
+            continue
+        _backends[name] = backend
+        return backend
+
+
+def loads(data: Union[bytes, str], backend: Optional[str] = None) -> Any:
+    """Deserialize a JSON document with the selected backend."""
+    return get_backend(backend).loads(data)
+
+
+def dumps(
+    obj: Any, compat: Optional[bool] = None, backend: Optional[str] = None
+) -> str:
+    """Serialize to JSON with sorted keys and 2-space indent.
+
+    Args:
+        obj: Object to serialize.
+        compat: Keep the output byte-identical to the standard library.
+            Defaults to the `SOTA_EXTRACTOR_JSON_COMPAT` environment variable.
+        backend: Backend name, see `get_backend`.
+    """
+    if compat is None:
+        compat = consts.JSON_COMPAT
+    return get_backend(backend).dumps(obj, compat=compat)
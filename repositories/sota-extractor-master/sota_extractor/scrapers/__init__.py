@@ -13,20 +13,87 @@ __all__ = [
     "smcalflow",
     "xtreme",
     "ogb",
+    "SOURCES",
+    "get_scraper",
+    "run_scrapers",
 ]
 
+import sys
+import types
+import importlib
+from typing import TYPE_CHECKING, Callable
 
-from sota_extractor.scrapers.eff import eff
-from sota_extractor.scrapers.snli import snli
-from sota_extractor.scrapers.squad import squad
-from sota_extractor.scrapers.reddit import reddit
-from sota_extractor.scrapers.cityscapes import cityscapes
-from sota_extractor.scrapers.nlp_progress import nlp_progress
-from sota_extractor.scrapers.coqa import coqa
-from sota_extractor.scrapers.chexpert import chexpert
-from sota_extractor.scrapers.cmrc import cmrc
-from sota_extractor.scrapers.record import record
-from sota_extractor.scrapers.hotpotqa import hotpotqa
-from sota_extractor.scrapers.smcalflow import smcalflow
-from sota_extractor.scrapers.xtreme import xtreme
-from sota_extractor.scrapers.ogb import ogb
+if TYPE_CHECKING:
+    from sota_extractor.taskdb.v01 import TaskDB
+
+# Source name (as used by the CLI) -> (scraper, default output filename).
+# Scrapers are named after their modules, which are imported by `get_scraper`
+# on first use: together they depend on requests, lxml, bs4, markdown and
+# pytz, which a single scraper run (or `--help`) should not have to load.
+SOURCES = {
+    "eff": ("eff", "eff.json"),
+    "reddit": ("reddit", "redditsota.json"),
+    "snli": ("snli", "snli.json"),
+    "squad": ("squad", "squad.json"),
+    "cityscapes": ("cityscapes", "cityscapes.json"),
+    "nlp-progress": ("nlp_progress", "nlp-progress.json"),
+    "smcalflow": ("smcalflow", "smcalflow.json"),
+    "record": ("record", "record.json"),
+    "hotpotqa": ("hotpotqa", "hotpotqa.json"),
+    "coqa": ("coqa", "coqa.json"),
+    "chexpert": ("chexpert", "chexpert.json"),
+    "cmrc": ("cmrc", "cmrc.json"),
+    "xtreme": ("xtreme", "xtreme.json"),
+    "ogb": ("ogb", "ogb.json"),
+}
+
+
+def get_scraper(name: str) -> Callable[..., "TaskDB"]:
+    """Import and return the scraper of a source.
+
+    Args:
+        name: Source name, a key of `SOURCES`.
+    """
+    scraper = SOURCES[name][0]
+    module = importlib.import_module(f"{__name__}.{scraper}")
+    function = globals()[scraper] = getattr(module, scraper)
+    return function
+
+
+_SCRAPERS = {scraper for scraper, _ in SOURCES.values()}
+
+
+class _ScrapersModule(types.ModuleType):
+    """Package module that exports the scrapers, not their submodules.
+
+    Scrapers are named after their submodules, and the import system binds
+    a submodule to the package attribute of the same name once it is loaded,
+    whichever way it is imported. The scraper function is bound in its
+    place, so `scrapers.<name>` is always the function, as it was before the
+    scrapers were imported lazily.
+    """
+
+    def __setattr__(self, name, value):
+        if (
+            name in _SCRAPERS
+            and isinstance(value, types.ModuleType)
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ScrapersModule
+
+
+def __getattr__(name):
+    # `scrapers.<name>` resolves to the scraper function on first access.
+    if name == "run_scrapers":
+        from sota_extractor.scrapers.runner import run_scrapers
+
+        return run_scrapers
+    if name in _SCRAPERS:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
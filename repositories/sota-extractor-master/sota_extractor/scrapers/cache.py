@@ -0,0 +1,258 @@
+import os
+import sys
+import glob
+import json
+import logging
+import hashlib
+import inspect
+import importlib.util
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from sota_extractor import json_backend
+from sota_extractor.taskdb.v01 import TaskDB
+
+logger = logging.getLogger(__name__)
+
+# Response headers kept in the cache.
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def atomic_write(path: str, data: bytes):
+    """Atomically replace the file at `path`."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fp:
+        fp.write(data)
+    os.replace(tmp, path)
+
+
+class HttpCache:
+    """On-disk cache of GET responses validated with conditional requests.
+
+    Responses that carry an `ETag` or `Last-Modified` header are stored
+    together with those validators. The next request for the same url sends
+    `If-None-Match` / `If-Modified-Since` and, if the server answers with
+    304 Not Modified, the cached body is served instead.
+
+    Every entry is a single file: one line of JSON metadata followed by the
+    raw body.
+
+    Args:
+        directory: Cache directory, created when needed.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, "http", _digest(url))
+
+    def load(self, url: str) -> Optional[Dict]:
+        """Return the cached metadata and body of the url, if any."""
+        try:
+            with open(self._path(url), "rb") as fp:
+                meta, body = fp.read().split(b"\n", 1)
+            meta = json.loads(meta)
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        meta["body"] = body
+        return meta
+
+    def conditional_headers(self, entry: Dict) -> Dict[str, str]:
+        headers = {}
+        if entry["headers"].get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    def store(self, url: str, response: requests.Response):
+        """Cache a successful response if it can be validated later."""
+        if response.status_code != 200 or not (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            return
+        meta = {
+            "url": url,
+            "encoding": response.encoding,
+            "headers": {
+                name: response.headers[name]
+                for name in CACHED_HEADERS
+                if name in response.headers
+            },
+        }
+        try:
+            atomic_write(
+                self._path(url),
+                json.dumps(meta).encode("utf-8") + b"\n" + response.content,
+            )
+        except OSError as e:
+            logger.warning("Could not cache %s: %s", url, e)
+
+    def response(
+        self, entry: Dict, not_modified: requests.Response
+    ) -> requests.Response:
+        """Build the response for a 304 answer from the cached entry."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = not_modified.url
+        response.encoding = entry["encoding"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"]
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        return response
+
+
+class FragmentCache:
+    """Cache of the TaskDB produced by each scraper.
+
+    Next to the scraped tasks, a fragment records the urls the scraper
+    fetched. If all of them are still answered from the HTTP cache (304 Not
+    Modified) the fragment is returned and the scraper does not run at all.
+
+    Args:
+        directory: Cache directory, created when needed.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, "fragments", f"{name}.json")
+
+    def load(self, name: str, version: str) -> Optional[Dict]:
+        try:
+            with open(self._path(name), "rb") as fp:
+                fragment = json_backend.loads(fp.read())
+        except (OSError, ValueError):
+            return None
+        if fragment.get("version") != version:
+            return None
+        return fragment
+
+    def store(self, name: str, version: str, urls, tdb: TaskDB):
+        fragment = {"version": version, "urls": urls, "tasks": tdb.export()}
+        try:
+            atomic_write(
+                self._path(name),
+                json_backend.dumps(fragment, compat=False).encode("utf-8"),
+            )
+        except OSError as e:
+            logger.warning("Could not cache the %s fragment: %s", name, e)
+
+
+# Bump to invalidate all cached fragments, e.g. when scrapers change in a way
+# the hashed sources below don't cover.
+PARSER_VERSION = 1
+
+# Modules shared by the scrapers whose changes can change their output.
+SHARED_MODULES = (
+    "sota_extractor.consts",
+    "sota_extractor.scrapers.tables",
+    "sota_extractor.scrapers.utils",
+    "sota_extractor.taskdb.v01.models",
+    "sota_extractor.taskdb.v01.schemas",
+)
+
+
+def _source_files(scraper: Callable) -> List[str]:
+    """Return the source files of the scraper and the code it relies on.
+
+    A scraper in its own subpackage (e.g. nlp_progress) has all of the
+    subpackage's modules hashed.
+    """
+    files = []
+    for name in SHARED_MODULES:
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.origin is not None:
+            files.append(spec.origin)
+    try:
+        source = inspect.getsourcefile(scraper)
+    except TypeError:
+        source = None
+    if source is not None:
+        module = sys.modules.get(scraper.__module__)
+        package = getattr(module, "__package__", None)
+        if package and package != __package__:
+            directory = os.path.dirname(source)
+            files.extend(sorted(glob.glob(os.path.join(directory, "*.py"))))
+        else:
+            files.append(source)
+    return files
+
+
+def _version(scraper: Callable) -> str:
+    """Hash the parsing code, so code changes invalidate fragments."""
+    name = f"{scraper.__module__}.{scraper.__qualname__}"
+    digest = hashlib.blake2b(
+        f"{PARSER_VERSION}:{name}".encode("utf-8"), digest_size=16
+    )
+    for filename in _source_files(scraper):
+        try:
+            with open(filename, "rb") as fp:
+                digest.update(fp.read())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def cached_scraper(
+    name: str, scraper: Callable[[], TaskDB], directory: str
+) -> Callable[[], TaskDB]:
+    """Wrap a scraper so that unchanged sources are not parsed again.
+
+    The wrapped scraper first revalidates every url the previous run
+    fetched. If none of them changed, the TaskDB of the previous run is
+    loaded from the cache, otherwise the scraper runs and its result is
+    cached. Scrapers that fetch nothing through the shared session (e.g.
+    git checkouts) always run.
+
+    The shared session must cache into the same directory, see
+    `session.set_cache_dir`.
+
+    Args:
+        name: Source name, used as the cache key.
+        scraper: Scraper function.
+        directory: Cache directory.
+    """
+    # Imported here, the session module imports this one.
+    from sota_extractor.scrapers import session
+
+    fragments = FragmentCache(directory)
+    version = _version(scraper)
+
+    def run() -> TaskDB:
+        fragment = fragments.load(name, version)
+        if fragment is not None and fragment["urls"]:
+            try:
+                unchanged = all(
+                    getattr(session.get(url), "from_cache", False)
+                    for url in fragment["urls"]
+                )
+            except requests.RequestException:
+                unchanged = False
+            if unchanged:
+                logger.info("%s: not modified, using the cached data.", name)
+                tdb = TaskDB()
+                tdb.load_tasks(data=fragment["tasks"])
+                return tdb
+
+        with session.record() as urls:
+            tdb = scraper()
+        if urls:
+            fragments.store(name, version, urls, tdb)
+        return tdb
+
+    return run
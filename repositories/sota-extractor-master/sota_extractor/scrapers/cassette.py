@@ -0,0 +1,116 @@
+import io
+import base64
+import threading
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from sota_extractor import json_backend
+from sota_extractor.errors import DataError, HttpClientError
+
+VERSION = 1
+RECORD = "record"
+REPLAY = "replay"
+# The recorded body is already decoded.
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class Cassette:
+    """Recorded HTTP responses of the scrapers.
+
+    In record mode every response returned by the shared session is kept
+    and written to a JSON file by `save`. In replay mode no request reaches
+    the network, responses are served from the file instead.
+
+    Responses are matched by method and url. If the same url was requested
+    several times the recorded responses are replayed in the same order and
+    the last one is repeated, so concurrent scrapers replay
+    deterministically.
+
+    Args:
+        path: Path of the cassette file.
+        mode: Either "record" or "replay".
+    """
+
+    def __init__(self, path: str, mode: str = REPLAY):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.interactions: List[Dict] = []
+        self._lock = threading.Lock()
+        self._queues: Dict[Tuple[str, str], Deque[Dict]] = defaultdict(deque)
+        if mode == REPLAY:
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def _load(self):
+        try:
+            with io.open(self.path, "rb") as fp:
+                data = json_backend.loads(fp.read())
+        except (OSError, ValueError) as e:
+            raise DataError(f"Could not read the cassette {self.path}: {e}")
+        if data.get("version") != VERSION:
+            raise DataError(f"Unsupported cassette version in {self.path}.")
+        self.interactions = data["interactions"]
+        for interaction in self.interactions:
+            key = (interaction["method"], interaction["url"])
+            self._queues[key].append(interaction)
+
+    def append(self, method: str, url: str, response: requests.Response):
+        """Record a response."""
+        body = response.content
+        interaction = {
+            "method": method.upper(),
+            "url": url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "encoding": response.encoding,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+        }
+        try:
+            interaction["text"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["base64"] = base64.b64encode(body).decode("ascii")
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def replay(self, method: str, url: str) -> requests.Response:
+        """Return the next recorded response for the request."""
+        key = (method.upper(), url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise HttpClientError(
+                    f"No recorded response for {key[0]} {url} in "
+                    f"{self.path}."
+                )
+            interaction = queue.popleft() if len(queue) > 1 else queue[0]
+
+        response = requests.Response()
+        response.status_code = interaction["status_code"]
+        response.reason = interaction["reason"]
+        response.url = url
+        response.encoding = interaction["encoding"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        if "text" in interaction:
+            response._content = interaction["text"].encode("utf-8")
+        else:
+            response._content = base64.b64decode(interaction["base64"])
+        return response
+
+    def save(self):
+        """Write the recorded responses to the cassette file."""
+        with self._lock:
+            data = {"version": VERSION, "interactions": self.interactions}
+            with io.open(self.path, "w", encoding="utf-8") as fp:
+                fp.write(json_backend.dumps(data))
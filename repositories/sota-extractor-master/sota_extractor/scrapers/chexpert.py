@@ -1,5 +1,4 @@
-import requests
-
+from sota_extractor.scrapers import session
 from sota_extractor.errors import HttpClientError
 from sota_extractor.scrapers.utils import date_from_timestamp, sround
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
@@ -76,7 +75,7 @@ def get_sota_rows(data):
 def chexpert() -> TaskDB:
     """Extract CheXpert SOTA tables."""
     try:
-        data = requests.get(JSON_URL).json()
+        data = session.get(JSON_URL).json()
     except Exception as e:
         raise HttpClientError(message=str(e))
 
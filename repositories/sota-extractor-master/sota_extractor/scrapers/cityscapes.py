@@ -1,5 +1,9 @@
 from sota_extractor.errors import DataError
-from sota_extractor.scrapers.utils import get_soup
+from sota_extractor.scrapers.tables import (
+    get_html,
+    table_rows,
+    tables_by_class,
+)
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
 
 CITYSCAPES_URL = (
@@ -15,27 +19,22 @@ DATASET_DESCRIPTION = (
     "or boundary information."
 )
 
+SOTA_TABLES = tables_by_class("tablepress")
 
-def get_sota_rows(table):
-    rows = table.findAll("tr")
 
+def get_sota_rows(table):
     sota_rows = []
-    for row in rows:
-        if row.find("th"):
+    for row in table_rows(table):
+        if row.header:
             # Skip the header row
             continue
-        cells = row.findAll("td")
-        if len(cells) == 24:
-            model_name = row.find("td", attrs={"class": "column-1"}).text
-            paper_title = row.find("td", attrs={"class": "column-21"}).text
-            if row.find("td", attrs={"class": "column-21"}).a:
-                paper_url = row.find("td", attrs={"class": "column-21"}).a[
-                    "href"
-                ]
-            else:
-                paper_url = None
-            class_iou = row.find("td", attrs={"class": "column-14"}).text
-            category_iou = row.find("td", attrs={"class": "column-16"}).text
+        if len(row.cells) == 24:
+            model_name = row.by_class("column-1").text
+            paper = row.by_class("column-21")
+            paper_title = paper.text
+            paper_url = paper.link()
+            class_iou = row.by_class("column-14").text
+            category_iou = row.by_class("column-16").text
 
             if paper_title and class_iou and category_iou:
                 sota_row = SotaRow(
@@ -55,9 +54,9 @@ def get_sota_rows(table):
 
 def cityscapes() -> TaskDB:
     """Extract Cityscapes SOTA tables."""
-    soup = get_soup(CITYSCAPES_URL)
+    root = get_html(CITYSCAPES_URL)
 
-    sota_tabels = soup.findAll("table", attrs={"class": "tablepress"})
+    sota_tabels = SOTA_TABLES(root)
 
     if len(sota_tabels) == 3:
 
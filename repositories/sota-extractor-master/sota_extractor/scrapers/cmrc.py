@@ -1,7 +1,6 @@
 from datetime import datetime
 
-import requests
-
+from sota_extractor.scrapers import session
 from sota_extractor.scrapers.utils import sround
 from sota_extractor.errors import HttpClientError
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
@@ -99,8 +98,8 @@ def get_sota_rows(data):
 def cmrc() -> TaskDB:
     """Extract CMRC SOTA tables."""
     try:
-        cmrc_2018 = requests.get(CMRC_2018_JSON_URL).json()
-        cmrc_2019 = requests.get(CMRC_2019_JSON_URL).json()
+        cmrc_2018 = session.get(CMRC_2018_JSON_URL).json()
+        cmrc_2019 = session.get(CMRC_2019_JSON_URL).json()
     except Exception as e:
         raise HttpClientError(message=str(e))
 
@@ -1,5 +1,5 @@
 import json
-import requests
+from sota_extractor.scrapers import session
 from sota_extractor.errors import HttpClientError
 from sota_extractor.consts import EFF_TASK_CONVERSION
 from sota_extractor.taskdb.v01 import (
@@ -20,7 +20,7 @@ EFF_URL = (
 def eff() -> TaskDB:
     """Extract EFF SOTA tables."""
 
-    response = requests.get(EFF_URL)
+    response = session.get(EFF_URL)
     if response.status_code != 200:
         raise HttpClientError("Resource unavailable", response=response)
     j = json.loads(response.text)
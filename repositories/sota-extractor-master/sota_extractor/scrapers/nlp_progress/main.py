@@ -1,43 +1,160 @@
 import os
 import glob
+import hashlib
 import logging
 import tempfile
 import subprocess
+from typing import Any, Dict, List, Optional
 
+from sota_extractor import json_backend
 from sota_extractor.errors import DataError
 from sota_extractor.taskdb.v01 import TaskDB
 from sota_extractor.consts import NLP_PROGRESS_REPO
-from sota_extractor.scrapers.nlp_progress.markdown import parse_file
+from sota_extractor.scrapers import session
+from sota_extractor.scrapers.cache import atomic_write
+from sota_extractor.scrapers.nlp_progress.markdown import (
+    export_files,
+    merge,
+    parse_files,
+)
 
 logger = logging.getLogger(__name__)
 
+# Modules whose code determines the parsed output.
+PARSER_MODULES = ("markdown.py", "parsers.py", "fixer.py")
 
-def nlp_progress() -> TaskDB:
+
+def _git(*args, cwd=None):
+    cp = subprocess.run(["git", *args], cwd=cwd, capture_output=True)
+    if cp.returncode != 0:
+        logger.error("stdout: %s", cp.stdout)
+        logger.error("stderr: %s", cp.stderr)
+    return cp.returncode == 0
+
+
+def checkout(repo_path: str):
+    """Create or update a shallow clone of the NLP Progress repository."""
+    if os.path.isdir(os.path.join(repo_path, ".git")):
+        if _git("fetch", "--depth", "1", "origin", cwd=repo_path) and _git(
+            "reset", "--hard", "FETCH_HEAD", cwd=repo_path
+        ):
+            return
+        raise DataError("Could not update the NLP Progress repository.")
+
+    if not _git("clone", "--depth", "1", NLP_PROGRESS_REPO, repo_path):
+        raise DataError("Could not clone the NLP Progress repository.")
+
+
+def _parser_version() -> str:
+    """Hash the parser code, so code changes invalidate parsed files."""
+    digest = hashlib.blake2b(digest_size=16)
+    directory = os.path.dirname(__file__)
+    for name in PARSER_MODULES:
+        with open(os.path.join(directory, name), "rb") as fp:
+            digest.update(fp.read())
+    return digest.hexdigest()
+
+
+def _file_hash(filename: str) -> str:
+    with open(filename, "rb") as fp:
+        return hashlib.blake2b(fp.read(), digest_size=16).hexdigest()
+
+
+def parse_changed(
+    filenames: List[str], fragments: Dict, jobs: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    """Parse markdown files, reusing fragments of unchanged files.
+
+    Args:
+        filenames: Markdown files to parse.
+        fragments: Cache of previously parsed files, a dictionary of file
+            names to their content hash and exported tasks. It is updated
+            with the newly parsed files.
+        jobs: Number of worker processes, defaults to the number of CPUs.
+
+    Returns:
+        list: Exported tasks of every file.
+    """
+    hashes = {filename: _file_hash(filename) for filename in filenames}
+    changed = [
+        filename
+        for filename in filenames
+        if fragments.get(filename, {}).get("hash") != hashes[filename]
+    ]
+    logger.info(
+        "Parsing %d of %d NLP Progress files.", len(changed), len(filenames)
+    )
+
+    for filename, tasks in zip(changed, export_files(changed, jobs=jobs)):
+        fragments[filename] = {"hash": hashes[filename], "tasks": tasks}
+    return [fragments[filename]["tasks"] for filename in filenames]
+
+
+def _load_fragments(path: str, version: str) -> Dict:
+    try:
+        with open(path, "rb") as fp:
+            cache = json_backend.loads(fp.read())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != version:
+        return {}
+    return cache["files"]
+
+
+def nlp_progress(cache_dir: Optional[str] = None) -> TaskDB:
     """Parse a the whole nlp progress repo or a single markdown file.
 
     Checkouts the nlp progress git repository and parses all the markdown files
     in it.
 
+    With a cache directory the repository is kept as a shallow clone that is
+    updated with `git fetch`, and the tasks parsed from every file are cached
+    by the file's content hash, so only changed files are parsed again.
+
+    Args:
+        cache_dir: Cache directory, defaults to the scrapers cache directory
+            (see `session.set_cache_dir`). Without one, the repository is
+            cloned into a temporary directory.
+
     Returns:
         TaskDB: Populated task database.
     """
-    tdb = TaskDB()
+    cache_dir = cache_dir or session.get_cache_dir()
+    if cache_dir is None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_path = os.path.join(tmpdir, "nlp-progress")
+            checkout(repo_path)
+            filenames = sorted(
+                glob.glob(os.path.join(repo_path, "english", "*.md"))
+            )
+            return parse_files(filenames)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        repo_path = os.path.join(tmpdir, "nlp-progress")
-        cp = subprocess.run(
-            ["git", "clone", NLP_PROGRESS_REPO, repo_path], capture_output=True
-        )
-        if cp.returncode != 0:
-            logger.error("stdout: %s", cp.stdout)
-            logger.error("stderr: %s", cp.stderr)
-            raise DataError("Could not clone the NLP Progress repository.")
-
-        filenames = glob.glob(os.path.join(repo_path, "english", "*.md"))
+    directory = os.path.join(cache_dir, "nlp-progress")
+    repo_path = os.path.join(directory, "repo")
+    fragments_path = os.path.join(directory, "fragments.json")
+    checkout(repo_path)
 
-        for filename in filenames:
-            file_tdb = parse_file(filename)
-            for task in file_tdb.tasks.values():
-                tdb.add_task(task)
+    version = _parser_version()
+    files = _load_fragments(fragments_path, version)
+    # Keys are relative to the repository, the cache can be moved.
+    fragments = {
+        os.path.join(repo_path, name): fragment
+        for name, fragment in files.items()
+    }
+    filenames = sorted(glob.glob(os.path.join(repo_path, "english", "*.md")))
+    tdb = merge(parse_changed(filenames, fragments))
 
+    files = {
+        os.path.relpath(filename, repo_path): fragments[filename]
+        for filename in filenames
+    }
+    try:
+        atomic_write(
+            fragments_path,
+            json_backend.dumps(
+                {"version": version, "files": files}, compat=False
+            ).encode("utf-8"),
+        )
+    except OSError as e:
+        logger.warning("Could not cache the NLP Progress fragments: %s", e)
     return tdb
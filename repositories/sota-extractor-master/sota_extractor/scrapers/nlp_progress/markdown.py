@@ -1,6 +1,9 @@
 import io
 import logging
-from typing import List
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
 
 import markdown
 from markdown.treeprocessors import Treeprocessor
@@ -153,6 +156,13 @@ class ParserProcessor(Treeprocessor):
 
 
 class Markdown(markdown.Markdown):
+    """Markdown parser that extracts the tasks of NLP-Progress files.
+
+    Instances are reused for many files: `parse` resets the state between
+    documents and stops once the tree is parsed, the HTML is never
+    serialized.
+    """
+
     def __init__(self):
         super().__init__(extensions=[TableExtension()])
         self.parser_processor = ParserProcessor(self)
@@ -160,15 +170,101 @@ class Markdown(markdown.Markdown):
             self.parser_processor, "parser_processor", 1
         )
 
+    def parse(self, source: str) -> List[Task]:
+        """Parse a markdown document and return its tasks."""
+        self.reset()
+        self.parser_processor.parsed = []
+        if not source.strip():
+            return []
+
+        # The preprocessor, block parser and tree processor stages of
+        # `markdown.Markdown.convert`, up to and including the parser.
+        self.lines = source.split("\n")
+        for prep in self.preprocessors:
+            self.lines = prep.run(self.lines)
+        root = self.parser.parseDocument(self.lines).getroot()
+        for treeprocessor in self.treeprocessors:
+            new_root = treeprocessor.run(root)
+            if new_root is not None:
+                root = new_root
+            if treeprocessor is self.parser_processor:
+                break
+        return self.parser_processor.parsed
+
+
+# One parser per thread, building it is more expensive than parsing a file.
+_local = threading.local()
+
+
+def get_parser() -> Markdown:
+    """Return the parser of the current thread."""
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = Markdown()
+    return parser
+
 
 def parse_file(filename: str) -> TaskDB:
     """Parse an NLP-Progress markdown file and return a TaskDB instance."""
-    md = Markdown()
-    with io.open("/dev/null", "wb") as f:
-        md.convertFile(filename, output=f)
+    with io.open(filename, "r", encoding="utf-8") as f:
+        source = f.read().lstrip("\ufeff")
 
     tdb = TaskDB()
-    for task in md.parser_processor.parsed:
+    for task in get_parser().parse(source):
         for t in fix_task(task):
             tdb.add_task(t)
     return tdb
+
+
+def export_file(filename: str) -> List[Dict[str, Any]]:
+    """Parse an NLP-Progress markdown file and return the exported tasks."""
+    return parse_file(filename).export()
+
+
+def export_files(
+    filenames: List[str], jobs: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    """Parse NLP-Progress markdown files in parallel.
+
+    Args:
+        filenames: Markdown files to parse.
+        jobs: Number of worker processes, defaults to the number of CPUs.
+            With one job (or a single file) the files are parsed in the
+            current process.
+
+    Returns:
+        list: Exported tasks of every file, in the order of `filenames`.
+    """
+    if len(filenames) < 2 or jobs == 1:
+        return [export_file(filename) for filename in filenames]
+    # Spawn, don't fork: other threads of `run_scrapers` may hold locks that
+    # a forked child would inherit locked.
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(executor.map(export_file, filenames))
+
+
+def merge(exports: Iterable[List[Dict[str, Any]]]) -> TaskDB:
+    """Merge exported tasks of several files into one TaskDB."""
+    tdb = TaskDB()
+    for tasks in exports:
+        file_tdb = TaskDB()
+        file_tdb.load_tasks(data=tasks)
+        for task in file_tdb.tasks.values():
+            tdb.add_task(task)
+    return tdb
+
+
+def parse_files(filenames: List[str], jobs: Optional[int] = None) -> TaskDB:
+    """Parse NLP-Progress markdown files in parallel and merge their tasks.
+
+    Args:
+        filenames: Markdown files to parse.
+        jobs: Number of worker processes, defaults to the number of CPUs.
+
+    Returns:
+        TaskDB: Tasks of all files, later files override tasks with the same
+            name.
+    """
+    return merge(export_files(filenames, jobs=jobs))
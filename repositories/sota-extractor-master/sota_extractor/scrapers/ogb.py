@@ -1,7 +1,17 @@
 import logging
+import contextvars
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
-from sota_extractor.scrapers.utils import get_soup
+from lxml import etree
+
+from sota_extractor.scrapers.tables import (
+    BODY_ROWS,
+    get_html,
+    header_texts,
+    table_rows,
+)
 from sota_extractor.taskdb.v01 import (
     Link,
     Task,
@@ -45,8 +55,32 @@ DATA = [
     },
 ]
 
+LEADERBOARD_PREFIX = "leaderboard-for-"
+# Headings of the dataset leaderboards, each followed by its table.
+LEADERBOARD_HEADINGS = etree.XPath(
+    f"//*[starts-with(@id, '{LEADERBOARD_PREFIX}')]"
+)
+NEXT_TABLE = etree.XPath("./following-sibling::table[1]")
+
+
+def get_leaderboards(url: str) -> Dict[str, etree.ElementBase]:
+    """Fetch a leaderboard page once and return all of its tables.
 
-def get_sota_rows(url: str, dataset: Dataset):
+    Returns:
+        dict: Leaderboard tables by the heading id without the
+            "leaderboard-for-" prefix, i.e. the lowercase dataset name.
+    """
+    root = get_html(url)
+    leaderboards = {}
+    for heading in LEADERBOARD_HEADINGS(root):
+        table = NEXT_TABLE(heading)
+        if table:
+            name = heading.get("id")[len(LEADERBOARD_PREFIX) :]
+            leaderboards.setdefault(name, table[0])
+    return leaderboards
+
+
+def get_sota_rows(table: Optional[etree.ElementBase], dataset: Dataset):
     paper_code_col = 6
     date_col = 9
     params_col = 7
@@ -54,36 +88,28 @@ def get_sota_rows(url: str, dataset: Dataset):
     metric_2_col = 3
     metric_4_col = 4
     try:
-        soup = get_soup(url)
+        if table is None:
+            raise ValueError("Leaderboard not found.")
 
-        h3 = soup.find(id=f"leaderboard-for-{dataset.name}".lower())
-        table = h3.find_next_sibling("table")
-
-        headers = table.find_all("th")
-        metric_1 = headers[metric_1_col].text
-        metric_2 = headers[metric_2_col].text
+        headers = header_texts(table)
+        metric_1 = headers[metric_1_col]
+        metric_2 = headers[metric_2_col]
         metric_3 = "Number of params"
-        metric_4 = headers[metric_4_col].text
+        metric_4 = headers[metric_4_col]
 
         dataset.sota.metrics = [metric_1, metric_2, metric_3, metric_4]
-        for tr in table.select("tbody > tr"):
-            tds = tr.find_all("td")
+        for row in table_rows(table, BODY_ROWS):
+            tds = row.cells
 
-            try:
-                paper_url = tds[paper_code_col].find("a", text="Paper").attrs["href"]
-            except (AttributeError, KeyError):
-                paper_url = ""
+            paper_url = tds[paper_code_col].link("Paper") or ""
 
             try:
                 paper_date = datetime.strptime(tds[date_col].text, "%b %d, %Y")
             except ValueError:
                 paper_date = None
 
-            try:
-                link = Link(url=tds[paper_code_col].find("a", text="Code").attrs["href"])
-                code_links = [link]
-            except (AttributeError, KeyError):
-                code_links = []
+            code_url = tds[paper_code_col].link("Code")
+            code_links = [] if code_url is None else [Link(url=code_url)]
 
             dataset.sota.rows.append(
                 SotaRow(
@@ -105,20 +131,41 @@ def get_sota_rows(url: str, dataset: Dataset):
         )
 
 
+def get_task(item: Dict) -> Task:
+    """Scrape all datasets of a leaderboard page."""
+    url = item["url"]
+    task = Task(
+        name=item["task"],
+        source_link=Link(title=f"{item['task']} LeaderBoard", url=url),
+    )
+    try:
+        leaderboards = get_leaderboards(url)
+    except Exception as e:
+        logger.exception("Failed to get page: %s. Error: %s", url, e)
+        leaderboards = {}
+
+    for dataset_name in item["datasets"]:
+        dataset = Dataset(name=dataset_name)
+        task.datasets.append(dataset)
+        get_sota_rows(leaderboards.get(dataset_name.lower()), dataset)
+    return task
+
+
 def ogb() -> TaskDB:
-    """Extract OGB SOTA tables."""
-    tdb = TaskDB()
+    """Extract OGB SOTA tables.
 
-    for item in DATA:
-        url = item["url"]
+    Every leaderboard page is fetched and parsed once, and the pages are
+    fetched concurrently.
+    """
+    tdb = TaskDB()
 
-        task = Task(
-            name=item["task"],
-            source_link=Link(title=f"{item['task']} LeaderBoard", url=url),
-        )
-        tdb.add_task(task)
-        for dataset_name in item["datasets"]:
-            dataset = Dataset(name=dataset_name)
-            task.datasets.append(dataset)
-            get_sota_rows(url, dataset)
+    with ThreadPoolExecutor(max_workers=len(DATA)) as executor:
+        # Run in copies of the context, so the requests are visible to
+        # `session.record`.
+        futures = [
+            executor.submit(contextvars.copy_context().run, get_task, item)
+            for item in DATA
+        ]
+        for future in futures:
+            tdb.add_task(future.result())
     return tdb
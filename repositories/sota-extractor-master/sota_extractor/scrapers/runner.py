@@ -0,0 +1,124 @@
+import time
+import queue
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, Set
+
+from sota_extractor.taskdb.v01 import TaskDB
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScraperResult:
+    """Outcome of a single scraper run.
+
+    Exactly one of `tdb` and `error` is set.
+    """
+
+    name: str
+    tdb: Optional[TaskDB] = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run(name: str, scraper: Callable[[], TaskDB], results: queue.Queue):
+    start = time.monotonic()
+    try:
+        result = ScraperResult(name=name, tdb=scraper())
+    except BaseException as e:
+        logger.debug("Scraper %s failed.", name, exc_info=True)
+        result = ScraperResult(name=name, error=e)
+    result.elapsed = time.monotonic() - start
+    results.put(result)
+
+
+def run_scrapers(
+    scrapers: Dict[str, Callable[[], TaskDB]],
+    jobs: int = 4,
+    timeout: Optional[float] = None,
+) -> Iterator[ScraperResult]:
+    """Run scrapers concurrently and yield their results as they finish.
+
+    At most `jobs` scrapers run at the same time. A scraper that raises
+    yields a result with the `error` set and does not affect the others.
+
+    A scraper running for longer than `timeout` seconds yields a
+    `TimeoutError` result. Threads cannot be killed, so the timed out
+    scraper keeps running in a daemon thread and its result is dropped; it
+    does not keep the process alive on exit. It keeps its slot until it
+    finishes, so hung scrapers never raise the concurrency above `jobs`. If
+    all slots are held by timed out scrapers and none of them finishes
+    within `timeout` seconds, the scrapers still waiting yield a
+    `TimeoutError` result without running.
+
+    Args:
+        scrapers: Dictionary of source names to scraper functions.
+        jobs: Maximum number of scrapers running at the same time.
+        timeout: Timeout in seconds for each scraper, or None to wait
+            forever.
+    """
+    pending = list(scrapers.items())
+    pending.reverse()
+    results = queue.Queue()
+    # Source name -> deadline of the running scrapers.
+    running: Dict[str, float] = {}
+    # Timed out scrapers whose threads are still running.
+    abandoned: Set[str] = set()
+
+    while pending or running:
+        while pending and len(running) + len(abandoned) < max(jobs, 1):
+            name, scraper = pending.pop()
+            running[name] = (
+                float("inf") if timeout is None else time.monotonic() + timeout
+            )
+            threading.Thread(
+                target=_run,
+                args=(name, scraper, results),
+                name=f"scraper-{name}",
+                daemon=True,
+            ).start()
+
+        if running:
+            wait = min(running.values()) - time.monotonic()
+            wait = None if wait == float("inf") else max(wait, 0)
+        else:
+            # Wait for a timed out scraper to free its slot.
+            wait = timeout
+        try:
+            result = results.get(timeout=wait)
+        except queue.Empty:
+            if not running:
+                for name, _ in reversed(pending):
+                    yield ScraperResult(
+                        name=name,
+                        error=TimeoutError(
+                            f"No free slot after {timeout:g} seconds."
+                        ),
+                    )
+                return
+            now = time.monotonic()
+            for name, deadline in list(running.items()):
+                if deadline <= now:
+                    del running[name]
+                    abandoned.add(name)
+                    yield ScraperResult(
+                        name=name,
+                        error=TimeoutError(
+                            f"Timed out after {timeout:g} seconds."
+                        ),
+                        elapsed=timeout,
+                    )
+            continue
+
+        # Late results of timed out scrapers were already reported.
+        if result.name in abandoned:
+            abandoned.remove(result.name)
+        else:
+            del running[result.name]
+            yield result
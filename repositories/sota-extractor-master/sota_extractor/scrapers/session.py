@@ -0,0 +1,232 @@
+import time
+import random
+import logging
+import threading
+import contextlib
+import contextvars
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from sota_extractor import consts
+from sota_extractor.scrapers.cache import HttpCache
+from sota_extractor.scrapers.cassette import RECORD, REPLAY, Cassette
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limiting and server side errors.
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class Session(requests.Session):
+    """HTTP session shared by the scrapers.
+
+    Connections are pooled per host and kept alive, so sources that fetch
+    many pages reuse their TLS connections. Every request gets a default
+    timeout and is retried on connection errors, timeouts and 429/5xx
+    responses with exponential backoff and full jitter, honoring the
+    `Retry-After` header. At most `max_per_host` requests to the same host
+    are in flight at the same time, even when many scrapers run
+    concurrently.
+
+    If a cache directory is set, GET responses are kept in an `HttpCache`
+    and revalidated with conditional requests. Responses served from the
+    cache after a 304 answer have `from_cache` set to True.
+
+    If a `Cassette` is set, responses are recorded into it or replayed from
+    it without touching the network, see `use_cassette`.
+
+    Args:
+        timeout: Default timeout in seconds of every request.
+        retries: Number of retries after the first attempt.
+        backoff: Base delay in seconds, the n-th retry waits a random time
+            between 0 and `backoff * 2 ** n` seconds.
+        backoff_max: Upper bound of a single delay in seconds.
+        max_per_host: Maximum number of concurrent requests (and pooled
+            connections) per host.
+        cache_dir: Directory of the HTTP cache, None disables caching.
+    """
+
+    def __init__(
+        self,
+        timeout: float = consts.HTTP_TIMEOUT,
+        retries: int = consts.HTTP_RETRIES,
+        backoff: float = consts.HTTP_BACKOFF,
+        backoff_max: float = 30.0,
+        max_per_host: int = consts.HTTP_MAX_PER_HOST,
+        cache_dir: Optional[str] = consts.CACHE_DIR,
+    ):
+        super().__init__()
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.max_per_host = max_per_host
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self.cache = HttpCache(cache_dir) if cache_dir else None
+        self.cassette: Optional[Cassette] = None
+
+        adapter = HTTPAdapter(pool_maxsize=max_per_host)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def _semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    def _delay(self, attempt: int, response=None) -> float:
+        if response is not None:
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return random.uniform(
+            0, min(self.backoff * 2**attempt, self.backoff_max)
+        )
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        urls = _recording.get()
+        if urls is not None and url not in urls:
+            urls.append(url)
+
+        cassette = self.cassette
+        if cassette is not None and cassette.replaying:
+            return cassette.replay(method, url)
+        response = self._cached_request(method, url, **kwargs)
+        if cassette is not None:
+            cassette.append(method, url, response)
+        return response
+
+    def _cached_request(self, method, url, **kwargs) -> requests.Response:
+        entry = None
+        cacheable = (
+            self.cache is not None
+            and method.upper() == "GET"
+            and not kwargs.get("params")
+        )
+        if cacheable:
+            entry = self.cache.load(url)
+            if entry is not None:
+                kwargs["headers"] = {
+                    **self.cache.conditional_headers(entry),
+                    **(kwargs.get("headers") or {}),
+                }
+
+        response = self._send(method, url, **kwargs)
+        if entry is not None and response.status_code == 304:
+            return self.cache.response(entry, response)
+        if cacheable:
+            self.cache.store(url, response)
+        return response
+
+    def _send(self, method, url, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        semaphore = self._semaphore(url)
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                with semaphore:
+                    response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if last:
+                    raise
+                delay = self._delay(attempt)
+                reason = str(e)
+            else:
+                if response.status_code not in RETRY_STATUS or last:
+                    return response
+                delay = self._delay(attempt, response)
+                reason = f"status code {response.status_code}"
+                response.close()
+            logger.debug(
+                "Retrying %s %s in %.2fs (%s).", method, url, delay, reason
+            )
+            time.sleep(delay)
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    try:
+        return max(float(response.headers["Retry-After"]), 0.0)
+    except (KeyError, ValueError):
+        return None
+
+
+_session: Optional[Session] = None
+_session_lock = threading.Lock()
+# Urls fetched inside `record()`.
+_recording: contextvars.ContextVar[Optional[List[str]]] = (
+    contextvars.ContextVar("recording", default=None)
+)
+
+
+def get_session() -> Session:
+    """Return the session shared by all scrapers."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = Session()
+        return _session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Send a GET request through the shared session."""
+    return get_session().get(url, **kwargs)
+
+
+def set_cache_dir(directory: Optional[str]):
+    """Set the cache directory of the scrapers and the shared session.
+
+    Args:
+        directory: Cache directory, None disables caching.
+    """
+    get_session().cache = HttpCache(directory) if directory else None
+
+
+def get_cache_dir() -> Optional[str]:
+    """Return the cache directory of the scrapers, None if disabled."""
+    cache = get_session().cache
+    return None if cache is None else cache.directory
+
+
+@contextlib.contextmanager
+def record():
+    """Collect the urls requested in the current context.
+
+    Yields a list that is filled with every url requested through a
+    `Session` until the block exits. Threads started inside the block
+    only report their requests if they run in a copy of the context.
+    """
+    urls = []
+    token = _recording.set(urls)
+    try:
+        yield urls
+    finally:
+        _recording.reset(token)
+
+
+@contextlib.contextmanager
+def use_cassette(path: str, mode: str = REPLAY):
+    """Record or replay the responses of the shared session.
+
+    In record mode the cassette file is written when the block exits.
+
+    Args:
+        path: Path of the cassette file.
+        mode: Either "record" or "replay".
+    """
+    session = get_session()
+    cassette = Cassette(path, mode)
+    previous, session.cassette = session.cassette, cassette
+    try:
+        yield cassette
+    finally:
+        session.cassette = previous
+        if mode == RECORD:
+            cassette.save()
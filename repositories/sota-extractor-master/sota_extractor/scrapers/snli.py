@@ -1,4 +1,8 @@
-from sota_extractor.scrapers.utils import get_soup
+from sota_extractor.scrapers.tables import (
+    get_html,
+    table_rows,
+    tables_by_class,
+)
 from sota_extractor.taskdb.v01 import (
     Link,
     Task,
@@ -10,30 +14,29 @@ from sota_extractor.taskdb.v01 import (
 
 SNLI_URL = "https://nlp.stanford.edu/projects/snli/"
 
+SOTA_TABLES = tables_by_class("newstuff")
+
 
 def snli() -> TaskDB:
     """Extract SNLI SOTA tables."""
-    soup = get_soup(SNLI_URL)
-
-    table = soup.findAll("table", attrs={"class": "newstuff"})[1]
+    table = SOTA_TABLES(get_html(SNLI_URL))[1]
 
-    rows = table.findAll("tr")
+    rows = table_rows(table)
 
     sota_rows = []
     # suffix = ""
     for row in rows:
         # ignore the header
-        if row.get("class") == ["header"]:
+        if row.classes == ("header",):
             pass
-        elif row.get("class") == ["section"]:
+        elif row.classes == ("section",):
             # suffix = row.text.replace("models", "").strip()
             continue
         else:
-            cells = row.findAll("td")
+            cells = row.cells
 
-            a = cells[0].find("a")
+            a_text, paper_url = cells[0].links[0]
 
-            paper_url = a.get("href")
             if paper_url == "http://nlp.stanford.edu/pubs/snli_paper.pdf":
                 paper_title = (
                     "A large annotated corpus for learning natural language "
@@ -60,7 +63,7 @@ def snli() -> TaskDB:
             ):
                 paper_title = "Deep Fusion LSTMs for Text Semantic Matching"
             else:
-                paper_title = a.text
+                paper_title = a_text
 
             model_name = cells[1].text.strip()
             # if suffix:
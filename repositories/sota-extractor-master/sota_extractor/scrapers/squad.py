@@ -1,7 +1,6 @@
 import re
 
-import requests
-
+from sota_extractor.scrapers import session
 from sota_extractor.errors import HttpClientError
 from sota_extractor.scrapers.utils import date_from_timestamp, sround
 from sota_extractor.taskdb.v01 import SotaRow, Dataset, Task, Link, TaskDB
@@ -86,8 +85,8 @@ def get_sota_rows(data):
 def squad() -> TaskDB:
     """Extract SQUAD SOTA tables."""
     try:
-        squad_1 = requests.get(SQUAD_1_1_JSON_URL).json()
-        squad_2 = requests.get(SQUAD_2_0_JSON_URL).json()
+        squad_1 = session.get(SQUAD_1_1_JSON_URL).json()
+        squad_2 = session.get(SQUAD_2_0_JSON_URL).json()
     except Exception as e:
         raise HttpClientError(message=str(e))
 
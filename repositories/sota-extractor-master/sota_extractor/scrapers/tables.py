@@ -0,0 +1,107 @@
+from typing import List, NamedTuple, Optional, Tuple
+
+from lxml import etree, html
+
+from sota_extractor.scrapers import session
+
+# Descendant rows of a table, and the body rows only.
+ROWS = etree.XPath(".//tr")
+BODY_ROWS = etree.XPath("./tbody/tr")
+HEADERS = etree.XPath(".//th")
+
+
+def tables_by_class(name: str) -> etree.XPath:
+    """Compile an XPath selecting all tables that have the css class."""
+    return etree.XPath(
+        "//table[contains(concat(' ', normalize-space(@class), ' '), "
+        f"' {name} ')]"
+    )
+
+
+class Cell(NamedTuple):
+    """Text, links and css classes of a table cell."""
+
+    text: str
+    links: List[Tuple[str, Optional[str]]]
+    classes: Tuple[str, ...]
+
+    def link(self, text: Optional[str] = None) -> Optional[str]:
+        """Return the url of the first link, or of the first link with text.
+
+        Returns None if there is no such link or it has no href.
+        """
+        for link_text, href in self.links:
+            if text is None or link_text == text:
+                return href
+        return None
+
+
+class Row(NamedTuple):
+    """The `td` cells of a table row."""
+
+    cells: List[Cell]
+    classes: Tuple[str, ...]
+    # True if the row contains `th` cells.
+    header: bool
+
+    def by_class(self, name: str) -> Optional[Cell]:
+        """Return the first cell with the css class."""
+        for cell in self.cells:
+            if name in cell.classes:
+                return cell
+        return None
+
+
+def _classes(element) -> Tuple[str, ...]:
+    return tuple(element.get("class", "").split())
+
+
+def _text(element) -> str:
+    return str(element.text_content())
+
+
+def get_html(url: str) -> Optional[html.HtmlElement]:
+    """Fetch a page through the shared session and parse it with lxml.
+
+    Parsing with lxml is done in C and builds no Python objects for the
+    parts of the page that are never selected.
+
+    Args:
+        url: URL to scrape.
+
+    Returns:
+        The root element of the page, or None if the page does not exist.
+    """
+    response = session.get(url)
+    if response.status_code == 404:
+        return None
+    return html.fromstring(response.text)
+
+
+def header_texts(table) -> List[str]:
+    """Return the texts of all `th` cells of the table."""
+    return [_text(th) for th in HEADERS(table)]
+
+
+def table_rows(table, rows: etree.XPath = ROWS) -> List[Row]:
+    """Extract the cell texts, links and classes of every table row.
+
+    Each row is read in one sweep over its `td` descendants.
+
+    Args:
+        table: Table element.
+        rows: XPath selecting the rows, relative to the table.
+    """
+    result = []
+    for tr in rows(table):
+        cells = [
+            Cell(
+                text=_text(td),
+                links=[(_text(a), a.get("href")) for a in td.iter("a")],
+                classes=_classes(td),
+            )
+            for td in tr.iter("td")
+        ]
+        header = next(tr.iter("th"), None) is not None
+        result.append(Row(cells=cells, classes=_classes(tr), header=header))
+    return result
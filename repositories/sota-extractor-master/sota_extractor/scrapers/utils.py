@@ -1,19 +1,22 @@
-import requests
 from datetime import datetime
 from typing import Optional, Union
 
 import pytz
 from bs4 import BeautifulSoup
 
+from sota_extractor.scrapers import session
+
 
 def get_soup(url):
     """Get a BeautifulSoup object back from the a URL.
 
+    The page is fetched through the shared HTTP session.
+
     Args:
         url: URL to scrape.
     """
 
-    r = requests.get(url)
+    r = session.get(url)
 
     if r.status_code == 404:
         return None
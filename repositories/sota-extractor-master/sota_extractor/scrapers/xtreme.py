@@ -3,8 +3,7 @@ import json
 import _jsonnet
 from datetime import datetime
 
-import requests
-
+from sota_extractor.scrapers import session
 from sota_extractor.taskdb.v01 import (
     Link,
     Task,
@@ -34,7 +33,7 @@ REGEX = re.compile(
 
 def xtreme() -> TaskDB:
     """Extract Xtreme SOTA tables."""
-    data = requests.get(XTREME_URL).text.splitlines()
+    data = session.get(XTREME_URL).text.splitlines()
 
     sota_rows = []
     for line in data:
@@ -1,14 +1,37 @@
 import io
-import json
+import os
 import gzip
-from sota_extractor import errors
+import hashlib
+from typing import Iterator, Optional
+from sota_extractor import errors, json_backend
 from sota_extractor.consts import Format
 from sota_extractor.taskdb import TaskDB
+from sota_extractor.taskdb.v01.diff import Patch
+
+# Size of the chunks in which existing files are hashed.
+CHUNK_SIZE = 1 << 16
+
+
+def iterdumps(tdb: TaskDB) -> Iterator[str]:
+    """Render sota data to json, one task at a time.
+
+    Joined chunks are identical to `json.dumps(tdb.export(), indent=2,
+    sort_keys=True)`, but only a single task is held in memory at once.
+    Tasks are rendered with the configured `json_backend`.
+    """
+    first = True
+    for task in tdb.iter_export():
+        # JSON strings can't contain raw newlines, so indenting every line
+        # nests the task into the top-level list.
+        chunk = json_backend.dumps(task)
+        yield ("[\n  " if first else ",\n  ") + chunk.replace("\n", "\n  ")
+        first = False
+    yield "[]" if first else "\n]"
 
 
 def dumps(tdb: TaskDB) -> str:
     """Render sota data to a json string."""
-    return json.dumps(tdb.export(), indent=2, sort_keys=True)
+    return "".join(iterdumps(tdb))
 
 
 def dump(tdb: TaskDB, output: str, fmt=Format.json, encoding="utf-8"):
@@ -18,6 +41,9 @@ def dump(tdb: TaskDB, output: str, fmt=Format.json, encoding="utf-8"):
     json files after export. To do that it will always sort json object keys
     alphabetically, use the same indent, same encoding and same serializer.
 
+    The data is streamed into the file task by task, so the whole rendered
+    json never has to fit into memory.
+
     Args:
         tdb (TaskDB): Populated TaskDB instance.
         output (str): Path to the output file in which the data should be
@@ -25,19 +51,91 @@ def dump(tdb: TaskDB, output: str, fmt=Format.json, encoding="utf-8"):
         fmt (Format): Serialization format.
         encoding (str): File encoding.
     """
+    with _open(output, "w", fmt, encoding) as fp:
+        for chunk in iterdumps(tdb):
+            fp.write(chunk)
+
+
+def _open(filename: str, mode: str, fmt: Format, encoding: str):
     if fmt == Format.json:
-        with io.open(output, mode="w", encoding=encoding) as fp:
-            fp.write(dumps(tdb))
+        return io.open(filename, mode=mode, encoding=encoding)
     elif fmt == Format.json_gz:
-        with gzip.open(output, mode="wb") as fp:
-            fp.write(dumps(tdb).encode(encoding))
-    else:
-        raise errors.UnsupportedFormat(fmt)
+        # No newline translation, the gzipped file always uses "\n".
+        return gzip.open(
+            filename, mode=mode + "t", encoding=encoding, newline=""
+        )
+    raise errors.UnsupportedFormat(fmt)
+
+
+def file_digest(
+    filename: str, fmt=Format.json, encoding="utf-8"
+) -> Optional[str]:
+    """Hash the decoded content of a sota file.
+
+    For gzipped files the uncompressed json is hashed, so the digest does not
+    depend on the timestamp in the gzip header.
+
+    Returns:
+        The hex digest, or None if the file does not exist.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with _open(filename, "r", fmt, encoding) as fp:
+            for chunk in iter(lambda: fp.read(CHUNK_SIZE), ""):
+                digest.update(chunk.encode(encoding))
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def update(
+    tdb: TaskDB, output: str, fmt=Format.json, encoding="utf-8"
+) -> Optional[Patch]:
+    """Write sota data to file, unless the file already contains it.
+
+    The canonical json is streamed into a temporary file next to `output`
+    and hashed on the way. If the digest matches the existing file, the
+    temporary file is dropped and `output` is not touched, so unchanged
+    outputs keep their modification time and produce no git changes.
+    Otherwise `output` is atomically replaced.
+
+    Args:
+        tdb (TaskDB): Populated TaskDB instance.
+        output (str): Path to the output file.
+        fmt (Format): Serialization format.
+        encoding (str): File encoding.
+
+    Returns:
+        None if the file was unchanged, otherwise the patch from the
+        previous content of the file (empty if it did not exist) to `tdb`.
+    """
+    tmp = f"{output}.{os.getpid()}.tmp"
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with _open(tmp, "w", fmt, encoding) as fp:
+            for chunk in iterdumps(tdb):
+                digest.update(chunk.encode(encoding))
+                fp.write(chunk)
+
+        if digest.hexdigest() == file_digest(output, fmt, encoding):
+            return None
+
+        previous = TaskDB()
+        if os.path.exists(output):
+            previous.load_tasks(data=load(output, fmt, encoding))
+        patch = previous.diff(tdb)
+        os.replace(tmp, output)
+        return patch
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
 
 
 def load(filename, fmt=Format.json, encoding="utf-8"):
     """Load sota data from file.
 
+    The file is decoded with the configured `json_backend`.
+
     Args:
         filename (str): Path to the file from which the data should be
             deserialized.
@@ -46,9 +144,9 @@ def load(filename, fmt=Format.json, encoding="utf-8"):
     """
     if fmt == Format.json:
         with io.open(filename, mode="r", encoding=encoding) as fp:
-            return json.load(fp)
+            return json_backend.loads(fp.read())
     elif fmt == Format.json_gz:
         with gzip.open(filename, mode="rb") as fp:
-            return json.loads(fp.read().decode(encoding))
+            return json_backend.loads(fp.read().decode(encoding))
     else:
         raise errors.UnsupportedFormat(fmt)
@@ -0,0 +1,399 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from sota_extractor.errors import ArgumentError
+from sota_extractor.taskdb.v01.models import Link, SotaRow, Sota
+from sota_extractor.taskdb.v01.metrics import parse_metric_values
+
+EPOCH = date(1970, 1, 1)
+# Sentinel used in the `paper_date` day array for rows without a date.
+MISSING_DATE = np.iinfo(np.int64).min
+
+
+def date_to_days(value: Optional[Union[date, datetime]]) -> int:
+    """Convert a date to the number of days since the unix epoch."""
+    if value is None:
+        return MISSING_DATE
+    if isinstance(value, datetime):
+        value = value.date()
+    return (value - EPOCH).days
+
+
+def days_to_date(days: int) -> Optional[date]:
+    """Convert the number of days since the unix epoch back to a date."""
+    if days == MISSING_DATE:
+        return None
+    return EPOCH + timedelta(days=int(days))
+
+
+class SotaRowView:
+    """Read-only view on a single row of a `ColumnarSota`.
+
+    Exposes the same attributes as `SotaRow`, so it can be used everywhere a
+    row is only read, including the marshmallow schemas.
+    """
+
+    __slots__ = ("_sota", "_index")
+
+    def __init__(self, sota: "ColumnarSota", index: int):
+        self._sota = sota
+        self._index = index
+
+    @property
+    def model_name(self) -> str:
+        return self._sota.model_name[self._index]
+
+    @property
+    def paper_title(self) -> str:
+        return self._sota.paper_title[self._index]
+
+    @property
+    def paper_url(self) -> str:
+        return self._sota.paper_url[self._index]
+
+    @property
+    def paper_date(self) -> Optional[date]:
+        return days_to_date(self._sota.paper_date[self._index])
+
+    @property
+    def code_links(self) -> List[Link]:
+        return self._sota.code_links[self._index]
+
+    @property
+    def model_links(self) -> List[Link]:
+        return self._sota.model_links[self._index]
+
+    @property
+    def metrics(self) -> Dict[str, str]:
+        raw = self._sota.raw_metrics[self._index]
+        return {
+            name: value
+            for name, value in zip(self._sota.metrics, raw)
+            if value is not None
+        }
+
+    @property
+    def uses_additional_data(self) -> bool:
+        return bool(self._sota.uses_additional_data[self._index])
+
+    @property
+    def ranks(self) -> Dict[str, int]:
+        if self._sota.ranks is None:
+            return {}
+        ranks = self._sota.ranks[self._index]
+        return {
+            name: int(rank)
+            for name, rank in zip(self._sota.metrics, ranks)
+            if rank
+        }
+
+    @property
+    def best_rank(self) -> Optional[int]:
+        if (
+            self._sota.best_rank is None
+            or not self._sota.best_rank[self._index]
+        ):
+            return None
+        return int(self._sota.best_rank[self._index])
+
+    @property
+    def best_metric(self) -> Optional[str]:
+        if self._sota.best_metric is None:
+            return None
+        return self._sota.best_metric[self._index]
+
+    def to_row(self) -> SotaRow:
+        """Materialize the view into a standalone `SotaRow`."""
+        return SotaRow(
+            model_name=self.model_name,
+            paper_title=self.paper_title,
+            paper_url=self.paper_url,
+            paper_date=self.paper_date,
+            code_links=list(self.code_links),
+            model_links=list(self.model_links),
+            metrics=self.metrics,
+            uses_additional_data=self.uses_additional_data,
+            ranks=self.ranks,
+            best_rank=self.best_rank,
+            best_metric=self.best_metric,
+        )
+
+    def __repr__(self):
+        return (
+            f"SotaRowView(model_name={self.model_name!r}, "
+            f"paper_url={self.paper_url!r}, metrics={self.metrics!r})"
+        )
+
+
+class ColumnarSota:
+    """Column oriented representation of a `Sota` table.
+
+    Every row attribute is stored as a NumPy array of length `len(self)`:
+
+    - `model_name`, `paper_title`, `paper_url` - string (object) arrays,
+    - `paper_date` - int64 number of days since the epoch (`MISSING_DATE` if
+      the row has no date),
+    - `uses_additional_data` - bool array,
+    - `values` - float64 matrix of shape `(len(self), len(self.metrics))`,
+      `NaN` where the row has no (numeric) value for the metric,
+    - `flags` - uint8 matrix of the same shape with the `MetricFlag` flags of
+      every parsed value.
+
+    Metric values are parsed once, when the table is built, so sorting and
+    ranking work only on the float matrix.
+
+    The original metric values are kept in `raw_metrics` and the original
+    metric list in `declared_metrics` so that converting back to a `Sota` is
+    lossless.
+
+    Once the leaderboard is ranked (see `TaskDB.compute_ranks`), or if its
+    rows carry the ranks stored by a previous ranking, the table also holds:
+
+    - `ranks` - int32 matrix with the 1-based rank of every value within its
+      metric column (0 if the row has no value for the metric),
+    - `best_rank` - int32 array with the best rank of each row (0 if the row
+      is not ranked on any metric),
+    - `best_metric` - object array with the name of the metric on which each
+      row has its best rank.
+    """
+
+    def __init__(
+        self,
+        declared_metrics: List[str],
+        metrics: List[str],
+        model_name: np.ndarray,
+        paper_title: np.ndarray,
+        paper_url: np.ndarray,
+        paper_date: np.ndarray,
+        code_links: np.ndarray,
+        model_links: np.ndarray,
+        uses_additional_data: np.ndarray,
+        raw_metrics: np.ndarray,
+        values: np.ndarray,
+        flags: np.ndarray,
+        ranks: Optional[np.ndarray] = None,
+        best_rank: Optional[np.ndarray] = None,
+        best_metric: Optional[np.ndarray] = None,
+    ):
+        self.declared_metrics = declared_metrics
+        self.metrics = metrics
+        self.model_name = model_name
+        self.paper_title = paper_title
+        self.paper_url = paper_url
+        self.paper_date = paper_date
+        self.code_links = code_links
+        self.model_links = model_links
+        self.uses_additional_data = uses_additional_data
+        self.raw_metrics = raw_metrics
+        self.values = values
+        self.flags = flags
+        self.ranks = ranks
+        self.best_rank = best_rank
+        self.best_metric = best_metric
+
+    @classmethod
+    def from_sota(cls, sota: Sota) -> "ColumnarSota":
+        """Build the columnar representation of a `Sota` table.
+
+        Metrics that are used in the rows but are not listed in
+        `sota.metrics` are appended to the metric list in order of appearance.
+        """
+        metrics = list(dict.fromkeys(sota.metrics))
+        index = {name: i for i, name in enumerate(metrics)}
+        for row in sota.rows:
+            for name in row.metrics:
+                if name not in index:
+                    index[name] = len(metrics)
+                    metrics.append(name)
+
+        n = len(sota.rows)
+        raw_metrics = np.full((n, len(metrics)), None, dtype=object)
+        for i, row in enumerate(sota.rows):
+            for name, value in row.metrics.items():
+                raw_metrics[i, index[name]] = value
+
+        values = np.empty(raw_metrics.shape, dtype=np.float64)
+        flags = np.empty(raw_metrics.shape, dtype=np.uint8)
+        for j in range(len(metrics)):
+            values[:, j], flags[:, j] = parse_metric_values(raw_metrics[:, j])
+
+        ranks = best_rank = best_metric = None
+        if any(row.best_rank is not None or row.ranks for row in sota.rows):
+            ranks = np.zeros(raw_metrics.shape, dtype=np.int32)
+            for i, row in enumerate(sota.rows):
+                for name, rank in row.ranks.items():
+                    if name in index:
+                        ranks[i, index[name]] = rank
+            best_rank = np.fromiter(
+                (row.best_rank or 0 for row in sota.rows),
+                dtype=np.int32,
+                count=n,
+            )
+            best_metric = _object_array([row.best_metric for row in sota.rows])
+
+        return cls(
+            declared_metrics=list(sota.metrics),
+            metrics=metrics,
+            model_name=_object_array([row.model_name for row in sota.rows]),
+            paper_title=_object_array([row.paper_title for row in sota.rows]),
+            paper_url=_object_array([row.paper_url for row in sota.rows]),
+            paper_date=np.fromiter(
+                (date_to_days(row.paper_date) for row in sota.rows),
+                dtype=np.int64,
+                count=n,
+            ),
+            code_links=_object_array([row.code_links for row in sota.rows]),
+            model_links=_object_array([row.model_links for row in sota.rows]),
+            uses_additional_data=np.fromiter(
+                (row.uses_additional_data for row in sota.rows),
+                dtype=bool,
+                count=n,
+            ),
+            raw_metrics=raw_metrics,
+            values=values,
+            flags=flags,
+            ranks=ranks,
+            best_rank=best_rank,
+            best_metric=best_metric,
+        )
+
+    def to_sota(self) -> Sota:
+        """Convert back to a row oriented `Sota` table."""
+        return Sota(
+            metrics=list(self.declared_metrics),
+            rows=[view.to_row() for view in self],
+        )
+
+    def __len__(self) -> int:
+        return len(self.model_name)
+
+    def __iter__(self) -> Iterator[SotaRowView]:
+        for i in range(len(self)):
+            yield SotaRowView(self, i)
+
+    def __getitem__(self, index: int) -> SotaRowView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ColumnarSota index out of range")
+        return SotaRowView(self, index)
+
+    def metric_index(self, metric: str) -> int:
+        """Return the column of the metric in the `values` matrix."""
+        try:
+            return self.metrics.index(metric)
+        except ValueError:
+            raise ArgumentError(f"Unknown metric: {metric}")
+
+    def column(self, metric: str) -> np.ndarray:
+        """Return the float values of a single metric."""
+        return self.values[:, self.metric_index(metric)]
+
+    def take(
+        self, indices: Union[Sequence[int], np.ndarray]
+    ) -> "ColumnarSota":
+        """Return a new table with the selected rows, in the given order."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return ColumnarSota(
+            declared_metrics=list(self.declared_metrics),
+            metrics=list(self.metrics),
+            model_name=self.model_name[indices],
+            paper_title=self.paper_title[indices],
+            paper_url=self.paper_url[indices],
+            paper_date=self.paper_date[indices],
+            code_links=self.code_links[indices],
+            model_links=self.model_links[indices],
+            uses_additional_data=self.uses_additional_data[indices],
+            raw_metrics=self.raw_metrics[indices],
+            values=self.values[indices],
+            flags=self.flags[indices],
+            ranks=None if self.ranks is None else self.ranks[indices],
+            best_rank=(
+                None if self.best_rank is None else self.best_rank[indices]
+            ),
+            best_metric=(
+                None if self.best_metric is None else self.best_metric[indices]
+            ),
+        )
+
+    def filter(self, mask: np.ndarray) -> "ColumnarSota":
+        """Return a new table with the rows where `mask` is true."""
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ArgumentError(
+                f"Mask of shape {mask.shape} does not match {len(self)} rows."
+            )
+        return self.take(np.flatnonzero(mask))
+
+    def argsort(self, metric: str, is_loss: bool = False) -> np.ndarray:
+        """Return row indices ordered from the best to the worst value.
+
+        Rows without a value for the metric are placed at the end. The sort is
+        stable, so rows with equal values keep their original order.
+        """
+        column = self.column(metric)
+        key = column if is_loss else -column
+        # NaN values are sorted last by numpy.
+        return np.argsort(key, kind="stable")
+
+    def sort(self, metric: str, is_loss: bool = False) -> "ColumnarSota":
+        """Return a new table sorted from the best to the worst value."""
+        return self.take(self.argsort(metric, is_loss=is_loss))
+
+    def ranked(self, metric: str) -> np.ndarray:
+        """Return row indices ordered by their materialized rank.
+
+        Uses the ranks computed by `TaskDB.compute_ranks` instead of sorting
+        the metric values again. Rows without a rank are placed at the end.
+        """
+        if self.ranks is None:
+            raise ArgumentError("Leaderboard is not ranked.")
+        ranks = self.ranks[:, self.metric_index(metric)].astype(np.int64)
+        ranks[ranks == 0] = np.iinfo(np.int64).max
+        return np.argsort(ranks, kind="stable")
+
+    def best(self, metric: str, is_loss: bool = False) -> Optional[int]:
+        """Return the index of the best row for the metric.
+
+        Returns `None` if no row has a value for the metric.
+        """
+        column = self.column(metric)
+        if len(column) == 0 or np.isnan(column).all():
+            return None
+        if is_loss:
+            return int(np.nanargmin(column))
+        return int(np.nanargmax(column))
+
+    def best_per_metric(
+        self, is_loss: Optional[Dict[str, bool]] = None
+    ) -> Dict[str, Optional[int]]:
+        """Return the index of the best row for every metric.
+
+        Args:
+            is_loss: Optional mapping from metric name to a flag that tells if
+                lower values are better for that metric.
+        """
+        is_loss = is_loss or {}
+        if len(self) == 0:
+            return {metric: None for metric in self.metrics}
+
+        loss = np.array([is_loss.get(m, False) for m in self.metrics])
+        # Flip the sign of loss metrics so the best value is always the max.
+        keyed = np.where(loss, -self.values, self.values)
+        has_value = ~np.isnan(keyed).all(axis=0)
+        best = np.argmax(np.where(np.isnan(keyed), -np.inf, keyed), axis=0)
+        return {
+            metric: int(best[i]) if has_value[i] else None
+            for i, metric in enumerate(self.metrics)
+        }
+
+
+def _object_array(values: list) -> np.ndarray:
+    # Assign one by one, otherwise numpy would turn a list of equally long
+    # lists into a 2D array.
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
@@ -0,0 +1,508 @@
+"""Structural diff and patch of TaskDB trees.
+
+A `Patch` is a list of JSON serializable operations. Tasks and datasets are
+addressed by paths of names from the top-level task down. A sibling that
+shares its name with an earlier sibling is addressed as `[name, n]`, where
+`n` is the number of earlier siblings with the same name.
+
+SOTA rows are matched by their content hash (`hashing.row_digest`), so a
+changed row is a removal of the old row plus an insertion of the new one.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Union
+
+from sota_extractor.errors import DataError
+from sota_extractor.taskdb.v01.hashing import row_digest
+from sota_extractor.taskdb.v01.models import Dataset, Link, SotaRow, Task
+from sota_extractor.taskdb.v01.schemas import (
+    DatasetSchema,
+    LinkSchema,
+    SotaRowSchema,
+    TaskSchema,
+)
+
+PATCH_VERSION = 1
+
+Key = Union[str, List[Any]]
+Node = Union[Task, Dataset]
+
+_task_schema = TaskSchema()
+_dataset_schema = DatasetSchema()
+_row_schema = SotaRowSchema()
+_link_schema = LinkSchema()
+
+
+@dataclass
+class Patch:
+    """Operations that turn one TaskDB into another.
+
+    Operations, in the order they have to be applied:
+
+    - `remove_task`, `remove_dataset` - remove a task or a dataset with all
+      its descendants,
+    - `add_task`, `add_dataset` - insert a serialized task or dataset at
+      `index` of its parent list,
+    - `update_task`, `update_dataset` - replace the changed `fields`,
+    - `order_tasks`, `order_datasets` - if siblings were reordered, restore
+      the `order` of their keys in the list of the parent at `path` (and
+      `dataset_path`),
+    - `update_rows` - remove rows with the `removed` digests, insert the
+      `added` rows at their indices and, if rows were reordered, restore the
+      `order` of digests.
+    """
+
+    operations: List[Dict[str, Any]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Render the patch as a JSON serializable dictionary."""
+        return {"version": PATCH_VERSION, "operations": self.operations}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Patch":
+        """Load a patch rendered by `to_dict`."""
+        version = data.get("version")
+        if version != PATCH_VERSION:
+            raise DataError(f"Unsupported patch version: {version}")
+        return cls(operations=list(data["operations"]))
+
+    def summary(self) -> Dict[str, int]:
+        """Count added and removed tasks, datasets and rows."""
+        counts = Counter()
+        for op in self.operations:
+            kind = op["op"]
+            if kind == "add_task":
+                _count_task(op["task"], counts, "added")
+            elif kind == "add_dataset":
+                _count_dataset(op["dataset"], counts, "added")
+            elif kind in ("remove_task", "remove_dataset"):
+                for name in ("tasks", "datasets", "rows"):
+                    counts[f"{name}_removed"] += op["counts"][name]
+            elif kind == "update_rows":
+                counts["rows_added"] += len(op["added"])
+                counts["rows_removed"] += len(op["removed"])
+        return {
+            f"{name}_{change}": counts[f"{name}_{change}"]
+            for name in ("tasks", "datasets", "rows")
+            for change in ("added", "removed")
+        }
+
+
+def _count_dataset(data: Dict[str, Any], counts: Counter, change: str):
+    counts[f"datasets_{change}"] += 1
+    counts[f"rows_{change}"] += len(data.get("sota", {}).get("rows", []))
+    for subdataset in data.get("subdatasets", []):
+        _count_dataset(subdataset, counts, change)
+
+
+def _count_task(data: Dict[str, Any], counts: Counter, change: str):
+    counts[f"tasks_{change}"] += 1
+    for dataset in data.get("datasets", []):
+        _count_dataset(dataset, counts, change)
+    for subtask in data.get("subtasks", []):
+        _count_task(subtask, counts, change)
+
+
+def _subtree_counts(node: Node) -> Dict[str, int]:
+    counts = {"tasks": 0, "datasets": 0, "rows": 0}
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Task):
+            counts["tasks"] += 1
+            stack.extend(node.datasets)
+            stack.extend(node.subtasks)
+        else:
+            counts["datasets"] += 1
+            counts["rows"] += len(node.sota.rows)
+            stack.extend(node.subdatasets)
+    return counts
+
+
+def _keyed(nodes: Sequence[Node]) -> Dict[Hashable, Node]:
+    """Index sibling nodes by name, numbering repeated names."""
+    seen = Counter()
+    keyed = {}
+    for node in nodes:
+        n = seen[node.name]
+        seen[node.name] += 1
+        keyed[node.name if n == 0 else (node.name, n)] = node
+    return keyed
+
+
+def _json_key(key: Hashable) -> Key:
+    return list(key) if isinstance(key, tuple) else key
+
+
+def _hashable_key(key: Key) -> Hashable:
+    return tuple(key) if isinstance(key, list) else key
+
+
+def _links(links: List[Link]) -> List[Dict[str, str]]:
+    return _link_schema.dump(links, many=True)
+
+
+# Diff
+
+
+def _order(
+    old_keyed: Dict[Hashable, Node], new_keyed: Dict[Hashable, Node]
+) -> Optional[List[Key]]:
+    """Get the new order of sibling keys if the kept siblings were moved.
+
+    Removals and insertions at their indices keep the relative order of the
+    other siblings, so only a reorder of kept siblings needs an operation.
+    """
+    kept_old = [key for key in old_keyed if key in new_keyed]
+    kept_new = [key for key in new_keyed if key in old_keyed]
+    if kept_old == kept_new:
+        return None
+    return [_json_key(key) for key in new_keyed]
+
+
+def diff_tasks(old: Sequence[Task], new: Sequence[Task]) -> Patch:
+    """Compute the patch that turns the `old` tasks into the `new` ones."""
+    patch = Patch()
+    _diff_tasks(old, new, [], patch.operations)
+    return patch
+
+
+def _diff_tasks(
+    old: Sequence[Task], new: Sequence[Task], path: List[Key], ops: List
+):
+    old_keyed, new_keyed = _keyed(old), _keyed(new)
+    # Remove later siblings first, so the numbering of repeated names of the
+    # remaining ones doesn't change.
+    for key in reversed(list(old_keyed)):
+        if key not in new_keyed:
+            ops.append(
+                {
+                    "op": "remove_task",
+                    "path": path + [_json_key(key)],
+                    "counts": _subtree_counts(old_keyed[key]),
+                }
+            )
+    for index, (key, task) in enumerate(new_keyed.items()):
+        task_path = path + [_json_key(key)]
+        if key in old_keyed:
+            _diff_task(old_keyed[key], task, task_path, ops)
+        else:
+            ops.append(
+                {
+                    "op": "add_task",
+                    "path": task_path,
+                    "index": index,
+                    "task": _task_schema.dump(task),
+                }
+            )
+    order = _order(old_keyed, new_keyed)
+    if order is not None:
+        ops.append({"op": "order_tasks", "path": path, "order": order})
+
+
+def _diff_task(old: Task, new: Task, path: List[Key], ops: List):
+    fields = {}
+    if old.description != new.description:
+        fields["description"] = new.description
+    for name in ("categories", "synonyms"):
+        if getattr(old, name) != getattr(new, name):
+            fields[name] = list(getattr(new, name))
+    if old.source_link != new.source_link:
+        fields["source_link"] = (
+            None
+            if new.source_link is None
+            else _link_schema.dump(new.source_link)
+        )
+    if fields:
+        ops.append({"op": "update_task", "path": path, "fields": fields})
+
+    _diff_datasets(old.datasets, new.datasets, path, [], ops)
+    _diff_tasks(old.subtasks, new.subtasks, path, ops)
+
+
+def _diff_datasets(
+    old: Sequence[Dataset],
+    new: Sequence[Dataset],
+    path: List[Key],
+    dataset_path: List[Key],
+    ops: List,
+):
+    old_keyed, new_keyed = _keyed(old), _keyed(new)
+    for key in reversed(list(old_keyed)):
+        if key not in new_keyed:
+            ops.append(
+                {
+                    "op": "remove_dataset",
+                    "path": path,
+                    "dataset_path": dataset_path + [_json_key(key)],
+                    "counts": _subtree_counts(old_keyed[key]),
+                }
+            )
+    for index, (key, dataset) in enumerate(new_keyed.items()):
+        sub_path = dataset_path + [_json_key(key)]
+        if key in old_keyed:
+            _diff_dataset(old_keyed[key], dataset, path, sub_path, ops)
+        else:
+            ops.append(
+                {
+                    "op": "add_dataset",
+                    "path": path,
+                    "dataset_path": sub_path,
+                    "index": index,
+                    "dataset": _dataset_schema.dump(dataset),
+                }
+            )
+    order = _order(old_keyed, new_keyed)
+    if order is not None:
+        ops.append(
+            {
+                "op": "order_datasets",
+                "path": path,
+                "dataset_path": dataset_path,
+                "order": order,
+            }
+        )
+
+
+def _diff_dataset(
+    old: Dataset,
+    new: Dataset,
+    path: List[Key],
+    dataset_path: List[Key],
+    ops: List,
+):
+    fields = {}
+    if old.description != new.description:
+        fields["description"] = new.description
+    if old.sota.metrics != new.sota.metrics:
+        fields["metrics"] = list(new.sota.metrics)
+    if old.links != new.links:
+        fields["links"] = _links(new.links)
+    if old.citations != new.citations:
+        fields["citations"] = _links(new.citations)
+    if fields:
+        ops.append(
+            {
+                "op": "update_dataset",
+                "path": path,
+                "dataset_path": dataset_path,
+                "fields": fields,
+            }
+        )
+
+    rows = _diff_rows(old.sota.rows, new.sota.rows)
+    if rows is not None:
+        rows.update(
+            {"op": "update_rows", "path": path, "dataset_path": dataset_path}
+        )
+        ops.append(rows)
+
+    _diff_datasets(old.subdatasets, new.subdatasets, path, dataset_path, ops)
+
+
+def _diff_rows(
+    old: Sequence[SotaRow], new: Sequence[SotaRow]
+) -> Optional[Dict[str, Any]]:
+    old_digests = [row_digest(row) for row in old]
+    new_digests = [row_digest(row) for row in new]
+    if old_digests == new_digests:
+        return None
+
+    available = Counter(old_digests)
+    added, kept = [], []
+    for index, digest in enumerate(new_digests):
+        if available[digest] > 0:
+            available[digest] -= 1
+            kept.append(digest)
+        else:
+            added.append(index)
+
+    remaining = Counter(kept)
+    removed, survivors = [], []
+    for digest in old_digests:
+        if remaining[digest] > 0:
+            remaining[digest] -= 1
+            survivors.append(digest)
+        else:
+            removed.append(digest)
+
+    result = {
+        "removed": removed,
+        "added": [
+            {"index": index, "row": _row_schema.dump(new[index])}
+            for index in added
+        ],
+    }
+    if survivors != kept:
+        result["order"] = new_digests
+    return result
+
+
+# Apply
+
+
+def _find(nodes: Sequence[Node], key: Key) -> Node:
+    return _find_keyed(_keyed(nodes), key)
+
+
+def _find_keyed(keyed: Dict[Hashable, Node], key: Key) -> Node:
+    node = keyed.get(_hashable_key(key))
+    if node is None:
+        raise DataError(f"Patch does not apply, {key} not found.")
+    return node
+
+
+def _remove(nodes: List[Node], node: Node):
+    # By identity, equal siblings must not be removed instead.
+    for i, sibling in enumerate(nodes):
+        if sibling is node:
+            del nodes[i]
+            return
+
+
+def _resolve_task(tasks: Dict[str, Task], path: List[Key]) -> Task:
+    task = _find(list(tasks.values()), path[0])
+    for key in path[1:]:
+        task = _find(task.subtasks, key)
+    return task
+
+
+def _resolve_dataset(task: Task, dataset_path: List[Key]) -> Dataset:
+    dataset = _find(task.datasets, dataset_path[0])
+    for key in dataset_path[1:]:
+        dataset = _find(dataset.subdatasets, key)
+    return dataset
+
+
+def _dataset_parent(tasks: Dict[str, Task], op: Dict[str, Any]):
+    """Get the task or dataset whose dataset list is changed by `op`."""
+    task = _resolve_task(tasks, op["path"])
+    if len(op["dataset_path"]) == 1:
+        return task, task.datasets
+    parent = _resolve_dataset(task, op["dataset_path"][:-1])
+    return parent, parent.subdatasets
+
+
+def _reorder(nodes: Sequence[Node], order: List[Key]) -> List[Node]:
+    keyed = _keyed(nodes)
+    if len(order) != len(keyed):
+        raise DataError("Patch does not apply, siblings do not match.")
+    return [_find_keyed(keyed, key) for key in order]
+
+
+def _apply_rows(rows: List[SotaRow], op: Dict[str, Any]) -> List[SotaRow]:
+    remove = Counter(op["removed"])
+    survivors = []
+    for row in rows:
+        digest = row_digest(row)
+        if remove[digest] > 0:
+            remove[digest] -= 1
+        else:
+            survivors.append((digest, row))
+    if sum(remove.values()):
+        raise DataError("Patch does not apply, rows to remove not found.")
+
+    added = {
+        item["index"]: _row_schema.load(item["row"]) for item in op["added"]
+    }
+    if "order" not in op:
+        result = [row for _, row in survivors]
+        for index in sorted(added):
+            result.insert(index, added[index])
+        return result
+
+    by_digest: Dict[str, List[SotaRow]] = {}
+    for digest, row in reversed(survivors):
+        by_digest.setdefault(digest, []).append(row)
+    result = []
+    for index, digest in enumerate(op["order"]):
+        if index in added:
+            result.append(added[index])
+        elif by_digest.get(digest):
+            result.append(by_digest[digest].pop())
+        else:
+            raise DataError("Patch does not apply, rows do not match.")
+    return result
+
+
+def apply_patch(tasks: Dict[str, Task], patch: Patch):
+    """Apply a patch in place to a dictionary of top-level tasks."""
+    for op in patch.operations:
+        kind = op["op"]
+        if kind == "remove_task":
+            task = _resolve_task(tasks, op["path"])
+            if len(op["path"]) == 1:
+                del tasks[task.name]
+            else:
+                parent = _resolve_task(tasks, op["path"][:-1])
+                _remove(parent.subtasks, task)
+        elif kind == "add_task":
+            task = _task_schema.load(op["task"])
+            if len(op["path"]) == 1:
+                items = list(tasks.items())
+                items.insert(op["index"], (task.name, task))
+                tasks.clear()
+                tasks.update(items)
+            else:
+                parent = _resolve_task(tasks, op["path"][:-1])
+                task.parent = parent
+                parent.subtasks.insert(op["index"], task)
+        elif kind == "order_tasks":
+            if op["path"]:
+                parent = _resolve_task(tasks, op["path"])
+                parent.subtasks = _reorder(parent.subtasks, op["order"])
+            else:
+                ordered = _reorder(list(tasks.values()), op["order"])
+                tasks.clear()
+                tasks.update((task.name, task) for task in ordered)
+        elif kind == "update_task":
+            task = _resolve_task(tasks, op["path"])
+            fields = op["fields"]
+            if "description" in fields:
+                task.description = fields["description"]
+            for name in ("categories", "synonyms"):
+                if name in fields:
+                    setattr(task, name, list(fields[name]))
+            if "source_link" in fields:
+                link = fields["source_link"]
+                task.source_link = (
+                    None if link is None else _link_schema.load(link)
+                )
+        elif kind == "remove_dataset":
+            _, siblings = _dataset_parent(tasks, op)
+            _remove(siblings, _find(siblings, op["dataset_path"][-1]))
+        elif kind == "add_dataset":
+            parent, siblings = _dataset_parent(tasks, op)
+            dataset = _dataset_schema.load(op["dataset"])
+            if isinstance(parent, Dataset):
+                dataset.parent = parent
+            siblings.insert(op["index"], dataset)
+        elif kind == "order_datasets":
+            task = _resolve_task(tasks, op["path"])
+            if op["dataset_path"]:
+                parent = _resolve_dataset(task, op["dataset_path"])
+                parent.subdatasets = _reorder(parent.subdatasets, op["order"])
+            else:
+                task.datasets = _reorder(task.datasets, op["order"])
+        elif kind == "update_dataset":
+            task = _resolve_task(tasks, op["path"])
+            dataset = _resolve_dataset(task, op["dataset_path"])
+            fields = op["fields"]
+            if "description" in fields:
+                dataset.description = fields["description"]
+            if "metrics" in fields:
+                dataset.sota.metrics = list(fields["metrics"])
+            for name in ("links", "citations"):
+                if name in fields:
+                    links = _link_schema.load(fields[name], many=True)
+                    setattr(dataset, name, links)
+        elif kind == "update_rows":
+            task = _resolve_task(tasks, op["path"])
+            dataset = _resolve_dataset(task, op["dataset_path"])
+            dataset.sota.rows = _apply_rows(dataset.sota.rows, op)
+        else:
+            raise DataError(f"Unknown patch operation: {kind}")
@@ -0,0 +1,92 @@
+import re
+import json
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+
+from sota_extractor.taskdb.v01.models import SotaRow
+
+_ARXIV_PDF = re.compile(r"^/pdf/(?P<id>.+?)(?:v\d+)?(?:\.pdf)?$")
+_ARXIV_ABS = re.compile(r"^/abs/(?P<id>.+?)(?:v\d+)?$")
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a paper url so that equivalent urls compare equal.
+
+    The scheme is forced to https, the host is lowercased and stripped of
+    "www.", the fragment and trailing slashes are dropped, and arXiv pdf and
+    versioned urls are rewritten to the unversioned abstract url, e.g.
+    "http://arxiv.org/pdf/1810.04805v2.pdf" becomes
+    "https://arxiv.org/abs/1810.04805".
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url.rstrip("/")
+
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/")
+    if host in ("arxiv.org", "export.arxiv.org"):
+        host = "arxiv.org"
+        match = _ARXIV_PDF.match(path) or _ARXIV_ABS.match(path)
+        if match is not None:
+            path = f"/abs/{match.group('id')}"
+    return urlunsplit(("https", host, path, parts.query, ""))
+
+
+def row_key(row: SotaRow) -> bytes:
+    """Return the identity hash of a SOTA row.
+
+    Two rows describe the same result if they have the same model name, the
+    same (normalized) paper url and the same metric values, regardless of
+    titles, dates or links. Metric values are compared as stripped strings,
+    so "91.2" and 91.2 are considered equal.
+    """
+    metrics = sorted(
+        (name, str(value).strip()) for name, value in row.metrics.items()
+    )
+    payload = json.dumps(
+        [
+            (row.model_name or "").strip(),
+            normalize_url(row.paper_url),
+            metrics,
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def row_digest(row: SotaRow) -> str:
+    """Return the content hash of a SOTA row.
+
+    Unlike `row_key`, every field of the row is hashed, as it would be
+    serialized, so two rows have the same digest only if they export to the
+    same JSON.
+    """
+    date = row.paper_date
+    fields = [
+        row.model_name,
+        row.paper_title,
+        row.paper_url,
+        None if date is None else date.strftime("%Y-%m-%d"),
+        [[link.title, link.url] for link in row.code_links],
+        [[link.title, link.url] for link in row.model_links],
+        row.metrics,
+        bool(row.uses_additional_data),
+    ]
+    # Like the export, unranked rows keep the digest they had before ranks.
+    if row.ranks or row.best_rank is not None or row.best_metric is not None:
+        fields.append([row.ranks, row.best_rank, row.best_metric])
+    payload = json.dumps(
+        fields,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
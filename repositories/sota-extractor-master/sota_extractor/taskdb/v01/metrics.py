@@ -0,0 +1,136 @@
+import re
+import enum
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+
+
+class MetricFlag(enum.IntFlag):
+    """Unit and annotation flags of a parsed metric value.
+
+    Flags are stored in an uint8 array next to the parsed float values.
+    """
+
+    none = 0
+    #: Value was given in percent, e.g. "91.2%".
+    percent = 1
+    #: Value had a thousands suffix ("12k") and was multiplied by 1e3.
+    thousands = 2
+    #: Value had a millions suffix ("1.2M") and was multiplied by 1e6.
+    millions = 4
+    #: Value had a billions suffix ("1.5B") and was multiplied by 1e9.
+    billions = 8
+    #: Value is a placeholder for a missing value: "", "-", "—", "?", ...
+    missing = 16
+    #: Value could not be parsed as a number.
+    invalid = 32
+    #: Number is annotated: "~12", "91.2*", "91.2 ± 0.1", "91.2 (note)", ...
+    annotated = 64
+
+
+_UNITS = {
+    "%": (MetricFlag.percent, 1.0),
+    "k": (MetricFlag.thousands, 1e3),
+    "m": (MetricFlag.millions, 1e6),
+    "b": (MetricFlag.billions, 1e9),
+}
+
+_MISSING = {"", "-", "--", "---", "—", "–", "−", "?", "n/a", "na", "none"}
+
+_NUMBER = re.compile(
+    r"""
+    ^
+    (?P<approx>~)?                         # Optional approximation sign
+    \s*
+    (?P<number>
+        [-+]?
+        (?:\d+(?:,\d{3})*(?:\.\d*)?|\.\d+)  # 12 | 1,234 | 12.5 | .5
+        (?:[eE][-+]?\d+)?                   # Optional exponent
+    )
+    \s*
+    (?P<unit>%|[kKmMbB](?![a-zA-Z]))?      # Optional unit suffix
+    (?P<rest>.*)                           # Annotations
+    $
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+def parse_metric_value(value: Any) -> Tuple[float, int]:
+    """Parse a single metric value into a float and `MetricFlag` flags.
+
+    Numbers are returned unchanged, strings are stripped from markdown bold
+    markers and whitespace, unit suffixes are normalized (percent values keep
+    their magnitude, "1.2M" becomes 1200000.0) and trailing annotations are
+    ignored but flagged.
+    """
+    if value is None:
+        return np.nan, MetricFlag.missing
+    if isinstance(value, bool):
+        return float(value), MetricFlag.none
+    if isinstance(value, (int, float)):
+        return float(value), MetricFlag.none
+
+    s = str(value).replace("\ufeff", "").replace("**", "").strip()
+    if s.lower() in _MISSING:
+        return np.nan, MetricFlag.missing
+
+    flags = MetricFlag.none
+    stripped = s.rstrip("*+?").strip()
+    if stripped != s:
+        # Footnote markers: "91.2*", "91.2+", "1.5B?"
+        flags |= MetricFlag.annotated
+        s = stripped
+    if s.lower() in _MISSING:
+        return np.nan, MetricFlag.missing | flags
+    if s[0] in "−–":
+        # Unicode minus signs
+        s = "-" + s[1:]
+
+    match = _NUMBER.match(s)
+    if match is None:
+        return np.nan, MetricFlag.invalid
+
+    number = float(match.group("number").replace(",", ""))
+    unit = match.group("unit")
+    if unit is not None:
+        unit_flag, multiplier = _UNITS[unit.lower()]
+        flags |= unit_flag
+        number *= multiplier
+    if match.group("approx") or match.group("rest").strip():
+        flags |= MetricFlag.annotated
+    return number, flags
+
+
+def parse_metric_values(
+    values: Iterable[Any],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a whole column of metric values in one pass.
+
+    Leaderboard columns contain a lot of repeated values, so every distinct
+    value is parsed only once.
+
+    Args:
+        values: Metric values - strings, numbers or `None` for missing
+            values.
+
+    Returns:
+        Tuple of float64 array with parsed values (`NaN` where the value is
+        missing or invalid) and uint8 array of `MetricFlag` flags.
+    """
+    values = list(values)
+    parsed: Dict[Any, Tuple[float, int]] = {}
+    numbers = np.empty(len(values), dtype=np.float64)
+    flags = np.empty(len(values), dtype=np.uint8)
+    for i, value in enumerate(values):
+        # Key on the type as well, so that 1, 1.0 and True are kept apart.
+        key = (type(value), value)
+        try:
+            result = parsed[key]
+        except KeyError:
+            result = parsed[key] = parse_metric_value(value)
+        except TypeError:
+            # Unhashable value
+            result = parse_metric_value(value)
+        numbers[i], flags[i] = result
+    return numbers, flags
@@ -1,6 +1,9 @@
 from datetime import datetime
-from typing import List, Optional, Dict
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple
+
+if TYPE_CHECKING:
+    from sota_extractor.taskdb.v01.columnar import ColumnarSota
 
 
 @dataclass
@@ -19,12 +22,36 @@ class SotaRow:
     model_links: List[Link] = field(default_factory=list)
     metrics: Dict[str, str] = field(default_factory=dict)
     uses_additional_data: bool = False
+    # Leaderboard position, set by `TaskDB.compute_ranks`: rank of the row for
+    # every metric it is ranked on, its best rank and the metric of the best
+    # rank.
+    ranks: Dict[str, int] = field(default_factory=dict)
+    best_rank: Optional[int] = None
+    best_metric: Optional[str] = None
 
 
 @dataclass
 class Sota:
     metrics: List[str] = field(default_factory=list)
     rows: List[SotaRow] = field(default_factory=list)
+    _columnar: Optional[Tuple[tuple, "ColumnarSota"]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_columnar(self, refresh: bool = False) -> "ColumnarSota":
+        """Return the columnar representation of this table.
+
+        The columnar table, with all metric values already parsed, is cached
+        on the instance. The cache is rebuilt when the rows list or the
+        metrics list is replaced or changes length. If rows are edited in
+        place pass `refresh=True`.
+        """
+        from sota_extractor.taskdb.v01.columnar import ColumnarSota
+
+        key = (id(self.rows), len(self.rows), tuple(self.metrics))
+        if refresh or self._columnar is None or self._columnar[0] != key:
+            self._columnar = (key, ColumnarSota.from_sota(self))
+        return self._columnar[1]
 
 
 @dataclass
@@ -0,0 +1,120 @@
+import re
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from sota_extractor.taskdb.v01.columnar import ColumnarSota
+
+LOSS_METRIC = re.compile(
+    r"""
+    error | loss | perplexity | \bppl\b | \bwer\b | \bcer\b | \bfid\b
+    | \bmae\b | \bmse\b | \brmse\b | \bter\b | distance | latency | \btime\b
+    | \bparams\b | parameters | \bbpc\b | \bbpd\b | bits[\s/-]per
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+IsLoss = Union[Callable[[str], bool], Dict[str, bool]]
+
+
+def is_loss_metric(name: str) -> bool:
+    """Guess if lower values are better for the metric.
+
+    The offline data has no metric direction, so it is derived from the
+    metric name, e.g. "Error", "Perplexity", "WER", "Number of params".
+    """
+    return LOSS_METRIC.search(name) is not None
+
+
+def _loss_function(is_loss: Optional[IsLoss]) -> Callable[[str], bool]:
+    if is_loss is None:
+        return is_loss_metric
+    if isinstance(is_loss, dict):
+        return lambda name: is_loss.get(name, is_loss_metric(name))
+    return is_loss
+
+
+def rank_leaderboards(
+    tables: List[ColumnarSota], is_loss: Optional[IsLoss] = None
+):
+    """Compute and store per-metric ranks for many leaderboards at once.
+
+    All tables are flattened into one array of `(column, row, value)`
+    entries, where every metric column of every table is its own group, so
+    ranking all leaderboards is a single sort.
+
+    Ties get the same (lowest) rank: values 90, 90, 80 are ranked 1, 1, 3.
+    Results are written into each table's `ranks`, `best_rank` and
+    `best_metric` attributes.
+
+    Args:
+        tables: Columnar leaderboards to rank.
+        is_loss: Either a function or a dictionary that tells if lower values
+            are better for a metric name. Metric names missing from the
+            dictionary fall back to `is_loss_metric`.
+    """
+    is_loss = _loss_function(is_loss)
+    if len(tables) == 0:
+        return
+
+    # Global metric column ids and global row ids of every table value.
+    column_offsets = np.cumsum([0] + [len(t.metrics) for t in tables])
+    row_offsets = np.cumsum([0] + [len(t) for t in tables])
+    columns, rows, keys, local_columns = [], [], [], []
+    for i, table in enumerate(tables):
+        n, m = table.values.shape
+        loss = np.array([is_loss(name) for name in table.metrics], dtype=bool)
+        # Best value is always the smallest key.
+        keys.append(np.where(loss, table.values, -table.values).ravel())
+        local = np.tile(np.arange(m), n)
+        local_columns.append(local)
+        columns.append(column_offsets[i] + local)
+        rows.append(row_offsets[i] + np.repeat(np.arange(n), m))
+
+    column = np.concatenate(columns)
+    row = np.concatenate(rows)
+    key = np.concatenate(keys)
+    local_column = np.concatenate(local_columns)
+    size = len(key)
+    positions = np.arange(size)
+
+    # 1) Rank every value within its metric column.
+    order = np.lexsort((key, column))
+    sorted_column = column[order]
+    sorted_key = key[order]
+    column_start = np.ones(size, dtype=bool)
+    column_start[1:] = sorted_column[1:] != sorted_column[:-1]
+    value_start = column_start.copy()
+    value_start[1:] |= sorted_key[1:] != sorted_key[:-1]
+    first_in_column = np.maximum.accumulate(
+        np.where(column_start, positions, 0)
+    )
+    first_in_tie = np.maximum.accumulate(np.where(value_start, positions, 0))
+    sorted_rank = (first_in_tie - first_in_column + 1).astype(np.int32)
+    sorted_rank[np.isnan(sorted_key)] = 0
+    rank = np.empty(size, dtype=np.int32)
+    rank[order] = sorted_rank
+
+    # 2) Pick the best rank of every row, ties go to the first metric.
+    rank_key = np.where(rank > 0, rank, np.iinfo(np.int32).max)
+    order = np.lexsort((local_column, rank_key, row))
+    sorted_row = row[order]
+    row_start = np.ones(size, dtype=bool)
+    row_start[1:] = sorted_row[1:] != sorted_row[:-1]
+    best = order[row_start]
+    best_rank = np.zeros(row_offsets[-1], dtype=np.int32)
+    best_column = np.full(row_offsets[-1], -1, dtype=np.int64)
+    best_rank[row[best]] = rank[best]
+    best_column[row[best]] = np.where(rank[best] > 0, local_column[best], -1)
+
+    # 3) Write everything back into the tables.
+    value_offsets = np.cumsum([0] + [t.values.size for t in tables])
+    for i, table in enumerate(tables):
+        rows_slice = slice(row_offsets[i], row_offsets[i + 1])
+        table.ranks = rank[value_offsets[i] : value_offsets[i + 1]].reshape(
+            table.values.shape
+        )
+        table.best_rank = best_rank[rows_slice]
+        # Index -1 (row without any rank) maps to None.
+        metrics = np.array(list(table.metrics) + [None], dtype=object)
+        table.best_metric = metrics[best_column[rows_slice]]
@@ -14,8 +14,9 @@ class LinkSchema(Schema):
 
 class SotaRowSchema(Schema):
     model_name = fields.String(required=True)
-    paper_title = fields.String(missing="")
-    paper_url = fields.String(missing="")
+    # Scraped rows without a paper have None here (e.g. reddit and eff.json).
+    paper_title = fields.String(missing="", allow_none=True)
+    paper_url = fields.String(missing="", allow_none=True)
     paper_date = fields.Date(format="%Y-%m-%d", allow_none=True, missing=None)
     code_links = fields.Nested(LinkSchema, many=True, missing=list)
     model_links = fields.Nested(LinkSchema, many=True, missing=list)
@@ -23,11 +24,26 @@ class SotaRowSchema(Schema):
     uses_additional_data = fields.Boolean(
         default=False, missing=False, allow_none=False
     )
+    ranks = fields.Dict(
+        keys=fields.String(), values=fields.Integer(), missing=dict
+    )
+    best_rank = fields.Integer(allow_none=True, missing=None)
+    best_metric = fields.String(allow_none=True, missing=None)
 
     @post_load
     def post_load(self, data, **kwargs):
         return SotaRow(**data)
 
+    @post_dump
+    def post_dump(self, data, **kwargs):
+        # Rows that were never ranked are exported as before.
+        if not data.get("ranks"):
+            data.pop("ranks", None)
+        for name in ("best_rank", "best_metric"):
+            if data.get(name) is None:
+                data.pop(name, None)
+        return data
+
 
 class SotaSchema(Schema):
     metrics = fields.List(fields.String(), missing=list)
@@ -0,0 +1,497 @@
+"""Binary TaskDB snapshots.
+
+A snapshot stores a populated TaskDB so that it can be loaded without
+parsing JSON or running the marshmallow schemas. Layout of the file:
+
+- fixed size prefix: magic bytes, format version and header size,
+- JSON header with the task/dataset tree (names, descriptions, links,
+  metric lists and the range of rows of every dataset) and the location of
+  every array,
+- 64-byte aligned NumPy arrays with the SOTA rows of all datasets, stored as
+  flat columns. All row strings (model names, paper titles and urls, link
+  titles and urls, metric names and values) are interned into one string
+  table, so the row columns hold only integer ids. The leaderboard ranks
+  stored by `TaskDB.compute_ranks` are kept next to the metric values.
+
+Because the arrays are stored raw, the file can be memory-mapped and shared
+by several processes. Rows are then materialized lazily, on first access.
+"""
+
+import io
+import json
+import struct
+from collections.abc import MutableSequence, Sequence
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from sota_extractor.errors import DataError
+from sota_extractor.taskdb.v01.columnar import date_to_days, days_to_date
+from sota_extractor.taskdb.v01.models import (
+    Dataset,
+    Link,
+    Sota,
+    SotaRow,
+    Task,
+)
+
+MAGIC = b"SOTASNAP"
+VERSION = 2
+# Version 1 snapshots have no rank columns, their rows are loaded unranked.
+READABLE_VERSIONS = (1, 2)
+ALIGNMENT = 64
+# magic, version, reserved, header size
+_PREFIX = struct.Struct("<8sIIQ")
+
+# Kinds of metric values.
+_STR, _INT, _FLOAT, _BOOL, _NONE, _JSON = range(6)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class _Writer:
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.columns: Dict[str, list] = {
+            name: []
+            for name in (
+                "row_model_name",
+                "row_paper_title",
+                "row_paper_url",
+                "row_paper_date",
+                "row_uses_additional_data",
+                "row_best_rank",
+                "row_best_metric",
+                "code_link_title",
+                "code_link_url",
+                "model_link_title",
+                "model_link_url",
+                "metric_name",
+                "metric_kind",
+                "metric_int",
+                "metric_float",
+                "metric_rank",
+            )
+        }
+        self.code_links = [0]
+        self.model_links = [0]
+        self.metrics = [0]
+
+    def string(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        try:
+            return self.strings[value]
+        except KeyError:
+            index = self.strings[value] = len(self.strings)
+            return index
+
+    def links(self, links: List[Link], kind: str, offsets: List[int]):
+        titles = self.columns[f"{kind}_link_title"]
+        urls = self.columns[f"{kind}_link_url"]
+        for link in links:
+            titles.append(self.string(link.title))
+            urls.append(self.string(link.url))
+        offsets.append(len(titles))
+
+    def metric(self, name: str, value: Any, rank: int):
+        columns = self.columns
+        columns["metric_name"].append(self.string(name))
+        columns["metric_rank"].append(rank)
+        number, kind = 0.0, _STR
+        if value is None:
+            integer, kind = 0, _NONE
+        elif isinstance(value, bool):
+            integer, kind = int(value), _BOOL
+        elif isinstance(value, int) and -(2**63) <= value < 2**63:
+            integer, kind = value, _INT
+        elif isinstance(value, float):
+            integer, number, kind = 0, value, _FLOAT
+        elif isinstance(value, str):
+            integer = self.string(value)
+        else:
+            integer, kind = self.string(json.dumps(value)), _JSON
+        columns["metric_kind"].append(kind)
+        columns["metric_int"].append(integer)
+        columns["metric_float"].append(number)
+
+    def row(self, row: SotaRow):
+        columns = self.columns
+        columns["row_model_name"].append(self.string(row.model_name))
+        columns["row_paper_title"].append(self.string(row.paper_title))
+        columns["row_paper_url"].append(self.string(row.paper_url))
+        columns["row_paper_date"].append(date_to_days(row.paper_date))
+        columns["row_uses_additional_data"].append(row.uses_additional_data)
+        columns["row_best_rank"].append(row.best_rank or 0)
+        columns["row_best_metric"].append(self.string(row.best_metric))
+        self.links(row.code_links, "code", self.code_links)
+        self.links(row.model_links, "model", self.model_links)
+        # Ranks are only stored for the metrics of the row.
+        for name, value in row.metrics.items():
+            self.metric(name, value, row.ranks.get(name, 0))
+        self.metrics.append(len(columns["metric_name"]))
+
+    def dataset(self, dataset: Dataset) -> Dict[str, Any]:
+        start = len(self.columns["row_model_name"])
+        for row in dataset.sota.rows:
+            self.row(row)
+        return {
+            "name": dataset.name,
+            "is_subdataset": dataset.is_subdataset,
+            "description": dataset.description,
+            "metrics": list(dataset.sota.metrics),
+            "rows": [start, len(self.columns["row_model_name"])],
+            "links": [[link.title, link.url] for link in dataset.links],
+            "citations": [
+                [link.title, link.url] for link in dataset.citations
+            ],
+            "subdatasets": [self.dataset(d) for d in dataset.subdatasets],
+        }
+
+    def task(self, task: Task) -> Dict[str, Any]:
+        source_link = task.source_link
+        return {
+            "name": task.name,
+            "description": task.description,
+            "categories": list(task.categories),
+            "synonyms": list(task.synonyms),
+            "source_link": (
+                None
+                if source_link is None
+                else [source_link.title, source_link.url]
+            ),
+            "datasets": [self.dataset(d) for d in task.datasets],
+            "subtasks": [self.task(t) for t in task.subtasks],
+        }
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        encoded = [s.encode("utf-8", "surrogatepass") for s in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(s) for s in encoded], out=offsets[1:])
+        columns = self.columns
+        return {
+            "strings_data": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "strings_offsets": offsets,
+            "row_model_name": np.array(columns["row_model_name"], np.int32),
+            "row_paper_title": np.array(columns["row_paper_title"], np.int32),
+            "row_paper_url": np.array(columns["row_paper_url"], np.int32),
+            "row_paper_date": np.array(columns["row_paper_date"], np.int64),
+            "row_uses_additional_data": np.array(
+                columns["row_uses_additional_data"], np.bool_
+            ),
+            "row_best_rank": np.array(columns["row_best_rank"], np.int32),
+            "row_best_metric": np.array(columns["row_best_metric"], np.int32),
+            "row_code_links": np.array(self.code_links, np.int64),
+            "row_model_links": np.array(self.model_links, np.int64),
+            "row_metrics": np.array(self.metrics, np.int64),
+            "code_link_title": np.array(columns["code_link_title"], np.int32),
+            "code_link_url": np.array(columns["code_link_url"], np.int32),
+            "model_link_title": np.array(
+                columns["model_link_title"], np.int32
+            ),
+            "model_link_url": np.array(columns["model_link_url"], np.int32),
+            "metric_name": np.array(columns["metric_name"], np.int32),
+            "metric_kind": np.array(columns["metric_kind"], np.uint8),
+            "metric_int": np.array(columns["metric_int"], np.int64),
+            "metric_float": np.array(columns["metric_float"], np.float64),
+            "metric_rank": np.array(columns["metric_rank"], np.int32),
+        }
+
+
+def save_snapshot(tasks: List[Task], path: str):
+    """Write tasks into a binary snapshot file."""
+    writer = _Writer()
+    tree = [writer.task(task) for task in tasks]
+    arrays = writer.arrays()
+
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        offset = _aligned(offset)
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset += array.nbytes
+    header = json.dumps({"tasks": tree, "arrays": layout}).encode("utf-8")
+
+    data_start = _aligned(_PREFIX.size + len(header))
+    with io.open(path, mode="wb") as fp:
+        fp.write(_PREFIX.pack(MAGIC, VERSION, 0, len(header)))
+        fp.write(header)
+        for name, array in arrays.items():
+            fp.seek(data_start + layout[name]["offset"])
+            fp.write(array.tobytes())
+
+
+class _Reader:
+    """Access to the arrays of a snapshot file."""
+
+    def __init__(self, path: str, mmap: bool = False):
+        with io.open(path, mode="rb") as fp:
+            prefix = fp.read(_PREFIX.size)
+            if len(prefix) != _PREFIX.size:
+                raise DataError(f"Not a TaskDB snapshot: {path}")
+            magic, version, _, header_size = _PREFIX.unpack(prefix)
+            if magic != MAGIC:
+                raise DataError(f"Not a TaskDB snapshot: {path}")
+            if version not in READABLE_VERSIONS:
+                raise DataError(
+                    f"Unsupported snapshot version {version} in {path}, "
+                    f"expected {VERSION}."
+                )
+            self.header = json.loads(fp.read(header_size).decode("utf-8"))
+            if not mmap:
+                fp.seek(0)
+                buffer = fp.read()
+
+        if mmap:
+            buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        data_start = _aligned(_PREFIX.size + header_size)
+        self.arrays: Dict[str, np.ndarray] = {}
+        for name, spec in self.header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"], dtype=np.int64))
+            self.arrays[name] = np.frombuffer(
+                buffer,
+                dtype=dtype,
+                count=count,
+                offset=data_start + spec["offset"],
+            ).reshape(spec["shape"])
+
+        self._strings_data = self.arrays["strings_data"]
+        self._strings_offsets = self.arrays["strings_offsets"]
+        self._strings: Dict[int, str] = {}
+
+    def string(self, index: int) -> Optional[str]:
+        if index < 0:
+            return None
+        try:
+            return self._strings[index]
+        except KeyError:
+            start = self._strings_offsets[index]
+            end = self._strings_offsets[index + 1]
+            value = self._strings_data[start:end].tobytes()
+            value = self._strings[index] = value.decode(
+                "utf-8", "surrogatepass"
+            )
+            return value
+
+    def all_strings(self) -> List[str]:
+        """Decode the whole string table at once."""
+        data = self._strings_data.tobytes()
+        offsets = self._strings_offsets.tolist()
+        return [
+            data[offsets[i] : offsets[i + 1]].decode("utf-8", "surrogatepass")
+            for i in range(len(offsets) - 1)
+        ]
+
+
+class _RowBuilder:
+    """Builds `SotaRow` objects from the flat snapshot columns.
+
+    With `eager=True` all columns are converted to Python lists upfront,
+    which is the fastest way to build every row. Otherwise the columns are
+    read in place, which keeps memory-mapped files unloaded until a row is
+    accessed.
+    """
+
+    def __init__(self, reader: _Reader, eager: bool):
+        arrays = reader.arrays
+        if eager:
+            strings = reader.all_strings()
+            self.string = lambda i: None if i < 0 else strings[i]
+            self.columns = {name: a.tolist() for name, a in arrays.items()}
+        else:
+            self.string = reader.string
+            self.columns = arrays
+        self.ranked = "metric_rank" in self.columns
+
+    def links(self, kind: str, i: int) -> List[Link]:
+        offsets = self.columns[f"row_{kind}_links"]
+        title = self.columns[f"{kind}_link_title"]
+        url = self.columns[f"{kind}_link_url"]
+        string = self.string
+        return [
+            Link(title=string(title[j]), url=string(url[j]))
+            for j in range(int(offsets[i]), int(offsets[i + 1]))
+        ]
+
+    def metric(self, j: int) -> Tuple[str, Any]:
+        columns = self.columns
+        kind = columns["metric_kind"][j]
+        integer = int(columns["metric_int"][j])
+        if kind == _STR:
+            value = self.string(integer)
+        elif kind == _INT:
+            value = integer
+        elif kind == _FLOAT:
+            value = float(columns["metric_float"][j])
+        elif kind == _BOOL:
+            value = bool(integer)
+        elif kind == _NONE:
+            value = None
+        else:
+            value = json.loads(self.string(integer))
+        return self.string(columns["metric_name"][j]), value
+
+    def ranks(self, i: int) -> Dict[str, Any]:
+        """Return the rank fields of a row, empty for unranked snapshots."""
+        # A row with any rank has a best rank.
+        if not self.ranked or not self.columns["row_best_rank"][i]:
+            return {}
+        columns = self.columns
+        metrics = columns["row_metrics"]
+        ranks = {}
+        for j in range(int(metrics[i]), int(metrics[i + 1])):
+            rank = int(columns["metric_rank"][j])
+            if rank:
+                ranks[self.string(columns["metric_name"][j])] = rank
+        return {
+            "ranks": ranks,
+            "best_rank": int(columns["row_best_rank"][i]) or None,
+            "best_metric": self.string(columns["row_best_metric"][i]),
+        }
+
+    def row(self, i: int) -> SotaRow:
+        columns = self.columns
+        string = self.string
+        metrics = columns["row_metrics"]
+        return SotaRow(
+            model_name=string(columns["row_model_name"][i]),
+            paper_title=string(columns["row_paper_title"][i]),
+            paper_url=string(columns["row_paper_url"][i]),
+            paper_date=days_to_date(columns["row_paper_date"][i]),
+            code_links=self.links("code", i),
+            model_links=self.links("model", i),
+            metrics=dict(
+                self.metric(j)
+                for j in range(int(metrics[i]), int(metrics[i + 1]))
+            ),
+            uses_additional_data=bool(columns["row_uses_additional_data"][i]),
+            **self.ranks(i),
+        )
+
+
+class SnapshotRows(MutableSequence):
+    """Rows of a dataset loaded from a memory-mapped snapshot.
+
+    Rows are built from the snapshot columns on first access and cached, so
+    in-place edits are kept. Inserting or removing rows materializes the
+    whole list.
+    """
+
+    def __init__(self, builder: _RowBuilder, start: int, end: int):
+        self._builder = builder
+        self._start = start
+        self._end = end
+        self._cache: Dict[int, SotaRow] = {}
+        self._rows: Optional[List[SotaRow]] = None
+
+    def _row(self, index: int) -> SotaRow:
+        try:
+            return self._cache[index]
+        except KeyError:
+            row = self._cache[index] = self._builder.row(self._start + index)
+            return row
+
+    def _materialize(self) -> List[SotaRow]:
+        if self._rows is None:
+            self._rows = [self._row(i) for i in range(self._end - self._start)]
+            self._cache = {}
+        return self._rows
+
+    def __len__(self) -> int:
+        if self._rows is not None:
+            return len(self._rows)
+        return self._end - self._start
+
+    def __getitem__(self, index):
+        if self._rows is not None:
+            return self._rows[index]
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("list index out of range")
+        return self._row(index)
+
+    def __setitem__(self, index, value):
+        self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        del self._materialize()[index]
+
+    def insert(self, index: int, value: SotaRow):
+        self._materialize().insert(index, value)
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SnapshotRows({list(self)!r})"
+
+
+def _build_dataset(
+    node: Dict[str, Any], builder: _RowBuilder, lazy: bool
+) -> Dataset:
+    start, end = node["rows"]
+    if lazy:
+        rows = SnapshotRows(builder, start, end)
+    else:
+        rows = [builder.row(i) for i in range(start, end)]
+    dataset = Dataset(
+        name=node["name"],
+        is_subdataset=node["is_subdataset"],
+        description=node["description"],
+        sota=Sota(metrics=node["metrics"], rows=rows),
+        subdatasets=[
+            _build_dataset(d, builder, lazy) for d in node["subdatasets"]
+        ],
+        links=[Link(title=t, url=u) for t, u in node["links"]],
+        citations=[Link(title=t, url=u) for t, u in node["citations"]],
+    )
+    for subdataset in dataset.subdatasets:
+        subdataset.parent = dataset
+    return dataset
+
+
+def _build_task(node: Dict[str, Any], builder: _RowBuilder, lazy: bool):
+    source_link = node["source_link"]
+    task = Task(
+        name=node["name"],
+        description=node["description"],
+        categories=node["categories"],
+        datasets=[_build_dataset(d, builder, lazy) for d in node["datasets"]],
+        subtasks=[_build_task(t, builder, lazy) for t in node["subtasks"]],
+        synonyms=node["synonyms"],
+        source_link=(
+            None
+            if source_link is None
+            else Link(title=source_link[0], url=source_link[1])
+        ),
+    )
+    for subtask in task.subtasks:
+        subtask.parent = task
+    return task
+
+
+def load_snapshot(path: str, mmap: bool = False) -> List[Task]:
+    """Load tasks from a binary snapshot file.
+
+    Args:
+        path: Path to the snapshot file.
+        mmap: Memory-map the file instead of reading it. Rows are then built
+            lazily when accessed, and processes that map the same file share
+            one copy of it in the page cache.
+    """
+    reader = _Reader(path, mmap=mmap)
+    builder = _RowBuilder(reader, eager=not mmap)
+    return [
+        _build_task(node, builder, mmap) for node in reader.header["tasks"]
+    ]
@@ -1,17 +1,95 @@
 import io
 import csv
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from sota_extractor.consts import Format
 from sota_extractor.errors import ArgumentError
-from sota_extractor.taskdb.v01.models import Task, Dataset
+from sota_extractor.taskdb.v01.hashing import row_key
+from sota_extractor.taskdb.v01.models import Dataset, Link, Task
 from sota_extractor.taskdb.v01.schemas import TaskSchema
 
+if TYPE_CHECKING:
+    from sota_extractor.taskdb.v01.diff import Patch
+
+
+@dataclass
+class MergeReport:
+    """Summary of a `TaskDB.merge` call.
+
+    Tasks and datasets are counted at every level of the tree, so a new task
+    with two subtasks adds three tasks.
+    """
+
+    tasks_added: int = 0
+    tasks_merged: int = 0
+    datasets_added: int = 0
+    datasets_merged: int = 0
+    rows_added: int = 0
+    rows_duplicate: int = 0
+
+    def __str__(self):
+        return (
+            f"tasks: {self.tasks_added} added, {self.tasks_merged} merged; "
+            f"datasets: {self.datasets_added} added, "
+            f"{self.datasets_merged} merged; "
+            f"rows: {self.rows_added} added, "
+            f"{self.rows_duplicate} duplicates skipped"
+        )
+
+
+@dataclass
+class SotaSummary:
+    """Cached SOTA aggregates of a task or a dataset.
+
+    For a task `rows` and `datasets` count the rows and datasets of its own
+    datasets and their subdatasets, while `subtree_rows` and
+    `subtree_datasets` include all subtasks as well.
+
+    For a dataset `rows` is the size of its own SOTA table, `datasets` counts
+    the dataset itself and all of its subdatasets, and `subtree_*` equal the
+    totals over the dataset and its subdatasets.
+    """
+
+    rows: int = 0
+    subtree_rows: int = 0
+    datasets: int = 0
+    subtree_datasets: int = 0
+    datasets_with_sota: int = 0
+
+    @property
+    def has_sota(self) -> bool:
+        """True if the node itself has SOTA rows."""
+        return self.rows > 0
+
+    @property
+    def subtree_has_sota(self) -> bool:
+        """True if the node or any of its descendants has SOTA rows."""
+        return self.subtree_rows > 0
+
 
 class TaskDB:
     def __init__(self):
         self.tasks: Dict[str, Task] = {}
         self.schema = TaskSchema()
+        # Bumped by every change made through the TaskDB, see `invalidate`.
+        self._version = 0
+        # (version, summaries by node id, tasks with sota, datasets with sota)
+        self._summary: Optional[
+            Tuple[int, Dict[int, SotaSummary], List[Task], List[Dataset]]
+        ] = None
 
     def get_task(self, name: str) -> Optional[Task]:
         """Get a task or a sub-task by name."""
@@ -27,6 +105,7 @@ class TaskDB:
     def add_task(self, task: Task):
         """Add a top-level task by name."""
         self.tasks[task.name] = task
+        self.invalidate()
 
     def load_tasks(self, files: List[str] = None, data: List[Dict] = None):
         """Load tasks from files or from data.
@@ -47,12 +126,95 @@ class TaskDB:
         if files is not None:
             data = []
             for file in files:
-                data.extend(load(file))
+                fmt = Format.json_gz if file.endswith(".gz") else Format.json
+                data.extend(load(file, fmt=fmt))
 
         task_list = self.schema.load(data, many=True)
         for task in task_list:
             self.add_task(task)
 
+    def merge(self, other: "TaskDB") -> MergeReport:
+        """Merge another TaskDB into this one.
+
+        Unlike `add_task`, which replaces a task with the same name, tasks,
+        subtasks, datasets and subdatasets are matched by name at every level
+        of the tree and merged recursively:
+
+        - missing tasks and datasets are moved over from `other`,
+        - descriptions and source links are taken from `other` only if they
+          are empty here,
+        - categories, synonyms, metrics, links and citations are unioned,
+          keeping their order,
+        - SOTA rows are unioned, skipping rows from `other` with the same
+          model name, normalized paper url and metric values as a row that is
+          already in the table (see `hashing.row_key`).
+
+        Objects from `other` are reused, not copied, so `other` should not be
+        used after the merge.
+
+        Returns:
+            MergeReport: Counts of added and merged objects.
+        """
+        report = MergeReport()
+        for task in other.tasks.values():
+            existing = self.tasks.get(task.name)
+            if existing is None:
+                task.parent = None
+                self.add_task(task)
+                _count_added_task(task, report)
+            else:
+                _merge_task(existing, task, report)
+        self.invalidate()
+        return report
+
+    def save_snapshot(self, path: str):
+        """Save the TaskDB into a binary snapshot file.
+
+        Snapshots load much faster than JSON files, see `load_snapshot`.
+        """
+        from sota_extractor.taskdb.v01.snapshot import save_snapshot
+
+        save_snapshot(list(self.tasks.values()), path)
+
+    def load_snapshot(self, path: str, mmap: bool = False):
+        """Load tasks from a binary snapshot file.
+
+        Args:
+            path: Path to a snapshot written by `save_snapshot`.
+            mmap: Memory-map the snapshot and build SOTA rows lazily, on
+                first access. Several processes mapping the same file share
+                one copy of it.
+        """
+        from sota_extractor.taskdb.v01.snapshot import load_snapshot
+
+        for task in load_snapshot(path, mmap=mmap):
+            self.add_task(task)
+
+    def diff(self, other: "TaskDB") -> "Patch":
+        """Compute the patch that turns this TaskDB into `other`.
+
+        Tasks, subtasks, datasets and subdatasets are matched by name, SOTA
+        rows by content hash. The patch is JSON serializable
+        (`Patch.to_dict`), so it can be shipped instead of a full export and
+        applied with `apply`.
+        """
+        from sota_extractor.taskdb.v01.diff import diff_tasks
+
+        return diff_tasks(
+            list(self.tasks.values()), list(other.tasks.values())
+        )
+
+    def apply(self, patch: "Patch"):
+        """Apply a patch computed by `diff` in place.
+
+        Raises:
+            DataError: If the patch doesn't match the content of the TaskDB.
+        """
+        from sota_extractor.taskdb.v01.diff import apply_patch
+
+        apply_patch(self.tasks, patch)
+        self.invalidate()
+
     def load_synonyms(self, csv_files: List[str]):
         """Load task synonyms from input files."""
         if isinstance(csv_files, str):
@@ -65,31 +227,99 @@ class TaskDB:
                     if task is not None:
                         task.synonyms.append(row[1])
 
+    def invalidate(self):
+        """Drop the cached SOTA summaries.
+
+        The summaries are computed on the first query and cached until the
+        TaskDB changes. `add_task`, `load_tasks`, `load_snapshot`, `merge`
+        and `apply` call this automatically. Changes made directly to tasks,
+        datasets or rows are not tracked: call `invalidate` after them,
+        otherwise queries return the summaries of the old tree.
+        """
+        self._version += 1
+        self._summary = None
+
+    def _summaries(
+        self,
+    ) -> Tuple[Dict[int, SotaSummary], List[Task], List[Dataset]]:
+        if self._summary is None or self._summary[0] != self._version:
+            nodes = _preorder(self.tasks.values())
+            self._summary = (self._version, *_compute_summaries(nodes))
+        return self._summary[1:]
+
+    def summary(self, node: Union[Task, Dataset]) -> SotaSummary:
+        """Get the cached SOTA summary of a task or a dataset."""
+        try:
+            return self._summaries()[0][id(node)]
+        except KeyError:
+            raise ArgumentError(f"{node.name} is not part of the TaskDB.")
+
     def tasks_with_sota(self) -> List[Task]:
         """Extract all tasks with SOTA tables.
 
         This includes both the top-level and sub-tasks.
         """
-        sota_tasks = []
-        for task in self.tasks.values():
-            find_sota_tasks(task, sota_tasks)
-        return sota_tasks
+        return list(self._summaries()[1])
 
     def datasets_with_sota(self) -> List[Dataset]:
         """Extract all datasets with SOTA tables.
 
         This includes both the top-level and sub-tasks.
         """
-        sota_datasets = []
+        return list(self._summaries()[2])
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """Iterate over all tasks and sub-tasks, parents before children."""
+        stack = list(reversed(list(self.tasks.values())))
+        while stack:
+            task = stack.pop()
+            yield task
+            stack.extend(reversed(task.subtasks))
+
+    def iter_datasets(self) -> Iterator[Dataset]:
+        """Iterate over all datasets and sub-datasets of all tasks."""
+        for task in self.iter_tasks():
+            stack = list(reversed(task.datasets))
+            while stack:
+                dataset = stack.pop()
+                yield dataset
+                stack.extend(reversed(dataset.subdatasets))
+
+    def compute_ranks(self, is_loss=None):
+        """Rank every leaderboard in the TaskDB.
+
+        Ranks all datasets and sub-datasets in one vectorized pass and stores
+        `ranks`, `best_rank` and `best_metric` on the columnar table of each
+        dataset (`dataset.sota.to_columnar()`) and on every `SotaRow`, so they
+        are exported, saved in snapshots and restored on load without ranking
+        again. Rows added or changed later keep their old ranks until the
+        next call.
 
-        for task in self.tasks.values():
-            find_sota_datasets(task, sota_datasets)
-        return sota_datasets
+        Args:
+            is_loss: Optional function or dictionary that tells if lower values
+                are better for a metric name. By default it's guessed from the
+                metric name.
+        """
+        from sota_extractor.taskdb.v01.ranking import rank_leaderboards
+
+        datasets = list(self.iter_datasets())
+        tables = [dataset.sota.to_columnar() for dataset in datasets]
+        rank_leaderboards(tables, is_loss=is_loss)
+        for dataset, table in zip(datasets, tables):
+            for row, view in zip(dataset.sota.rows, table):
+                row.ranks = view.ranks
+                row.best_rank = view.best_rank
+                row.best_metric = view.best_metric
 
     def export(self) -> List[Dict[str, Any]]:
         """Export the whole of TaskDB into a list of tasks in Dict format."""
         return self.schema.dump(self.tasks.values(), many=True)
 
+    def iter_export(self) -> Iterator[Dict[str, Any]]:
+        """Export the TaskDB one task at a time, in Dict format."""
+        for task in self.tasks.values():
+            yield self.schema.dump(task)
+
     def export_to_file(self, filename: str, fmt=Format.json):
         """Export the whole of TaskDB into a file."""
         from sota_extractor.serialization import dump
@@ -97,45 +327,174 @@ class TaskDB:
         dump(self, output=filename, fmt=fmt)
 
 
-def find_sota_tasks(task: Task, out: List):
-    """Get all the tasks with a SOTA table.
-
-    These tasks will be added into the "out" output list.
-    """
-    # check if the dataset has sota tables
-    add = False
-    for d in task.datasets:
-        if d.sota.rows:
-            add = True
-
-        for sd in d.subdatasets:
-            if sd.sota.rows:
-                add = True
-    if add:
-        out.append(task)
+def _preorder(tasks: Iterable[Task]) -> List[Union[Task, Dataset]]:
+    """List all tasks and datasets, parents before children."""
+    nodes = []
+    stack = list(reversed(list(tasks)))
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        if isinstance(node, Task):
+            stack.extend(reversed(node.subtasks))
+            stack.extend(reversed(node.datasets))
+        else:
+            stack.extend(reversed(node.subdatasets))
+    return nodes
 
-    for subtask in task.subtasks:
-        find_sota_tasks(subtask, out)
 
+def _compute_summaries(
+    nodes: List[Union[Task, Dataset]],
+) -> Tuple[Dict[int, SotaSummary], List[Task], List[Dataset]]:
+    """Compute the SOTA summaries of all nodes in one bottom-up pass.
 
-def find_sota_datasets(task: Task, out: List):
-    """Get all the datasets with a SOTA table.
+    Args:
+        nodes: All tasks and datasets in pre-order, see `_preorder`.
 
-    These datasets will be added into the "out" output list.
+    Returns:
+        The summaries keyed by node id, and the tasks and datasets with SOTA
+        tables in pre-order.
     """
-
-    # check if the dataset has sota tables
-    add = False
-    for d in task.datasets:
-        if d.sota.rows:
-            add = True
-
-        for sd in d.subdatasets:
-            if sd.sota.rows:
-                add = True
-
-        if add:
-            out.append(d)
-
-    for subtask in task.subtasks:
-        find_sota_datasets(subtask, out)
+    # Children are summarized before their parents in reverse pre-order.
+    summaries: Dict[int, SotaSummary] = {}
+    for node in reversed(nodes):
+        if isinstance(node, Task):
+            summary = SotaSummary()
+            for dataset in node.datasets:
+                child = summaries[id(dataset)]
+                summary.rows += child.subtree_rows
+                summary.datasets += child.datasets
+                summary.datasets_with_sota += child.datasets_with_sota
+            summary.subtree_rows = summary.rows
+            summary.subtree_datasets = summary.datasets
+            for subtask in node.subtasks:
+                child = summaries[id(subtask)]
+                summary.subtree_rows += child.subtree_rows
+                summary.subtree_datasets += child.subtree_datasets
+        else:
+            rows = len(node.sota.rows)
+            summary = SotaSummary(
+                rows=rows,
+                subtree_rows=rows,
+                datasets=1,
+                datasets_with_sota=int(rows > 0),
+            )
+            for subdataset in node.subdatasets:
+                child = summaries[id(subdataset)]
+                summary.subtree_rows += child.subtree_rows
+                summary.datasets += child.datasets
+                summary.datasets_with_sota += child.datasets_with_sota
+            summary.subtree_datasets = summary.datasets
+        summaries[id(node)] = summary
+
+    sota_tasks, sota_datasets = [], []
+    for node in nodes:
+        if isinstance(node, Task) and summaries[id(node)].has_sota:
+            sota_tasks.append(node)
+            sota_datasets.extend(
+                dataset
+                for dataset in node.datasets
+                if summaries[id(dataset)].subtree_has_sota
+            )
+    return summaries, sota_tasks, sota_datasets
+
+
+def _link_key(link: Link) -> Tuple[str, str]:
+    return link.title, link.url
+
+
+def _union(target: list, source: list, key: Callable[[Any], Hashable] = None):
+    """Append items of source missing from target, in order.
+
+    Items are compared by `key`, which defaults to the items themselves and
+    must be given for unhashable ones.
+    """
+    if key is None:
+        seen = set(target)
+    else:
+        seen = {key(item) for item in target}
+    for item in source:
+        item_key = item if key is None else key(item)
+        if item_key not in seen:
+            target.append(item)
+            seen.add(item_key)
+
+
+def _count_added_dataset(dataset: Dataset, report: MergeReport):
+    stack = [dataset]
+    while stack:
+        dataset = stack.pop()
+        report.datasets_added += 1
+        report.rows_added += len(dataset.sota.rows)
+        stack.extend(dataset.subdatasets)
+
+
+def _count_added_task(task: Task, report: MergeReport):
+    stack = [task]
+    while stack:
+        task = stack.pop()
+        report.tasks_added += 1
+        for dataset in task.datasets:
+            _count_added_dataset(dataset, report)
+        stack.extend(task.subtasks)
+
+
+def _merge_dataset(target: Dataset, source: Dataset, report: MergeReport):
+    report.datasets_merged += 1
+    if not target.description:
+        target.description = source.description
+    _union(target.links, source.links, key=_link_key)
+    _union(target.citations, source.citations, key=_link_key)
+
+    sota = target.sota
+    _union(sota.metrics, source.sota.metrics)
+    keys = {row_key(row) for row in sota.rows}
+    for row in source.sota.rows:
+        key = row_key(row)
+        if key in keys:
+            report.rows_duplicate += 1
+        else:
+            keys.add(key)
+            sota.rows.append(row)
+            report.rows_added += 1
+
+    index = {subdataset.name: subdataset for subdataset in target.subdatasets}
+    for subdataset in source.subdatasets:
+        existing = index.get(subdataset.name)
+        if existing is None:
+            subdataset.parent = target
+            target.subdatasets.append(subdataset)
+            index[subdataset.name] = subdataset
+            _count_added_dataset(subdataset, report)
+        else:
+            _merge_dataset(existing, subdataset, report)
+
+
+def _merge_task(target: Task, source: Task, report: MergeReport):
+    report.tasks_merged += 1
+    if not target.description:
+        target.description = source.description
+    if target.source_link is None:
+        target.source_link = source.source_link
+    _union(target.categories, source.categories)
+    _union(target.synonyms, source.synonyms)
+
+    index = {dataset.name: dataset for dataset in target.datasets}
+    for dataset in source.datasets:
+        existing = index.get(dataset.name)
+        if existing is None:
+            target.datasets.append(dataset)
+            index[dataset.name] = dataset
+            _count_added_dataset(dataset, report)
+        else:
+            _merge_dataset(existing, dataset, report)
+
+    index = {subtask.name: subtask for subtask in target.subtasks}
+    for subtask in source.subtasks:
+        existing = index.get(subtask.name)
+        if existing is None:
+            subtask.parent = target
+            target.subtasks.append(subtask)
+            index[subtask.name] = subtask
+            _count_added_task(subtask, report)
+        else:
+            _merge_task(existing, subtask, report)
@@ -0,0 +1,130 @@
+from datetime import date
+
+import numpy as np
+
+from sota_extractor.taskdb.v01 import Dataset, Sota, SotaRow, Task, TaskDB
+from sota_extractor.taskdb.v01.metrics import MetricFlag
+from sota_extractor.taskdb.v01.schemas import SotaSchema
+
+
+def make_sota():
+    return Sota(
+        metrics=["Accuracy", "Error"],
+        rows=[
+            SotaRow(
+                model_name="A",
+                paper_date=date(2019, 1, 2),
+                metrics={"Accuracy": "91.2", "Error": "8.8"},
+            ),
+            SotaRow(model_name="B", metrics={"Accuracy": "93.0"}),
+            SotaRow(
+                model_name="C",
+                metrics={"Accuracy": "92.5", "Error": "7.5"},
+                uses_additional_data=True,
+            ),
+        ],
+    )
+
+
+def test_columnar_roundtrip():
+    sota = make_sota()
+    columnar = sota.to_columnar()
+
+    assert len(columnar) == 3
+    assert SotaSchema().dump(columnar.to_sota()) == SotaSchema().dump(sota)
+    assert [row.model_name for row in columnar] == ["A", "B", "C"]
+    assert columnar[0].paper_date == date(2019, 1, 2)
+    assert columnar[1].metrics == {"Accuracy": "93.0"}
+
+
+def test_columnar_sort_filter_best():
+    columnar = make_sota().to_columnar()
+
+    ordered = columnar.sort("Accuracy")
+    assert list(ordered.model_name) == ["B", "C", "A"]
+    # Rows without a value are sorted last.
+    ordered = columnar.sort("Error", is_loss=True)
+    assert list(ordered.model_name) == ["C", "A", "B"]
+
+    filtered = columnar.filter(~columnar.uses_additional_data)
+    assert list(filtered.model_name) == ["A", "B"]
+
+    assert columnar.best_per_metric({"Error": True}) == {
+        "Accuracy": 1,
+        "Error": 2,
+    }
+
+
+def test_parsed_metric_values():
+    sota = Sota(
+        metrics=["Accuracy", "Params"],
+        rows=[
+            SotaRow(model_name="A", metrics={"Accuracy": "91.2%"}),
+            SotaRow(model_name="B", metrics={"Accuracy": "—"}),
+            SotaRow(model_name="C", metrics={"Params": "1.2M"}),
+        ],
+    )
+    columnar = sota.to_columnar()
+    assert sota.to_columnar() is columnar
+
+    accuracy = columnar.column("Accuracy")
+    assert accuracy[0] == 91.2 and np.isnan(accuracy[1:]).all()
+    assert columnar.column("Params")[2] == 1.2e6
+    assert list(columnar.flags[:, 0]) == [
+        MetricFlag.percent,
+        MetricFlag.missing,
+        MetricFlag.missing,
+    ]
+
+
+def test_compute_ranks():
+    tdb = TaskDB()
+    tdb.add_task(
+        Task(name="Task", datasets=[Dataset(name="D", sota=make_sota())])
+    )
+    tdb.compute_ranks()
+
+    columnar = tdb.tasks["Task"].datasets[0].sota.to_columnar()
+    # Accuracy: higher is better, Error: lower is better, B has no error.
+    assert columnar.ranks.tolist() == [[3, 2], [1, 0], [2, 1]]
+    assert [row.best_rank for row in columnar] == [2, 1, 1]
+    assert [row.best_metric for row in columnar] == [
+        "Error",
+        "Accuracy",
+        "Error",
+    ]
+    assert list(columnar.ranked("Error")) == [2, 0, 1]
+
+
+def test_ranks_are_persisted(tmp_path):
+    tdb = TaskDB()
+    tdb.add_task(
+        Task(name="Task", datasets=[Dataset(name="D", sota=make_sota())])
+    )
+    tdb.compute_ranks()
+    rows = tdb.tasks["Task"].datasets[0].sota.rows
+    assert rows[0].ranks == {"Accuracy": 3, "Error": 2}
+    assert (rows[1].best_rank, rows[1].best_metric) == (1, "Accuracy")
+
+    # JSON export
+    loaded = TaskDB()
+    loaded.load_tasks(data=tdb.export())
+    # Snapshot
+    path = str(tmp_path / "tasks.snapshot")
+    tdb.save_snapshot(path)
+    snapshot = TaskDB()
+    snapshot.load_snapshot(path, mmap=True)
+
+    for other in (loaded, snapshot):
+        sota = other.tasks["Task"].datasets[0].sota
+        assert list(sota.rows) == rows
+        # The columnar table is ranked without calling compute_ranks.
+        columnar = sota.to_columnar()
+        assert columnar.ranks.tolist() == [[3, 2], [1, 0], [2, 1]]
+        assert list(columnar.ranked("Error")) == [2, 0, 1]
+    assert loaded.export() == tdb.export()
+
+
+def test_unranked_export_unchanged():
+    row = SotaSchema().dump(make_sota())["rows"][0]
+    assert not {"ranks", "best_rank", "best_metric"} & set(row)
@@ -0,0 +1,45 @@
+from click.testing import CliRunner
+
+from sota_extractor import scrapers
+from sota_extractor.commands.cli import cli
+from sota_extractor.taskdb.v01 import Task, TaskDB
+
+
+def scraper(name):
+    def run():
+        tdb = TaskDB()
+        tdb.add_task(Task(name=name))
+        return tdb
+
+    return run
+
+
+def failing():
+    raise ValueError("Broken page.")
+
+
+def run_all(tmp_path, *sources):
+    return CliRunner().invoke(
+        cli,
+        ["all", "-d", str(tmp_path), "-o", str(tmp_path / "all.json")]
+        + [arg for source in sources for arg in ("-s", source)]
+        + ["--cache-dir", ""],
+    )
+
+
+def test_all_sources_exit_status(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        scrapers,
+        "get_scraper",
+        lambda name: failing if name == "reddit" else scraper(name),
+    )
+    result = run_all(tmp_path, "eff", "squad")
+    assert result.exit_code == 0, result.output
+
+    # The working sources are still merged.
+    result = run_all(tmp_path, "eff", "reddit", "squad")
+    assert result.exit_code == 1
+    assert "Failed: reddit" in result.output
+    tdb = TaskDB()
+    tdb.load_tasks(str(tmp_path / "all.json"))
+    assert list(tdb.tasks) == ["eff", "squad"]
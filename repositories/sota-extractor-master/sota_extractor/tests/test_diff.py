@@ -0,0 +1,77 @@
+import json
+
+from sota_extractor.taskdb.v01 import Dataset, SotaRow, Task, TaskDB
+from sota_extractor.taskdb.v01.diff import Patch
+
+
+def load():
+    tdb = TaskDB()
+    tdb.load_tasks("data/tasks/nlpprogress.json")
+    return tdb
+
+
+def test_diff_apply():
+    old, new = load(), load()
+    task = list(new.tasks.values())[0]
+    task.description = "Changed"
+    dataset = next(d for d in new.iter_datasets() if len(d.sota.rows) > 1)
+    dataset.sota.rows[0] = SotaRow(model_name="Changed")
+    dataset.sota.rows.reverse()
+    task.subtasks.append(
+        Task(name="New", parent=task, datasets=[Dataset(name="D")])
+    )
+    removed = TaskDB()
+    removed.add_task(new.tasks.pop(list(new.tasks)[-1]))
+    removed_rows = sum(len(d.sota.rows) for d in removed.iter_datasets())
+
+    patch = old.diff(new)
+    summary = patch.summary()
+    assert summary["tasks_added"] == 1 and summary["tasks_removed"] == 1
+    assert summary["rows_added"] == 1
+    assert summary["rows_removed"] == 1 + removed_rows
+
+    # The patch survives a JSON round trip.
+    patch = Patch.from_dict(json.loads(json.dumps(patch.to_dict())))
+    old.apply(patch)
+    assert old.export() == new.export()
+    assert len(old.diff(new)) == 0
+
+
+def tree(order):
+    """Tasks A and B with subtasks and datasets x and y in `order`."""
+    tdb = TaskDB()
+    for name in order(["A", "B"]):
+        task = Task(name=name)
+        task.subtasks = [Task(name=n, parent=task) for n in order(["x", "y"])]
+        task.datasets = [Dataset(name=n) for n in order(["x", "y"])]
+        for dataset in task.datasets:
+            dataset.subdatasets = [
+                Dataset(name=n, parent=dataset) for n in order(["x", "y"])
+            ]
+        tdb.add_task(task)
+    return tdb
+
+
+def test_diff_reordered_siblings():
+    old, new = tree(list), tree(lambda names: names[::-1])
+    patch = old.diff(new)
+    assert {op["op"] for op in patch.operations} == {
+        "order_tasks",
+        "order_datasets",
+    }
+    assert patch.summary() == Patch().summary()
+
+    old.apply(Patch.from_dict(json.loads(json.dumps(patch.to_dict()))))
+    assert old.export() == new.export()
+    assert len(old.diff(new)) == 0
+
+
+def test_diff_reordered_and_added_siblings():
+    old = tree(list)
+    new = tree(lambda names: names[::-1])
+    task = new.tasks["A"]
+    task.subtasks.insert(1, Task(name="z", parent=task))
+    del task.datasets[0]
+
+    old.apply(old.diff(new))
+    assert old.export() == new.export()
@@ -0,0 +1,75 @@
+import os
+import glob
+import importlib
+
+import pytest
+
+from sota_extractor.scrapers import session
+from sota_extractor.scrapers.nlp_progress.markdown import parse_file
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+CASSETTE = os.path.join(FIXTURES, "scrapers.json")
+
+# The package exports the scraper functions under the module names.
+ogb, reddit, squad = (
+    importlib.import_module(f"sota_extractor.scrapers.{name}")
+    for name in ("ogb", "reddit", "squad")
+)
+
+
+def row_counts(tdb):
+    return {d.name: len(d.sota.rows) for d in tdb.iter_datasets()}
+
+
+@pytest.fixture
+def cassette():
+    with session.use_cassette(CASSETTE) as c:
+        yield c
+
+
+def test_squad(cassette):
+    v1 = session.get(squad.SQUAD_1_1_JSON_URL).json()
+    v2 = session.get(squad.SQUAD_2_0_JSON_URL).json()
+    assert len(squad.get_sota_rows(v1)) == 4
+    # Rows without both scores are skipped.
+    assert len(squad.get_sota_rows(v2)) == 2
+
+    assert row_counts(squad.squad()) == {"SQuAD1.1": 4, "SQuAD2.0": 2}
+
+
+def test_ogb(cassette):
+    leaderboards = ogb.get_leaderboards(ogb.DATA[0]["url"])
+    assert sorted(leaderboards) == sorted(
+        name.lower() for name in ogb.DATA[0]["datasets"]
+    )
+
+    counts = row_counts(ogb.ogb())
+    assert counts == {
+        name: 2 if name in ("ogbn-products", "ogbl-collab") else 1
+        for item in ogb.DATA
+        for name in item["datasets"]
+    }
+
+
+def test_reddit(cassette):
+    md = session.get(reddit.REDITSOTA_URL).text
+    assert row_counts(reddit.parse_readme(md)) == {
+        "Switchboard Hub5'00": 1,
+        "Google Speech Commands": 1,
+        "MNIST": 1,
+        "CIFAR-10": 1,
+    }
+
+
+def test_nlp_progress():
+    (filename,) = glob.glob(
+        os.path.join(FIXTURES, "nlp_progress", "english", "*.md")
+    )
+    tdb = parse_file(filename)
+    assert list(tdb.tasks) == ["Sentiment Analysis"]
+    assert row_counts(tdb) == {
+        "IMDb": 3,
+        "SST": 0,
+        "Fine-grained classification": 2,
+        "Binary classification": 2,
+    }
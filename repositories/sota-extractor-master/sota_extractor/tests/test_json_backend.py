@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from sota_extractor import json_backend
+
+
+@pytest.mark.parametrize("name", list(json_backend.BACKENDS))
+def test_compat_output(name):
+    try:
+        backend = json_backend.get_backend(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    for obj in [
+        {"b": [], "a": {}, "c": "é   😀 \x7f \x1f", "d": [1, None]},
+        {"metrics": {"Accuracy": 91.2, "Params": 1e16, "Loss": 1e-5}},
+        {"value": float("nan")},
+        {"value": 2**70},
+        [0.1, -0.0, True, 12],
+    ]:
+        expected = json.dumps(obj, indent=2, sort_keys=True)
+        assert backend.dumps(obj, compat=True) == expected
+
+    document = '{"task": "Question Answering", "value": 91.2, "url": null}'
+    assert backend.loads(document) == json.loads(document)
@@ -1,7 +1,75 @@
+import os
+import gzip
+import json
+
+from sota_extractor import serialization
+from sota_extractor.consts import Format
 from sota_extractor.taskdb.v01 import taskdb
+from sota_extractor.taskdb.v01.schemas import SotaRowSchema
 
 
 def test_load_save():
     tdb = taskdb.TaskDB()
     tdb.load_tasks(["data/tasks/nlpprogress.json"])
     tdb.export_to_file("test.json")
+
+
+def test_streaming_dump(tmp_path):
+    tdb = taskdb.TaskDB()
+    tdb.load_tasks(["data/tasks/nlpprogress.json"])
+    expected = json.dumps(tdb.export(), indent=2, sort_keys=True)
+    assert serialization.dumps(tdb) == expected
+
+    output = str(tmp_path / "tasks.json.gz")
+    serialization.dump(tdb, output=output, fmt=Format.json_gz)
+    with gzip.open(output, "rb") as fp:
+        assert fp.read() == expected.encode("utf-8")
+
+    assert serialization.dumps(taskdb.TaskDB()) == "[]"
+
+
+def test_update(tmp_path):
+    tdb = taskdb.TaskDB()
+    tdb.load_tasks(["data/tasks/nlpprogress.json"])
+    added = taskdb.TaskDB().diff(tdb).summary()
+    assert added["rows_added"] == sum(
+        len(d.sota.rows) for d in tdb.iter_datasets()
+    )
+
+    for fmt, name in [(Format.json, "tasks.json"), (Format.json_gz, "t.gz")]:
+        output = str(tmp_path / name)
+        patch = serialization.update(tdb, output=output, fmt=fmt)
+        assert patch.summary() == added
+        assert serialization.load(output, fmt=fmt) == tdb.export()
+
+        mtime = os.stat(output).st_mtime_ns
+        assert serialization.update(tdb, output=output, fmt=fmt) is None
+        assert os.stat(output).st_mtime_ns == mtime
+
+        task = tdb.tasks.pop(next(iter(tdb.tasks)))
+        patch = serialization.update(tdb, output=output, fmt=fmt)
+        assert patch.summary()["tasks_removed"] > 0
+        assert patch.summary()["tasks_added"] == 0
+        tdb.add_task(task)
+
+    assert sorted(os.listdir(tmp_path)) == ["t.gz", "tasks.json"]
+
+
+def test_null_paper():
+    schema = SotaRowSchema()
+    data = {"model_name": "A", "paper_title": None, "paper_url": None}
+    row = schema.load(data)
+    assert (row.paper_title, row.paper_url) == (None, None)
+    dumped = schema.dump(row)
+    assert (dumped["paper_title"], dumped["paper_url"]) == (None, None)
+    # Missing values still default to empty strings.
+    assert schema.load({"model_name": "A"}).paper_url == ""
+
+    # eff.json has rows with null papers, they survive a round trip.
+    tdb = taskdb.TaskDB()
+    tdb.load_tasks(["data/tasks/eff.json"])
+    rows = [r for d in tdb.iter_datasets() for r in d.sota.rows]
+    assert any(row.paper_title is None for row in rows)
+    loaded = taskdb.TaskDB()
+    loaded.load_tasks(data=json.loads(serialization.dumps(tdb)))
+    assert loaded.export() == tdb.export()
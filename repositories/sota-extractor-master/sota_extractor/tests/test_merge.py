@@ -0,0 +1,181 @@
+from sota_extractor.taskdb.v01 import (
+    Dataset,
+    Link,
+    Sota,
+    SotaRow,
+    Task,
+    TaskDB,
+)
+from sota_extractor.taskdb.v01 import taskdb
+from sota_extractor.taskdb.v01.hashing import normalize_url
+
+
+def make_tdb(rows, subtask=None, metrics=("Accuracy",)):
+    tdb = TaskDB()
+    task = Task(
+        name="Task",
+        datasets=[Dataset(name="D", sota=Sota(list(metrics), rows))],
+    )
+    if subtask is not None:
+        subtask.parent = task
+        task.subtasks.append(subtask)
+    tdb.add_task(task)
+    return tdb
+
+
+def test_normalize_url():
+    assert (
+        normalize_url("http://www.arxiv.org/pdf/1810.04805v2.pdf")
+        == "https://arxiv.org/abs/1810.04805"
+    )
+    assert (
+        normalize_url(" https://Example.com/paper/ ")
+        == "https://example.com/paper"
+    )
+    assert normalize_url(None) == ""
+
+
+def test_merge():
+    first = make_tdb(
+        [
+            SotaRow(
+                model_name="A",
+                paper_url="https://arxiv.org/abs/1810.04805",
+                metrics={"Accuracy": "91.2"},
+            )
+        ]
+    )
+    second = make_tdb(
+        [
+            SotaRow(
+                model_name="A",
+                paper_url="http://arxiv.org/pdf/1810.04805v1",
+                metrics={"Accuracy": 91.2},
+            ),
+            SotaRow(model_name="B", metrics={"F1": "80.1"}),
+        ],
+        subtask=Task(name="Subtask", datasets=[Dataset(name="E")]),
+        metrics=("Accuracy", "F1"),
+    )
+
+    report = first.merge(second)
+    assert (report.tasks_added, report.tasks_merged) == (1, 1)
+    assert (report.datasets_added, report.datasets_merged) == (1, 1)
+    assert (report.rows_added, report.rows_duplicate) == (1, 1)
+
+    task = first.tasks["Task"]
+    assert [row.model_name for row in task.datasets[0].sota.rows] == [
+        "A",
+        "B",
+    ]
+    assert task.datasets[0].sota.metrics == ["Accuracy", "F1"]
+    assert task.subtasks[0].parent is task
+
+
+def test_merge_unions_lists():
+    first, second = make_tdb([]), make_tdb([], metrics=("F1", "Accuracy"))
+    for tdb, links, categories in (
+        (first, [Link("a", "1"), Link("b", "2")], ["NLP"]),
+        (
+            second,
+            [Link("b", "2"), Link("c", "3"), Link("c", "3")],
+            ["CV", "NLP"],
+        ),
+    ):
+        task = tdb.tasks["Task"]
+        task.categories = categories
+        task.datasets[0].links = links
+    first.merge(second)
+
+    task = first.tasks["Task"]
+    assert task.categories == ["NLP", "CV"]
+    assert task.datasets[0].sota.metrics == ["Accuracy", "F1"]
+    assert task.datasets[0].links == [
+        Link("a", "1"),
+        Link("b", "2"),
+        Link("c", "3"),
+    ]
+
+
+def test_sota_summary():
+    tdb = make_tdb(
+        [SotaRow(model_name="A", metrics={"Accuracy": "91.2"})],
+        subtask=Task(name="Subtask", datasets=[Dataset(name="E")]),
+    )
+    task = tdb.tasks["Task"]
+    assert tdb.tasks_with_sota() == [task]
+    assert tdb.datasets_with_sota() == [task.datasets[0]]
+    summary = tdb.summary(task)
+    assert (summary.rows, summary.datasets, summary.subtree_datasets) == (
+        1,
+        1,
+        2,
+    )
+    assert not tdb.summary(task.subtasks[0]).subtree_has_sota
+
+    # Merging invalidates the cached summaries.
+    other = make_tdb(
+        [],
+        subtask=Task(
+            name="Subtask",
+            datasets=[
+                Dataset(
+                    name="E",
+                    sota=Sota(rows=[SotaRow(model_name="B")]),
+                )
+            ],
+        ),
+    )
+    tdb.merge(other)
+    assert tdb.tasks_with_sota() == [task, task.subtasks[0]]
+    assert tdb.summary(task).subtree_rows == 2
+
+
+def test_sota_summary_in_place_changes():
+    tdb = make_tdb([])
+    task = tdb.tasks["Task"]
+    dataset = task.datasets[0]
+    assert tdb.datasets_with_sota() == []
+
+    # Direct changes are not tracked until the cache is invalidated.
+    dataset.sota.rows.append(SotaRow(model_name="A"))
+    assert tdb.datasets_with_sota() == []
+    tdb.invalidate()
+    assert tdb.datasets_with_sota() == [dataset]
+    assert tdb.summary(task).rows == 1
+
+    other = Dataset(name="E", sota=Sota(rows=[SotaRow(model_name="B")]))
+    task.datasets.append(other)
+    dataset.subdatasets.append(
+        Dataset(name="F", sota=Sota(rows=[SotaRow(model_name="C")]))
+    )
+    tdb.invalidate()
+    assert tdb.datasets_with_sota() == [dataset, other]
+    assert tdb.summary(task).rows == 3
+    assert tdb.summary(dataset).datasets == 2
+
+    task.datasets = [Dataset(name="G")]
+    tdb.invalidate()
+    assert tdb.tasks_with_sota() == []
+    assert tdb.summary(task.datasets[0]).rows == 0
+
+
+def test_sota_summary_is_cached(monkeypatch):
+    tdb = make_tdb([SotaRow(model_name="A")])
+    calls = []
+    preorder = taskdb._preorder
+    monkeypatch.setattr(
+        taskdb, "_preorder", lambda tasks: calls.append(1) or preorder(tasks)
+    )
+
+    task = tdb.tasks["Task"]
+    for _ in range(3):
+        assert tdb.tasks_with_sota() == [task]
+        assert tdb.datasets_with_sota() == task.datasets
+        assert tdb.summary(task).rows == 1
+    # The tree is walked once for all the queries.
+    assert len(calls) == 1
+
+    tdb.add_task(Task(name="Other"))
+    assert tdb.tasks_with_sota() == [task]
+    assert len(calls) == 2
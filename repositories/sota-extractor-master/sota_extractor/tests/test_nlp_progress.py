@@ -0,0 +1,78 @@
+import os
+import subprocess
+
+from sota_extractor.scrapers.nlp_progress import main, markdown
+
+MARKDOWN = """# {task}
+
+Description of the task.
+
+### {dataset}
+
+| Model | Accuracy | Paper / Source |
+| ----- | -------- | -------------- |
+| BERT | 90.1 | [Paper](https://arxiv.org/abs/1) |
+"""
+
+
+def git(*args, cwd):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@test", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+def write(repo, name, task, dataset):
+    with open(os.path.join(repo, "english", name), "w") as fp:
+        fp.write(MARKDOWN.format(task=task, dataset=dataset))
+    git("add", "-A", cwd=repo)
+    git("commit", "-m", name, cwd=repo)
+
+
+def test_incremental(tmp_path, monkeypatch):
+    remote = str(tmp_path / "remote")
+    os.makedirs(os.path.join(remote, "english"))
+    git("init", cwd=remote)
+    write(remote, "a.md", "Parsing", "Treebank")
+    write(remote, "b.md", "Tagging", "Brown")
+    monkeypatch.setattr(main, "NLP_PROGRESS_REPO", remote)
+
+    cache_dir = str(tmp_path / "cache")
+    tdb = main.nlp_progress(cache_dir=cache_dir)
+    assert list(tdb.tasks) == ["Parsing", "Tagging"]
+    (dataset,) = tdb.tasks["Parsing"].datasets
+    assert dataset.name == "Treebank"
+    assert dataset.sota.rows[0].metrics == {"Accuracy": "90.1"}
+
+    # Only the changed file is parsed again after the update.
+    parsed = []
+    export = markdown.export_file
+    monkeypatch.setattr(
+        markdown,
+        "export_file",
+        lambda f: parsed.append(os.path.basename(f)) or export(f),
+    )
+    write(remote, "b.md", "Tagging", "Penn")
+    tdb = main.nlp_progress(cache_dir=cache_dir)
+    assert parsed == ["b.md"]
+    assert tdb.tasks["Parsing"].datasets[0].name == "Treebank"
+    assert tdb.tasks["Tagging"].datasets[0].name == "Penn"
+
+
+def test_parse_files(tmp_path):
+    filenames = []
+    for name, task in [("a.md", "Parsing"), ("b.md", "Tagging")]:
+        filenames.append(str(tmp_path / name))
+        with open(filenames[-1], "w") as fp:
+            fp.write(MARKDOWN.format(task=task, dataset="Treebank"))
+
+    # The parser is reused, tasks of one file do not leak into the next.
+    assert list(markdown.parse_file(filenames[0]).tasks) == ["Parsing"]
+    assert list(markdown.parse_file(filenames[1]).tasks) == ["Tagging"]
+
+    serial = markdown.parse_files(filenames, jobs=1)
+    parallel = markdown.parse_files(filenames, jobs=2)
+    assert list(parallel.tasks) == ["Parsing", "Tagging"]
+    assert parallel.export() == serial.export()
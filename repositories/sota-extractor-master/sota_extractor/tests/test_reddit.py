@@ -0,0 +1,44 @@
+from sota_extractor.scrapers.reddit import parse_readme
+
+README = """
+### Computer Vision
+
+#### 1. Classification
+
+<table>
+  <tr><th>Paper</th><th>Datasets</th><th>Metrics</th><th>Code</th></tr>
+  <tr>
+    <td><a href="https://arxiv.org/abs/1">Paper A</a></td>
+    <td><ul><li>MNIST</li><li>CIFAR-10</li></ul></td>
+    <td><ul><li>Error: 0.2</li><li>Accuracy: 97</li></ul></td>
+    <td><a href="https://github.com/a">Code</a></td>
+  </tr>
+  <tr>
+    <td>Paper B</td>
+    <td><ul><li>MNIST</li></ul></td>
+    <td>Accuracy: 99</td>
+    <td></td>
+  </tr>
+</table>
+
+<table><tr><td>Tables without a new heading are skipped.</td></tr></table>
+"""
+
+
+def test_parse_readme():
+    tdb = parse_readme(README)
+    task = tdb.tasks["Classification"]
+    assert task.categories == ["Computer Vision"]
+
+    mnist, cifar = task.datasets
+    assert (mnist.name, cifar.name) == ("MNIST", "CIFAR-10")
+    # Metrics are listed in the order they first appear.
+    assert mnist.sota.metrics == ["Error", "Accuracy"]
+    assert [row.metrics for row in mnist.sota.rows] == [
+        {"Error": "0.2"},
+        {"Accuracy": "99"},
+    ]
+    assert mnist.sota.rows[0].paper_url == "https://arxiv.org/abs/1"
+    assert mnist.sota.rows[1].paper_url is None
+    assert cifar.sota.metrics == ["Accuracy"]
+    assert cifar.sota.rows[0].code_links[0].url == "https://github.com/a"
@@ -0,0 +1,95 @@
+import time
+
+from sota_extractor.scrapers import run_scrapers
+from sota_extractor.taskdb.v01 import Task, TaskDB
+
+
+def scraper(name, delay=0.0):
+    def run():
+        time.sleep(delay)
+        tdb = TaskDB()
+        tdb.add_task(Task(name=name))
+        return tdb
+
+    return run
+
+
+def failing():
+    raise ValueError("Broken page.")
+
+
+def test_run_scrapers():
+    start = time.monotonic()
+    results = list(
+        run_scrapers(
+            {
+                "slow": scraper("Slow", delay=0.3),
+                "fast": scraper("Fast"),
+                "broken": failing,
+                "hanging": scraper("Hanging", delay=5),
+            },
+            jobs=4,
+            timeout=0.6,
+        )
+    )
+    # Sources run concurrently and the hanging one is abandoned.
+    assert time.monotonic() - start < 2
+    results = {result.name: result for result in results}
+    assert list(results["fast"].tdb.tasks) == ["Fast"]
+    assert list(results["slow"].tdb.tasks) == ["Slow"]
+    assert isinstance(results["broken"].error, ValueError)
+    assert isinstance(results["hanging"].error, TimeoutError)
+    assert [r.ok for r in results.values()].count(True) == 2
+
+
+def test_run_scrapers_jobs():
+    results = list(
+        run_scrapers(
+            {name: scraper(name, delay=0.05) for name in "abcd"}, jobs=1
+        )
+    )
+    # With one job the scrapers run (and finish) in order.
+    assert [result.name for result in results] == list("abcd")
+
+
+def test_run_scrapers_timed_out_keeps_slot():
+    running, peak = [], []
+
+    def tracked(name, delay):
+        def run():
+            running.append(name)
+            peak.append(len(running))
+            time.sleep(delay)
+            running.remove(name)
+            return scraper(name)()
+
+        return run
+
+    results = list(
+        run_scrapers(
+            {
+                "hanging": tracked("hanging", 0.3),
+                "next": tracked("next", 0),
+            },
+            jobs=1,
+            timeout=0.2,
+        )
+    )
+    assert isinstance(results[0].error, TimeoutError)
+    # The next scraper waits for the timed out one to finish.
+    assert results[1].ok and results[1].name == "next"
+    assert max(peak) == 1
+
+
+def test_run_scrapers_no_free_slot():
+    start = time.monotonic()
+    results = list(
+        run_scrapers(
+            {"hanging": scraper("Hanging", delay=5), "next": scraper("Next")},
+            jobs=1,
+            timeout=0.2,
+        )
+    )
+    assert time.monotonic() - start < 1
+    assert [result.name for result in results] == ["hanging", "next"]
+    assert all(isinstance(r.error, TimeoutError) for r in results)
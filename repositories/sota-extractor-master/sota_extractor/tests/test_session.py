@@ -0,0 +1,168 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from click.testing import CliRunner
+
+from sota_extractor import scrapers
+from sota_extractor.commands.cli import cli
+from sota_extractor.errors import HttpClientError
+from sota_extractor.scrapers import session as shared
+from sota_extractor.scrapers import cache, get_scraper
+from sota_extractor.scrapers.cache import cached_scraper
+from sota_extractor.scrapers.session import Session
+from sota_extractor.taskdb.v01 import Task, TaskDB
+
+
+class Handler(BaseHTTPRequestHandler):
+    # Status codes returned by the next requests, then 200.
+    statuses = []
+    requests = 0
+    etag = None
+
+    def do_GET(self):
+        Handler.requests += 1
+        status = Handler.statuses.pop(0) if Handler.statuses else 200
+        etag = self.headers["If-None-Match"]
+        if status == 200 and etag and etag == Handler.etag:
+            status = 304
+        body = f'{{"status": {status}}}'.encode() if status != 304 else b""
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        if Handler.etag is not None:
+            self.send_header("ETag", Handler.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    Handler.requests = 0
+    Handler.etag = None
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_retries(url):
+    session = Session(retries=3, backoff=0)
+
+    Handler.statuses = [503, 429, 502]
+    response = session.get(url)
+    assert response.status_code == 200 and Handler.requests == 4
+
+    # The last response is returned when the retries run out.
+    Handler.statuses = [500] * 5
+    assert session.get(url).json() == {"status": 500}
+    assert Handler.requests == 8
+
+    # Client errors are not retried.
+    Handler.statuses = [404]
+    assert session.get(url).status_code == 404
+    assert Handler.requests == 9
+
+
+def test_http_cache(url, tmp_path):
+    session = Session(cache_dir=str(tmp_path))
+    Handler.etag = '"v1"'
+
+    response = session.get(url)
+    assert response.json() == {"status": 200}
+    assert not getattr(response, "from_cache", False)
+
+    # Not modified, the body comes from the cache.
+    response = session.get(url)
+    assert response.json() == {"status": 200} and response.from_cache
+
+    Handler.etag = '"v2"'
+    assert not getattr(session.get(url), "from_cache", False)
+    assert Handler.requests == 3
+
+
+def test_cached_scraper(url, tmp_path, monkeypatch):
+    monkeypatch.setattr(shared, "_session", Session(cache_dir=str(tmp_path)))
+    Handler.etag = '"v1"'
+    runs = []
+
+    def scraper():
+        runs.append(shared.get(url).json())
+        tdb = TaskDB()
+        tdb.add_task(Task(name=f"Task {len(runs)}"))
+        return tdb
+
+    cached = cached_scraper("test", scraper, str(tmp_path))
+    assert list(cached().tasks) == ["Task 1"]
+    # Nothing changed, the scraper does not run again.
+    assert list(cached().tasks) == ["Task 1"] and len(runs) == 1
+
+    Handler.etag = '"v2"'
+    assert list(cached().tasks) == ["Task 2"]
+
+
+def test_cached_command(url, tmp_path, monkeypatch):
+    monkeypatch.setattr(shared, "_session", Session())
+    runs = []
+
+    def squad():
+        runs.append(shared.get(url).json())
+        tdb = TaskDB()
+        tdb.add_task(Task(name="SQuAD"))
+        return tdb
+
+    monkeypatch.setattr(scrapers, "get_scraper", lambda name: squad)
+    Handler.etag = '"v1"'
+    output = str(tmp_path / "squad.json")
+    args = ["squad", "-o", output, "--cache-dir", str(tmp_path / "cache")]
+    for _ in range(2):
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code == 0, result.output
+    # The second run only revalidates the page and reuses the cached tasks.
+    assert len(runs) == 1 and Handler.requests == 2
+    assert "unchanged" in result.output
+
+
+def test_fragment_version(monkeypatch):
+    def names(source):
+        return {
+            filename.rsplit("sota_extractor", 1)[1].replace("\\", "/")
+            for filename in cache._source_files(get_scraper(source))
+        }
+
+    # Shared helpers are hashed next to the scraper module.
+    assert {"/scrapers/squad.py", "/scrapers/tables.py"} <= names("squad")
+    assert "/scrapers/utils.py" in names("reddit")
+    assert "/scrapers/nlp_progress/parsers.py" in names("nlp-progress")
+
+    squad = get_scraper("squad")
+    version = cache._version(squad)
+    assert cache._version(squad) == version
+    monkeypatch.setattr(cache, "PARSER_VERSION", cache.PARSER_VERSION + 1)
+    assert cache._version(squad) != version
+
+
+def test_cassette(url, tmp_path, monkeypatch):
+    monkeypatch.setattr(shared, "_session", Session())
+    path = str(tmp_path / "cassette.json")
+    Handler.statuses = [200, 404]
+
+    with shared.use_cassette(path, mode="record"):
+        assert shared.get(url).json() == {"status": 200}
+        assert shared.get(url).status_code == 404
+    assert Handler.requests == 2
+
+    # Responses are replayed in order without reaching the server.
+    with shared.use_cassette(path):
+        assert shared.get(url).json() == {"status": 200}
+        assert shared.get(url).status_code == 404
+        assert shared.get(url).status_code == 404
+        with pytest.raises(HttpClientError):
+            shared.get(url + "missing")
+    assert Handler.requests == 2
@@ -0,0 +1,28 @@
+import pytest
+
+from sota_extractor.errors import DataError
+from sota_extractor.taskdb.v01 import SotaRow, TaskDB
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_snapshot_roundtrip(tmp_path, mmap):
+    tdb = TaskDB()
+    tdb.load_tasks(["data/tasks/nlpprogress.json", "data/tasks/eff.json"])
+    path = str(tmp_path / "tasks.snapshot")
+    tdb.save_snapshot(path)
+
+    loaded = TaskDB()
+    loaded.load_snapshot(path, mmap=mmap)
+    assert loaded.export() == tdb.export()
+
+    # Rows of memory-mapped snapshots can be changed like lists.
+    dataset = loaded.datasets_with_sota()[0]
+    dataset.sota.rows.append(SotaRow(model_name="New"))
+    assert dataset.sota.rows[-1].model_name == "New"
+
+
+def test_snapshot_invalid_file(tmp_path):
+    path = tmp_path / "tasks.json"
+    path.write_text("[]")
+    with pytest.raises(DataError):
+        TaskDB().load_snapshot(str(path))
@@ -0,0 +1,72 @@
+import sys
+import json
+import importlib
+import subprocess
+
+from sota_extractor import scrapers
+from sota_extractor.commands.cli import COMMANDS, cli
+
+# Dependencies that must not be imported to list or describe commands.
+HEAVY = [
+    "bs4",
+    "lxml",
+    "markdown",
+    "marshmallow",
+    "nltk",
+    "numpy",
+    "pandas",
+    "pytz",
+    "requests",
+]
+
+SCRIPT = """
+import sys, json
+from sota_extractor.commands import cli
+for args in (["--help"], ["squad", "--help"]):
+    try:
+        cli.main(args)
+    except SystemExit:
+        pass
+heavy = set(sys.argv[1:])
+print(json.dumps(sorted(m for m in sys.modules if m.split(".")[0] in heavy)))
+"""
+
+
+def test_help_imports_no_heavy_modules():
+    cp = subprocess.run(
+        [sys.executable, "-c", SCRIPT, *HEAVY],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(cp.stdout.splitlines()[-1]) == []
+
+
+def test_registry():
+    for module in set(COMMANDS.values()):
+        importlib.import_module(module)
+    assert sorted(cli.commands) == sorted(COMMANDS)
+
+    for name in scrapers.SOURCES:
+        assert callable(scrapers.get_scraper(name))
+
+
+def test_scrapers_are_functions():
+    # Fresh interpreter: the submodules must be imported before the package
+    # attributes are first accessed.
+    script = """
+import importlib
+import sota_extractor.scrapers.squad
+from sota_extractor import scrapers
+scrapers.get_scraper("eff")
+importlib.import_module("sota_extractor.scrapers.ogb")
+from sota_extractor.scrapers import eff, ogb, squad
+print(all(callable(f) for f in (eff, ogb, squad, scrapers.reddit)))
+"""
+    cp = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert cp.stdout.split() == ["True"]
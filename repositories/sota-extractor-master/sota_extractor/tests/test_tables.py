@@ -0,0 +1,38 @@
+from lxml import html
+
+from sota_extractor.scrapers.tables import (
+    BODY_ROWS,
+    header_texts,
+    table_rows,
+    tables_by_class,
+)
+
+PAGE = """
+<table class="other"><tr><td>Skipped</td></tr></table>
+<table class="wide leaderboard">
+  <thead><tr><th>Model</th><th>Links</th></tr></thead>
+  <tbody>
+    <tr class="first">
+      <td class="column-1">BERT <b>large</b></td>
+      <td><a href="/paper">Paper</a> <a href="/code">Code</a></td>
+    </tr>
+    <tr><td class="column-1">GPT</td><td><a>Paper</a></td></tr>
+  </tbody>
+</table>
+"""
+
+
+def test_table_rows():
+    (table,) = tables_by_class("leaderboard")(html.fromstring(PAGE))
+    assert header_texts(table) == ["Model", "Links"]
+
+    rows = table_rows(table)
+    assert [row.header for row in rows] == [True, False, False]
+
+    first, second = table_rows(table, BODY_ROWS)
+    assert first.classes == ("first",)
+    assert first.by_class("column-1").text == "BERT large"
+    assert first.cells[1].link() == "/paper"
+    assert first.cells[1].link("Code") == "/code"
+    assert second.cells[1].link("Code") is None
+    assert second.cells[1].link("Paper") is None
@@ -4,6 +4,7 @@
 """
 
 import json
+from pwc_json import json_loads
 import gzip
 import os
 import sys
@@ -21,8 +22,8 @@ def analyze_data_files():
     # 1. 分析papers-with-abstracts.json.gz
     print("1. papers-with-abstracts.json.gz")
     try:
-        with gzip.open(os.path.join(data_dir, 'papers-with-abstracts.json.gz'), 'rt', encoding='utf-8') as f:
-            papers = json.load(f)
+        with gzip.open(os.path.join(data_dir, 'papers-with-abstracts.json.gz'), 'rb') as f:
+            papers = json_loads(f.read())
             print(f"   - 论文数量: {len(papers):,}")
             if papers:
                 first_paper = papers[0]
@@ -38,8 +39,8 @@ def analyze_data_files():
     # 2. 分析links-between-papers-and-code.json.gz
     print("\n2. links-between-papers-and-code.json.gz")
     try:
-        with gzip.open(os.path.join(data_dir, 'links-between-papers-and-code.json.gz'), 'rt', encoding='utf-8') as f:
-            links = json.load(f)
+        with gzip.open(os.path.join(data_dir, 'links-between-papers-and-code.json.gz'), 'rb') as f:
+            links = json_loads(f.read())
             print(f"   - 链接数量: {len(links):,}")
             if links:
                 first_link = links[0]
@@ -55,8 +56,8 @@ def analyze_data_files():
     # 3. 分析datasets.json.gz
     print("\n3. datasets.json.gz")
     try:
-        with gzip.open(os.path.join(data_dir, 'datasets.json.gz'), 'rt', encoding='utf-8') as f:
-            datasets = json.load(f)
+        with gzip.open(os.path.join(data_dir, 'datasets.json.gz'), 'rb') as f:
+            datasets = json_loads(f.read())
             print(f"   - 数据集数量: {len(datasets):,}")
             if datasets:
                 print(f"   - 数据字段: {list(datasets[0].keys())[:10]}...")
@@ -70,8 +71,8 @@ def analyze_data_files():
     # 4. 分析evaluation-tables.json.gz
     print("\n4. evaluation-tables.json.gz")
     try:
-        with gzip.open(os.path.join(data_dir, 'evaluation-tables.json.gz'), 'rt', encoding='utf-8') as f:
-            eval_tables = json.load(f)
+        with gzip.open(os.path.join(data_dir, 'evaluation-tables.json.gz'), 'rb') as f:
+            eval_tables = json_loads(f.read())
             print(f"   - 评估表数量: {len(eval_tables):,}")
             if eval_tables:
                 print(f"   - 数据字段: {list(eval_tables[0].keys())}")
@@ -85,8 +86,8 @@ def analyze_data_files():
     # 5. 分析methods.json.gz
     print("\n5. methods.json.gz")
     try:
-        with gzip.open(os.path.join(data_dir, 'methods.json.gz'), 'rt', encoding='utf-8') as f:
-            methods = json.load(f)
+        with gzip.open(os.path.join(data_dir, 'methods.json.gz'), 'rb') as f:
+            methods = json_loads(f.read())
             print(f"   - 方法数量: {len(methods):,}")
             if methods:
                 print(f"   - 数据字段: {list(methods[0].keys())}")
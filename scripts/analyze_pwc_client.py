@@ -3,7 +3,7 @@
 分析Papers with Code客户端结构和数据
 """
 
-import json
+from pwc_json import json_loads
 import os
 import sys
 
@@ -21,8 +21,8 @@ except ImportError as e:
 print("\n=== 分析评估表结构 ===")
 import gzip
 
-with gzip.open('evaluation-tables.json.gz', 'rt', encoding='utf-8') as f:
-    eval_tables = json.load(f)
+with gzip.open('evaluation-tables.json.gz', 'rb') as f:
+    eval_tables = json_loads(f.read())
     
 # 统计任务的层级关系
 task_hierarchy = {}
@@ -3,7 +3,7 @@
 分析SOTA（State of the Art）结果数据
 """
 
-import json
+from pwc_json import json_loads
 import gzip
 import pandas as pd
 from collections import defaultdict
@@ -12,8 +12,8 @@ def analyze_sota_structure():
     """分析评估表中的SOTA结果结构"""
     print("=== 分析SOTA结果数据结构 ===\n")
     
-    with gzip.open('../data/evaluation-tables.json.gz', 'rt', encoding='utf-8') as f:
-        eval_tables = json.load(f)
+    with gzip.open('../data/evaluation-tables.json.gz', 'rb') as f:
+        eval_tables = json_loads(f.read())
     
     # 找一个有完整SOTA数据的例子
     for table in eval_tables:
@@ -40,8 +40,8 @@ def extract_leaderboard_data():
     """提取可以用于绘制排行榜的数据"""
     print("\n\n=== 提取排行榜数据示例 ===\n")
     
-    with gzip.open('../data/evaluation-tables.json.gz', 'rt', encoding='utf-8') as f:
-        eval_tables = json.load(f)
+    with gzip.open('../data/evaluation-tables.json.gz', 'rb') as f:
+        eval_tables = json_loads(f.read())
     
     # 收集一些经典任务的SOTA历史
     classic_tasks = ['Image Classification', 'Object Detection', 'Machine Translation', 
@@ -96,8 +96,8 @@ def create_visualization_data():
     """创建可用于可视化的数据文件"""
     print("\n\n=== 创建可视化数据文件 ===\n")
     
-    with gzip.open('../data/evaluation-tables.json.gz', 'rt', encoding='utf-8') as f:
-        eval_tables = json.load(f)
+    with gzip.open('../data/evaluation-tables.json.gz', 'rb') as f:
+        eval_tables = json_loads(f.read())
     
     # 收集所有SOTA数据
     all_sota_records = []
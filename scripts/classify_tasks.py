@@ -1,4 +1,4 @@
-import json
+from pwc_json import json_loads
 import gzip
 import csv
 from collections import defaultdict
@@ -78,8 +78,8 @@ def classify_task(task_name):
 tasks_by_category = defaultdict(list)
 task_counts = defaultdict(int)
 
-with gzip.open('datasets.json.gz', 'rt', encoding='utf-8') as f:
-    data = json.load(f)
+with gzip.open('datasets.json.gz', 'rb') as f:
+    data = json_loads(f.read())
     
 for dataset in data:
     if 'tasks' in dataset:
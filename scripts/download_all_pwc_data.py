@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
 """
 下载Papers with Code的所有可用数据
+
+每个接口的数据逐页流式写入压缩的NDJSON文件（每行一个JSON对象），
+内存占用与数据量无关。分页在速率预算内并行获取，多个接口可同时下载：
+
+    python download_all_pwc_data.py --endpoints papers tasks --rate 4
 """
 
+import argparse
 import json
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import gzip
 
@@ -21,50 +29,97 @@ except ImportError as e:
     print(f"✗ 无法导入客户端: {e}")
     sys.exit(1)
 
-# 创建数据保存目录
-os.makedirs('../data/api_dumps', exist_ok=True)
+OUTPUT_DIR = '../data/api_dumps'
+
+# 接口名 -> (客户端分页方法, 显示名称, 文件名前缀)
+ENDPOINTS = {
+    'papers': ('paper_list', '论文', 'papers'),
+    'tasks': ('task_list', '任务', 'tasks'),
+    'datasets': ('dataset_list', '数据集', 'datasets_api'),
+    'methods': ('method_list', '方法', 'methods_api'),
+    'authors': ('author_list', '作者', 'authors'),
+    'conferences': ('conference_list', '会议', 'conferences'),
+    'repositories': ('repository_list', '代码仓库', 'repositories'),
+    'areas': ('area_list', '研究领域', 'areas'),
+    'evaluations': ('evaluation_list', '评估表', 'evaluations_api'),
+}
+
+class RateBudget:
+    """所有下载线程共享的请求速率预算：每秒最多 rate 个请求"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """等待下一个可用的时间槽"""
+        # 在锁内预约时间槽，在锁外等待，其他线程可以同时预约后面的时间槽
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def limit(self, func):
+        """返回每次调用前都等待速率预算的 func"""
+        def limited(*args, **kwargs):
+            self.wait()
+            return func(*args, **kwargs)
+        return limited
+
+def to_dict(item):
+    """将模型转换为可JSON序列化的字典"""
+    if hasattr(item, 'model_dump'):
+        return item.model_dump(mode='json')
+    return item.dict() if hasattr(item, 'dict') else item
 
 def save_data(data, filename):
     """保存数据到JSON文件"""
-    filepath = f'../data/api_dumps/{filename}'
+    filepath = os.path.join(OUTPUT_DIR, filename)
     with gzip.open(filepath, 'wt', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
     print(f"  ✓ 已保存: {filepath}")
     return filepath
 
-def download_with_pagination(func, name, **kwargs):
-    """处理分页下载"""
-    all_items = []
-    page = 1
-    items_per_page = 1000  # 每页最大项目数
-    
+def export_endpoint(client, endpoint, budget, timestamp, items_per_page=1000, prefetch=4):
+    """流式下载一个接口的所有分页，逐行写入NDJSON.gz文件
+
+    数据先写入 .part 临时文件，全部下载完成后才重命名；下载失败或中断时
+    删除临时文件，不会留下被截断的数据。返回写入的项目数，失败时返回 None。
+    """
+    method, name, prefix = ENDPOINTS[endpoint]
+    filepath = os.path.join(OUTPUT_DIR, f'{prefix}_{timestamp}.ndjson.gz')
+    partial = filepath + '.part'
+    count = 0
+
     print(f"\n正在下载 {name}...")
-    
     try:
-        while True:
-            print(f"  获取第 {page} 页...")
-            result = func(page=page, items_per_page=items_per_page, **kwargs)
-            
-            if hasattr(result, 'results'):
-                items = result.results
-                all_items.extend([item.dict() if hasattr(item, 'dict') else item for item in items])
-                
-                print(f"    获取了 {len(items)} 个项目，总计: {len(all_items)}")
-                
-                # 检查是否有下一页
-                if not result.next_page or len(items) < items_per_page:
-                    break
-                    
-                page += 1
-                time.sleep(0.5)  # 避免请求过快
-            else:
-                print(f"    意外的返回格式")
-                break
-                
-    except Exception as e:
-        print(f"  ✗ 下载失败: {e}")
-        
-    return all_items
+        with gzip.open(partial, 'wt', encoding='utf-8') as f:
+            # 后台预取 prefetch 个分页，每个分页请求前都等待速率预算
+            items = client.iter_pages(
+                budget.limit(getattr(client, method)),
+                items_per_page=items_per_page,
+                prefetch=prefetch,
+            )
+            for item in items:
+                f.write(json.dumps(to_dict(item), ensure_ascii=False, default=str))
+                f.write('\n')
+                count += 1
+                if count % items_per_page == 0:
+                    print(f"  [{name}] 已写入 {count} 个项目")
+    except BaseException as e:
+        if os.path.exists(partial):
+            os.remove(partial)
+        if not isinstance(e, Exception):
+            raise
+        print(f"  ✗ {name} 下载失败（已下载 {count} 个项目，未保存）: {e}")
+        return None
+
+    os.replace(partial, filepath)
+    print(f"  ✓ {name}: {count} 个项目，已保存: {filepath}")
+    return count
 
 def test_api_connection():
     """测试API连接"""
@@ -81,75 +136,30 @@ def test_api_connection():
         print("\n注意：API可能已经关闭。将分析本地已有数据。")
         return None
 
-def download_all_data(client):
-    """下载所有可用数据"""
+def download_all_data(client, endpoints, rate=2.0, items_per_page=1000, prefetch=4):
+    """并行下载所选接口的所有数据，返回各接口的项目数（失败为 None）"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # 1. 下载论文数据
-    print("\n=== 下载论文数据 ===")
-    papers = download_with_pagination(client.paper_list, "论文")
-    if papers:
-        save_data(papers, f'papers_{timestamp}.json.gz')
-    
-    # 2. 下载任务数据
-    print("\n=== 下载任务数据 ===")
-    tasks = download_with_pagination(client.task_list, "任务")
-    if tasks:
-        save_data(tasks, f'tasks_{timestamp}.json.gz')
-    
-    # 3. 下载数据集信息
-    print("\n=== 下载数据集信息 ===")
-    datasets = download_with_pagination(client.dataset_list, "数据集")
-    if datasets:
-        save_data(datasets, f'datasets_api_{timestamp}.json.gz')
-    
-    # 4. 下载方法/算法
-    print("\n=== 下载方法/算法 ===")
-    methods = download_with_pagination(client.method_list, "方法")
-    if methods:
-        save_data(methods, f'methods_api_{timestamp}.json.gz')
-    
-    # 5. 下载作者信息
-    print("\n=== 下载作者信息 ===")
-    authors = download_with_pagination(client.author_list, "作者")
-    if authors:
-        save_data(authors, f'authors_{timestamp}.json.gz')
-    
-    # 6. 下载会议信息
-    print("\n=== 下载会议信息 ===")
-    conferences = download_with_pagination(client.conference_list, "会议")
-    if conferences:
-        save_data(conferences, f'conferences_{timestamp}.json.gz')
-    
-    # 7. 下载代码仓库
-    print("\n=== 下载代码仓库信息 ===")
-    repositories = download_with_pagination(client.repository_list, "代码仓库")
-    if repositories:
-        save_data(repositories, f'repositories_{timestamp}.json.gz')
-    
-    # 8. 下载研究领域
-    print("\n=== 下载研究领域 ===")
-    areas = download_with_pagination(client.area_list, "研究领域")
-    if areas:
-        save_data(areas, f'areas_{timestamp}.json.gz')
-    
-    # 9. 下载评估表
-    print("\n=== 下载评估表 ===")
-    evaluations = download_with_pagination(client.evaluation_list, "评估表")
-    if evaluations:
-        save_data(evaluations, f'evaluations_api_{timestamp}.json.gz')
-    
+    budget = RateBudget(rate)
+
+    print(f"\n=== 下载 {len(endpoints)} 个接口的数据（每秒最多 {rate:g} 个请求）===")
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        counts = executor.map(
+            lambda endpoint: export_endpoint(
+                client, endpoint, budget, timestamp,
+                items_per_page=items_per_page, prefetch=prefetch,
+            ),
+            endpoints,
+        )
+        counts = dict(zip(endpoints, counts))
+
     # 统计信息
     print("\n=== 下载统计 ===")
-    print(f"论文数量: {len(papers)}")
-    print(f"任务数量: {len(tasks)}")
-    print(f"数据集数量: {len(datasets)}")
-    print(f"方法数量: {len(methods)}")
-    print(f"作者数量: {len(authors)}")
-    print(f"会议数量: {len(conferences)}")
-    print(f"代码仓库数量: {len(repositories)}")
-    print(f"研究领域数量: {len(areas)}")
-    print(f"评估表数量: {len(evaluations)}")
+    for endpoint, count in counts.items():
+        if count is None:
+            print(f"{ENDPOINTS[endpoint][1]}: 下载失败")
+        else:
+            print(f"{ENDPOINTS[endpoint][1]}数量: {count}")
+    return counts
 
 def download_detailed_data(client, sample_size=10):
     """下载部分详细数据作为示例"""
@@ -174,10 +184,10 @@ def download_detailed_data(client, sample_size=10):
                 evaluations = client.task_evaluation_list(task.id, page=1, items_per_page=10)
                 
                 detailed_task = {
-                    'task': task.dict(),
-                    'children': [child.dict() for child in children.results] if hasattr(children, 'results') else [],
-                    'papers': [paper.dict() for paper in papers.results] if hasattr(papers, 'results') else [],
-                    'evaluations': [eval.dict() for eval in evaluations.results] if hasattr(evaluations, 'results') else []
+                    'task': to_dict(task),
+                    'children': [to_dict(child) for child in children.results] if hasattr(children, 'results') else [],
+                    'papers': [to_dict(paper) for paper in papers.results] if hasattr(papers, 'results') else [],
+                    'evaluations': [to_dict(eval) for eval in evaluations.results] if hasattr(evaluations, 'results') else []
                 }
                 detailed_tasks.append(detailed_task)
                 
@@ -190,31 +200,62 @@ def download_detailed_data(client, sample_size=10):
     except Exception as e:
         print(f"✗ 获取详细数据失败: {e}")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="下载Papers with Code的所有可用数据")
+    parser.add_argument(
+        '--endpoints', nargs='+', choices=list(ENDPOINTS), default=list(ENDPOINTS),
+        help="要下载的接口，多个接口并行下载（默认全部）",
+    )
+    parser.add_argument('--rate', type=float, default=2.0, help="所有接口合计每秒最多请求数（默认 2）")
+    parser.add_argument('--items-per-page', type=int, default=1000, help="每页项目数（默认 1000）")
+    parser.add_argument('--prefetch', type=int, default=4, help="每个接口预取的分页数（默认 4）")
+    parser.add_argument('--skip-details', action='store_true', help="不下载详细数据示例")
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
     # 测试连接
     client = test_api_connection()
-    
+    failed = False
+
     if client:
         print("\n开始下载所有数据...")
         print("这可能需要一些时间，请耐心等待...")
         
         try:
             # 下载所有基础数据
-            download_all_data(client)
+            counts = download_all_data(
+                client, args.endpoints, rate=args.rate,
+                items_per_page=args.items_per_page, prefetch=args.prefetch,
+            )
+            failed = any(count is None for count in counts.values())
             
             # 下载一些详细数据示例
-            download_detailed_data(client)
+            if not args.skip_details:
+                download_detailed_data(client)
             
-            print("\n✓ 数据下载完成！")
-            print(f"所有数据已保存到: {os.path.abspath('../data/api_dumps/')}")
+            if failed:
+                print("\n✗ 部分接口下载失败，见上方统计")
+            else:
+                print("\n✓ 数据下载完成！")
+            print(f"数据已保存到: {os.path.abspath(OUTPUT_DIR)}")
             
         except KeyboardInterrupt:
             print("\n\n下载被用户中断")
+            failed = True
         except Exception as e:
             print(f"\n下载过程中出错: {e}")
+            failed = True
+        finally:
+            client.close()
     else:
         print("\n由于API不可用，将分析本地已有数据...")
         print("本地数据文件位于: ../data/")
 
+    if failed:
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,4 +1,4 @@
-import json
+from pwc_json import json_loads
 import gzip
 import csv
 from collections import defaultdict
@@ -90,8 +90,8 @@ task_details = defaultdict(lambda: {
 
 print("正在读取datasets.json.gz...")
 # 从datasets.json提取信息
-with gzip.open('datasets.json.gz', 'rt', encoding='utf-8') as f:
-    datasets = json.load(f)
+with gzip.open('datasets.json.gz', 'rb') as f:
+    datasets = json_loads(f.read())
     
 for dataset in datasets:
     if 'tasks' in dataset:
@@ -104,8 +104,8 @@ for dataset in datasets:
 
 print("正在读取evaluation-tables.json.gz...")
 # 从evaluation-tables.json提取更多信息
-with gzip.open('evaluation-tables.json.gz', 'rt', encoding='utf-8') as f:
-    eval_tables = json.load(f)
+with gzip.open('evaluation-tables.json.gz', 'rb') as f:
+    eval_tables = json_loads(f.read())
     
 for table in eval_tables:
     task_name = table.get('task', '')
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+脚本共用的JSON解码工具
+
+使用 sota_extractor.json_backend：安装了 orjson 或 msgspec 时自动使用，
+否则回退到标准库 json。可通过环境变量 SOTA_EXTRACTOR_JSON_BACKEND 指定。
+"""
+
+import json
+import os
+import sys
+
+# 添加 sota-extractor 路径
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    '..', 'repositories', 'sota-extractor-master',
+))
+
+try:
+    from sota_extractor.json_backend import loads as json_loads
+except ImportError:
+    json_loads = json.loads
@@ -0,0 +1,106 @@
+"""测试 download_all_pwc_data.py：使用模拟的 API 服务器，不访问网络
+
+    python -m pytest scripts/test_download_all_pwc_data.py
+"""
+
+import gzip
+import importlib.util
+import json
+import os
+import threading
+
+import httpx
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    'download_all_pwc_data',
+    os.path.join(os.path.dirname(__file__), 'download_all_pwc_data.py'),
+)
+download = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(download)
+
+# 脚本导入时已将客户端目录加入 sys.path
+from paperswithcode import PapersWithCodeClient  # noqa: E402
+from paperswithcode.tests.utils import SERVER_URL, Listing, paper  # noqa: E402
+
+ITEMS = {
+    '/papers/': [paper(i) for i in range(23)],
+    '/tasks/': [{'id': f'task-{i}', 'name': f'Task {i}', 'description': ''} for i in range(23)],
+    '/areas/': [{'id': f'area-{i}', 'name': f'Area {i}'} for i in range(3)],
+}
+
+
+def fail_tasks_page_3(listing, page):
+    """任务接口第 3 页返回服务器错误，其他接口正常"""
+    if listing.pages[-1] == ('/tasks/', 3):
+        return httpx.Response(500, json={'message': 'Server error.'})
+
+
+def run(tmp_path, monkeypatch, endpoints, on_page=None):
+    """在线程中下载，超时则判定为挂起"""
+    monkeypatch.setattr(download, 'OUTPUT_DIR', str(tmp_path))
+    listing = Listing({path: list(items) for path, items in ITEMS.items()}, on_page=on_page)
+    client = PapersWithCodeClient(url=SERVER_URL, transport=listing.transport, max_retries=0)
+    result = {}
+
+    def target():
+        with client:
+            result['counts'] = download.download_all_data(
+                client, endpoints, rate=0, items_per_page=5, prefetch=2,
+            )
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive(), '下载挂起'
+    return result['counts']
+
+
+def read(tmp_path, prefix):
+    (filename,) = [name for name in os.listdir(tmp_path) if name.startswith(prefix + '_')]
+    assert filename.endswith('.ndjson.gz')
+    with gzip.open(os.path.join(tmp_path, filename), 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_download_all(tmp_path, monkeypatch):
+    counts = run(tmp_path, monkeypatch, ['papers', 'tasks', 'areas'])
+    assert counts == {'papers': 23, 'tasks': 23, 'areas': 3}
+    assert [item['id'] for item in read(tmp_path, 'papers')] == [f'paper-{i}' for i in range(23)]
+    assert [item['id'] for item in read(tmp_path, 'tasks')] == [f'task-{i}' for i in range(23)]
+
+
+def test_partial_failure(tmp_path, monkeypatch):
+    counts = run(tmp_path, monkeypatch, ['papers', 'tasks', 'areas', 'authors'], fail_tasks_page_3)
+    # 任务在第 3 页失败，作者接口不存在（首页 404），其他接口不受影响
+    assert counts == {'papers': 23, 'tasks': None, 'areas': 3, 'authors': None}
+    assert len(read(tmp_path, 'papers')) == 23
+    assert len(read(tmp_path, 'areas')) == 3
+    # 失败的接口既没有结果文件，也没有残留的截断临时文件
+    assert sorted(name.split('_')[0] for name in os.listdir(tmp_path)) == ['areas', 'papers']
+
+
+def test_interrupted_download_is_removed(tmp_path, monkeypatch):
+    class Client:
+        def iter_pages(self, list_method, **kwargs):
+            yield paper(0)
+            raise KeyboardInterrupt
+
+        def paper_list(self, **kwargs):
+            pass
+
+    monkeypatch.setattr(download, 'OUTPUT_DIR', str(tmp_path))
+    with pytest.raises(KeyboardInterrupt):
+        download.export_endpoint(Client(), 'papers', download.RateBudget(0), 'now')
+    assert os.listdir(tmp_path) == []
+
+
+def test_exit_code(tmp_path, monkeypatch):
+    monkeypatch.setattr(download, 'OUTPUT_DIR', str(tmp_path))
+    monkeypatch.setattr('sys.argv', ['download_all_pwc_data.py', '--endpoints', 'papers', '--skip-details'])
+    monkeypatch.setattr(download, 'test_api_connection', lambda: client)
+    monkeypatch.setattr(download, 'download_all_data', lambda *args, **kwargs: {'papers': None})
+    client = PapersWithCodeClient(url=SERVER_URL, transport=Listing({}).transport)
+    with pytest.raises(SystemExit) as e:
+        download.main()
+    assert e.value.code == 1